@@ -7,9 +7,10 @@ import logging
 import discord
 from discord.ext import commands
 
-from cognitas.core.storage import load_state
-from cognitas.core import phases
-from cognitas.config import INTENTS_KWARGS
+from cognitas.core.storage import load_state, get_backend
+from cognitas.core import interactions, paginator, phases, sharding, throttle, voteboard
+from cognitas.core.logs import flush_logs
+from cognitas.config import INTENTS_KWARGS, CACHE_PROFILE, MAX_MESSAGES
 from dotenv import load_dotenv
 
 load_dotenv()  
@@ -37,6 +38,16 @@ def _make_intents() -> discord.Intents:
     intents.guilds = True
     return intents
 
+def _cache_kwargs() -> dict:
+    """commands.Bot kwargs for config.CACHE_PROFILE."""
+    if CACHE_PROFILE != "lean":
+        return {}
+    return {
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "chunk_guilds_at_startup": False,
+        "max_messages": MAX_MESSAGES,
+    }
+
 # List of cog modules to load
 COG_MODULES = [
     "cognitas.cogs.gamecog",
@@ -51,16 +62,49 @@ COG_MODULES = [
     "cognitas.cogs.timezonescog",
     "cognitas.cogs.statuscog",
     "cognitas.cogs.bootstrapcog",
-    "cognitas.cogs.memecog"
+    "cognitas.cogs.memecog",
+    "cognitas.cogs.debugcog",
+    "cognitas.cogs.statscog"
 ]
 
-class AsdruBot(commands.Bot):
+class AsdruTree(discord.app_commands.CommandTree):
+    """
+    Command tree that throttles hot slash commands (core/throttle.py) and
+    times the rest (core/interactions.py).
+    """
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.type is not discord.InteractionType.application_command:
+            return True  # autocomplete
+        if not await throttle.gate(interaction):
+            return False
+        interactions.begin(interaction)
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: discord.app_commands.AppCommandError) -> None:
+        interactions.end(interaction, failed=True)
+        await super().on_error(interaction, error)
+
+
+# One process per shard range, or a single process (config.SHARD_*)
+_BotBase = commands.Bot if sharding.mode() == "single" else commands.AutoShardedBot
+
+
+class AsdruBot(_BotBase):
     def __init__(self):
-        super().__init__(command_prefix="!", intents=_make_intents())
+        super().__init__(
+            command_prefix="!", intents=_make_intents(), tree_cls=AsdruTree,
+            **_cache_kwargs(), **sharding.bot_kwargs(),
+        )
         self._state_loaded = False
 
     async def setup_hook(self):
 
+        # 0) Own this process's state store; refuse to start if another process does
+        store = get_backend().path
+        sharding.acquire_lease(store)
+        log.info(f"[startup] Sharding: {sharding.mode()} ({sharding.scope_label() or 'all shards'}), state: {store}")
+
         # 1) Load persistent state
         try:
             load_state()  # sync
@@ -68,6 +112,8 @@ class AsdruBot(commands.Bot):
             log.info("[startup] State loaded.")
         except Exception:
             log.exception("[startup] Failed to load state")
+        voteboard.bind(self)
+        self.add_dynamic_items(paginator.PageButton)  # listing prev/next buttons
 
         # 2) Load cogs (all commands live there)
         for mod in COG_MODULES:
@@ -105,14 +151,28 @@ class AsdruBot(commands.Bot):
         try:
             if getattr(phases, "rehydrate_timers", None):
                 for guild in self.guilds:
+                    if not sharding.owns(guild.id):
+                        continue
                     try:
                         await phases.rehydrate_timers(self, guild)
                     except Exception as e:
                         log.warning(f"[rehydrate] Error for guild {getattr(guild,'id','?')}: {e}")
-                log.info("[rehydrate] Timers rehydration attempted for all guilds.")
+                log.info("[rehydrate] Timers rehydration attempted for all owned guilds.")
         except Exception:
             log.exception("[rehydrate] Unexpected failure")
 
+    async def on_app_command_completion(self, interaction: discord.Interaction, command) -> None:
+        interactions.end(interaction)
+
+    async def close(self):
+        # Drain buffered admin-log events before the loop goes away
+        try:
+            await flush_logs()
+        except Exception:
+            log.exception("[shutdown] Failed to flush log sink")
+        await super().close()
+        sharding.release_lease()
+
 def main():
     token = os.getenv("DISCORD_TOKEN")
     if not token:
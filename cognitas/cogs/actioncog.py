@@ -12,6 +12,9 @@ from ..core.state import game
 from ..core.storage import save_state
 from ..core.logs import log_event  
 from ..core import actions as act_core 
+from ..core import resolution as res_core
+from ..core import autocomplete, paginator, players as players_core
+from ..core.interactions import InteractionCtx
 from ..status import engine as SE
 
 log = logging.getLogger(__name__)
@@ -21,8 +24,7 @@ log = logging.getLogger(__name__)
 def _label_from_uid(uid: str | None) -> str:
     if not uid:
         return "—"
-    p = game.players.get(str(uid), {})
-    return p.get("name") or p.get("alias") or f"<@{uid}>"
+    return game.players.display_name(uid, default=f"<@{uid}>")
 
 def _fmt_action_line(a: dict) -> str:
     """
@@ -57,31 +59,8 @@ async def _gate_action(ctx, game, actor_uid, action_kind: str, target_uid=None,
     return {"ok": True, "msg": None, "ephemeral": False, "redirect_to": chk.get("redirect_to")}
 
 
-# ---------- Interaction Context Adapter ----------
-class InteractionCtx:
-    def __init__(self, interaction: discord.Interaction):
-        self._i = interaction
-        self.guild = interaction.guild
-        self.bot = interaction.client
-        self.channel = interaction.channel
-        self.author = interaction.user
-        self.message = None
-
-    async def reply(self, content: str = None, **kwargs):
-        try:
-            if self._i.response.is_done():
-                return await self._i.followup.send(content or "\u200b", **kwargs)
-            else:
-                return await self._i.response.send_message(content or "\u200b", **kwargs)
-        except Exception:
-            if self.channel:
-                try:
-                    return await self.channel.send(content or "\u200b", **kwargs)
-                except Exception:
-                    pass
-
-    async def send(self, content: str = None, **kwargs):
-        return await self.reply(content, **kwargs)
+async def _player_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    return autocomplete.choices("players", current)
 
 
 # =================================================================
@@ -94,18 +73,20 @@ class ActionsCog(commands.Cog):
     @app_commands.command(name="act", description="Registrar tu acción para la fase actual (Día o Noche).")
     @app_commands.describe(
         target="Jugador objetivo (opcional)",
+        target_name="...o su nombre/alias en la partida (opcional)",
         note="Nota de texto libre sobre tu acción (opcional)",
         public="Publicar confirmación visible para todos (default: false)",
     )
+    @app_commands.autocomplete(target_name=_player_autocomplete)
     async def act(
         self, 
         interaction: discord.Interaction, 
         target: discord.Member | None = None, 
         note: str = "", 
-        public: bool = False
+        public: bool = False,
+        target_name: str | None = None,
     ):
-        await interaction.response.defer(ephemeral=not public)
-        ctx = InteractionCtx(interaction)
+        ctx = InteractionCtx(interaction, ephemeral=not public)
 
         # Automatically resolve phase
         phase = (getattr(game, "phase", "day") or "day").lower()
@@ -127,7 +108,7 @@ class ActionsCog(commands.Cog):
             return await ctx.reply("❌ No estás registrado o no estás vivo.", ephemeral=not public)
 
         # Channel validation (Infra)
-        role_ch_id = (actor.get("role_channel_id") if isinstance(actor, dict) else None)
+        role_ch_id = actor.get("role_channel_id")
         if role_ch_id and interaction.channel and interaction.channel.id != role_ch_id:
             # Allow admins to test from anywhere, restrict users
             if not interaction.user.guild_permissions.administrator:
@@ -142,6 +123,10 @@ class ActionsCog(commands.Cog):
 
         # Target validation
         target_uid = str(target.id) if target else None
+        if target_uid is None and target_name:
+            target_uid = players_core.resolve_player_ref(target_name)
+            if not target_uid:
+                return await ctx.reply(f"❌ No encontré a ningún jugador llamado `{target_name}`.", ephemeral=not public)
         if target_uid:
             t = players.get(target_uid)
             if not t:
@@ -157,8 +142,9 @@ class ActionsCog(commands.Cog):
             # Gate msg is already localized by SE.get_block_message
             return await ctx.reply(f"⛔ {gate['msg']}", ephemeral=gate["ephemeral"])
 
+        redirected_from = None
         if gate.get("redirect_to"):
-            target_uid = gate["redirect_to"]
+            redirected_from, target_uid = target_uid, str(gate["redirect_to"])
             try:
                 await ctx.reply("🌀 Sufres de Confusión... tu acción ha sido redirigida.", ephemeral=True)
             except Exception:
@@ -183,6 +169,7 @@ class ActionsCog(commands.Cog):
                 "action": "act",
                 "note": clean_note,
                 "at": int(time.time()),
+                **({"redirected_from": redirected_from} if redirected_from else {}),
             },
             number=number,
         )
@@ -241,6 +228,42 @@ def _resolve_phase(phase: Optional[str]) -> str:
     return p if p in ("day", "night") else "night"
 
 
+# ---------- /actions logs pages (core/paginator.py) ----------
+# args: "u.<phase>..<uid>"      -> one field per cycle for that user
+#       "p.<phase>.<n>.<uid?>"  -> one field per actor in that cycle
+LOGS_PAGE_SIZE = 8
+
+def _logs_rows(args: str) -> list:
+    mode, p, n, uid = (args.split(".") + ["", "", "", ""])[:4]
+    if mode == "u":
+        return act_core.get_user_logs_all(p, uid)
+    return act_core.get_logs(p, int(n), uid or None)
+
+def _render_logs_page(args: str, start: int, stop: int, page: int, pages: int) -> discord.Embed:
+    mode, p, n, uid = (args.split(".") + ["", "", "", ""])[:4]
+    phase_lbl = "Día" if p == "day" else "Noche"
+    rows = _logs_rows(args)
+    if mode == "u":
+        embed = discord.Embed(title=f"Historial de Acciones ({phase_lbl}) — {_label_from_uid(uid)}", color=0x8E44AD)
+        for num, act in rows[start:stop]:
+            embed.add_field(name=f"{phase_lbl} {num}", value=(_fmt_action_line(act)[:600] or "—"), inline=False)
+    else:
+        embed = discord.Embed(title=f"Logs de Acciones — {phase_lbl} {n}", color=0x8E44AD)
+        for r in rows[start:stop]:
+            embed.add_field(name=f"👤 {_label_from_uid(str(r.get('uid')))}", value=(_fmt_action_line(r)[:600] or "—"), inline=False)
+    if not rows:
+        embed.description = "ℹ️ No hay acciones registradas." if mode == "u" else "ℹ️ No hay acciones registradas en este ciclo."
+    return embed
+
+paginator.register(
+    "action_logs",
+    count=lambda args: len(_logs_rows(args)),
+    render=_render_logs_page,
+    page_size=LOGS_PAGE_SIZE,
+    admin_only=True,
+)
+
+
 class ActionsAdminCog(commands.GroupCog, name="actions", description="Utilidades de Acciones (Admin)"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -266,53 +289,14 @@ class ActionsAdminCog(commands.GroupCog, name="actions", description="Utilidades
         ctx = InteractionCtx(interaction)
 
         p = _resolve_phase(phase.value if phase else None)
-        phase_lbl = "Día" if p == "day" else "Noche"
 
-        # A) User History (all cycles)
+        # A) User History (all cycles) / B) Phase logs (specific or current cycle)
         if user is not None and number is None:
-            uid = str(user.id)
-            rows = act_core.get_user_logs_all(p, uid)
-            title = f"Historial de Acciones ({phase_lbl}) — {user.display_name}"
-            embed = discord.Embed(title=title, color=0x8E44AD)
-
-            if not rows:
-                embed.description = "ℹ️ No hay acciones registradas."
-                return await ctx.reply(embed=embed, ephemeral=not public)
-
-            by_num: dict[int, list[dict]] = {}
-            for n, act in rows:
-                by_num.setdefault(n, []).append(act)
-
-            for n in sorted(by_num.keys()):
-                acts = by_num[n]
-                lines = [_fmt_action_line(a) for a in acts]
-                embed.add_field(name=f"{phase_lbl} {n}", value=("\n".join(lines)[:1024] or "—"), inline=False)
-
-            return await ctx.reply(embed=embed, ephemeral=not public)
-
-        # B) Phase logs (specific or current cycle)
-        n = number if number is not None else act_core.current_cycle_number(p)
-        uid = str(user.id) if user else None
-        rows = act_core.get_logs(p, n, uid)
-
-        title = f"Logs de Acciones — {phase_lbl} {n}"
-        embed = discord.Embed(title=title, color=0x8E44AD)
-
-        if not rows:
-            embed.description = "ℹ️ No hay acciones registradas en este ciclo."
-            return await ctx.reply(embed=embed, ephemeral=not public)
-
-        by_user: dict[str, list[dict]] = {}
-        for r in rows:
-            u = str(r.get("uid"))
-            by_user.setdefault(u, []).append(r)
-
-        for u, acts in by_user.items():
-            lines = [_fmt_action_line(a) for a in acts]
-            name = _label_from_uid(u)
-            embed.add_field(name=f"👤 {name}", value=("\n".join(lines)[:1024] or "—"), inline=False)
-
-        await ctx.reply(embed=embed, ephemeral=not public)
+            args = f"u.{p}..{user.id}"
+        else:
+            n = number if number is not None else act_core.current_cycle_number(p)
+            args = f"p.{p}.{n}.{user.id if user else ''}"
+        await paginator.send(ctx, "action_logs", args, ephemeral=not public)
 
     @app_commands.command(name="breakdown", description="Resumen de quién ha actuado y quién falta.")
     @app_commands.choices(phase=PHASE_CHOICES)
@@ -363,9 +347,7 @@ class ActionsAdminCog(commands.GroupCog, name="actions", description="Utilidades
             if not uids: return "—"
             names = []
             for uid in uids[:30]: 
-                pdata = game.players.get(uid, {})
-                label = pdata.get("name") or pdata.get("alias") or f"<@{uid}>"
-                names.append(f"`{label}`")
+                names.append(f"`{game.players.display_name(uid, default=f'<@{uid}>')}`")
             if len(uids) > 30: names.append(f"… (+{len(uids)-30} más)")
             return ", ".join(names)
 
@@ -393,6 +375,52 @@ class ActionsAdminCog(commands.GroupCog, name="actions", description="Utilidades
         await ctx.reply(embed=embed, ephemeral=not public)
 
 
+    @app_commands.command(name="resolve", description="Resolver la Noche automáticamente (vista previa; commit=true para aplicar).")
+    @app_commands.describe(
+        number="Número de Noche (omitir para actual)",
+        commit="Aplicar resultados: estados, muertes y mensajes privados (default: false)",
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def resolve_cmd(
+        self,
+        interaction: discord.Interaction,
+        number: Optional[int] = None,
+        commit: bool = False,
+    ):
+        await interaction.response.defer(ephemeral=True)
+        ctx = InteractionCtx(interaction)
+
+        res = res_core.resolve_night(number)
+        if not res.steps:
+            return await ctx.reply(f"ℹ️ No hay acciones registradas en la Noche {res.number}.", ephemeral=True)
+        if commit and res_core.is_resolved(res.number):
+            return await ctx.reply(f"⚠️ La Noche {res.number} ya fue resuelta.", ephemeral=True)
+
+        embed = discord.Embed(
+            title=f"{'Resolución' if commit else 'Vista previa'} — Noche {res.number}",
+            description="\n".join(res_core.preview_lines(res))[:4000],
+            color=0x2C3E50,
+        )
+        if res.deaths:
+            embed.add_field(name="☠️ Muertes", value=", ".join(f"<@{u}> ({r})" for u, r in res.deaths)[:1024], inline=False)
+        if res.statuses:
+            embed.add_field(name="🧪 Estados", value=", ".join(f"<@{u}> {n}" for u, n, _, _ in res.statuses)[:1024], inline=False)
+        if res.messages:
+            embed.add_field(name="✉️ Mensajes privados", value=str(sum(len(m) for m in res.messages.values())), inline=True)
+
+        if not commit:
+            embed.set_footer(text="Nada se ha aplicado. Repite con commit:true para aplicar.")
+            return await ctx.reply(embed=embed, ephemeral=True)
+
+        await res_core.commit(interaction.guild, res)
+        try:
+            await log_event(self.bot, interaction.guild.id if interaction.guild else None, "NIGHT_RESOLVED",
+                            number=res.number, deaths=len(res.deaths), statuses=len(res.statuses))
+        except Exception:
+            pass
+        await ctx.reply(embed=embed, ephemeral=True)
+
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(ActionsCog(bot))
     await bot.add_cog(ActionsAdminCog(bot))
\ No newline at end of file
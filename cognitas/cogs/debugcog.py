@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from ..core import diagnostics as diag
+
+
+def _fmt_bytes(n: int) -> str:
+    if n < 0:
+        return "?"
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+class DebugCog(commands.GroupCog, name="debug", description="In-process diagnostics (Admin)"):
+    """Memory, CPU and task introspection. Everything runs inside the bot process."""
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="memory", description="tracemalloc control + top allocation sites and game section sizes.")
+    @app_commands.describe(action="start: begin tracing • report: show growth since start • stop: report, then stop")
+    @app_commands.choices(action=[
+        app_commands.Choice(name="report", value="report"),
+        app_commands.Choice(name="start", value="start"),
+        app_commands.Choice(name="stop", value="stop"),
+    ])
+    @app_commands.default_permissions(administrator=True)
+    async def memory(self, interaction: discord.Interaction, action: Optional[app_commands.Choice[str]] = None):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        act = action.value if action else "report"
+        notes = []
+        if act == "start":
+            notes.append("tracemalloc started." if diag.trace_start() else "tracemalloc was already running.")
+
+        embed = discord.Embed(title="Memory", color=0x7F8C8D)
+        proc = diag.process_memory()
+        lines = [f"{k}: {v}" for k, v in proc.items() if k not in ("traced", "traced_peak")]
+        if "traced" in proc:
+            lines.append(f"traced: {_fmt_bytes(proc['traced'])} (peak {_fmt_bytes(proc['traced_peak'])})")
+        embed.add_field(name="Process", value="\n".join(lines)[:1024] or "—", inline=False)
+
+        sizes = diag.section_sizes()
+        embed.add_field(
+            name=f"Game sections ({_fmt_bytes(sum(v for v in sizes.values() if v > 0))} serialized)",
+            value="\n".join(f"`{k}` {_fmt_bytes(v)}" for k, v in list(sizes.items())[:15])[:1024] or "—",
+            inline=False,
+        )
+
+        top = diag.top_allocations()
+        if top:
+            embed.add_field(
+                name="Top allocation growth since start",
+                value="\n".join(f"`{site}` +{_fmt_bytes(size)} ({count:+d} blocks)" for site, size, count in top)[:1024],
+                inline=False,
+            )
+        elif act != "start":
+            notes.append("tracemalloc is not running; use `/debug memory action:start` to collect allocation sites.")
+
+        if act == "stop":
+            diag.trace_stop()
+            notes.append("tracemalloc stopped.")
+        if notes:
+            embed.description = "\n".join(notes)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="profile", description="Sample the event loop for N seconds; uploads collapsed stacks.")
+    @app_commands.describe(seconds=f"Sampling window (1-{diag.PROFILE_MAX_SECONDS}s)")
+    @app_commands.default_permissions(administrator=True)
+    async def profile(self, interaction: discord.Interaction, seconds: app_commands.Range[int, 1, diag.PROFILE_MAX_SECONDS] = 10):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        text, n, leaves = await diag.profile_loop(seconds)
+        if not n:
+            return await interaction.followup.send("No samples collected.", ephemeral=True)
+        summary = "\n".join(f"`{name}` {count * 100 / n:.1f}%" for name, count in leaves)
+        fname = f"asdrubot-profile-{int(time.time())}.collapsed"
+        await interaction.followup.send(
+            f"**{n} samples over {seconds}s** (top leaf frames; idle time shows up as the selector wait):\n{summary}"[:1900],
+            file=discord.File(io.BytesIO(text.encode("utf-8")), filename=fname),
+            ephemeral=True,
+        )
+
+    @app_commands.command(name="tasks", description="List live asyncio tasks and flag orphaned phase timers.")
+    @app_commands.default_permissions(administrator=True)
+    async def tasks(self, interaction: discord.Interaction):
+        rows = diag.task_report()
+        orphans = [r for r in rows if r["orphan"]]
+        lines = [
+            f"{'⚠️ ' if r['orphan'] else ''}`{r['name']}` {r['coro']} @ {r['where']}"
+            + (f" — {r['orphan']}" if r["orphan"] else "")
+            for r in rows
+        ]
+        header = f"**{len(rows)} tasks**, {len(orphans)} orphaned"
+        body = "\n".join(lines)
+        if len(header) + len(body) + 2 <= 1900:
+            return await interaction.response.send_message(f"{header}\n{body}", ephemeral=True)
+        await interaction.response.send_message(
+            header,
+            file=discord.File(io.BytesIO(body.encode("utf-8")), filename="asdrubot-tasks.txt"),
+            ephemeral=True,
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(DebugCog(bot))
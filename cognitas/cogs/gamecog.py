@@ -1,9 +1,15 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from ..core import game as game_core
+from ..core import autocomplete, game as game_core
 from .. import config as cfg
 
+async def _role_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    return autocomplete.choices("roles", current)
+
+async def _team_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    return autocomplete.choices("teams", current)
+
 class GameCog(commands.Cog):
     def __init__(self, bot): self.bot = bot
 
@@ -36,11 +42,13 @@ class GameCog(commands.Cog):
     async def game_reset(self, interaction: discord.Interaction):
         await game_core.hard_reset(interaction)
 
-    @app_commands.command(name="finish_game", description="Terminar la partida actual (admin).") 
+    @app_commands.command(name="finish_game", description="Terminar la partida actual y archivarla (admin).") 
+    @app_commands.describe(winner="Equipo ganador (si se omite, se deduce cuando todos los vivos son del mismo equipo)")
     @app_commands.default_permissions(administrator=True)
-    async def finish_game(self, interaction: discord.Interaction, reason: str | None = None):
+    @app_commands.autocomplete(winner=_team_autocomplete)
+    async def finish_game(self, interaction: discord.Interaction, reason: str | None = None, winner: str | None = None):
         ctx = await commands.Context.from_interaction(interaction)
-        await game_core.finish(ctx, reason=reason)
+        await game_core.finish(ctx, reason=reason, winner=winner)
         
     @app_commands.command(name="who", description="Ver información interna de un jugador (admin).") 
     @app_commands.default_permissions(administrator=True)
@@ -50,6 +58,7 @@ class GameCog(commands.Cog):
         
     @app_commands.command(name="assign", description="Asignar rol manualmente a un jugador (admin).") 
     @app_commands.default_permissions(administrator=True)
+    @app_commands.autocomplete(role_name=_role_autocomplete)
     async def assign(self, interaction: discord.Interaction, member: discord.Member, role_name: str):
         ctx = await commands.Context.from_interaction(interaction)
         await game_core.assign_role(ctx, member, role_name)
@@ -3,6 +3,7 @@ from discord.ext import commands
 import random
 from discord import app_commands
 from ..core.state import game 
+from ..config import CACHE_PROFILE
 
 class MemesCog(commands.Cog, name="Memes"):
     def __init__(self, bot):
@@ -30,12 +31,28 @@ class MemesCog(commands.Cog, name="Memes"):
             ephemeral=True
         )
 
+    def _serves(self, channel) -> bool:
+        """Game channels only: the public game channel and the ones set up by /setup."""
+        cid = getattr(channel, "id", None)
+        if cid is None:
+            return False
+        if cid in (getattr(game, "game_channel_id", None), getattr(game, "default_game_channel_id", None)):
+            return True
+        guild = getattr(channel, "guild", None)
+        if guild is None:
+            return False
+        # read-only: get_infra() would create an entry for every guild we hear from
+        infra = (getattr(game, "infra", None) or {}).get(str(guild.id)) or {}
+        return cid in set((infra.get("channels") or {}).values())
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author.bot:
             return
         if message.content.startswith(("/", "!")):
             return
+        if CACHE_PROFILE == "lean" and not self._serves(message.channel):
+            return
 
         content = message.content.lower()
 
@@ -5,37 +5,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..core import players as players_core
+from ..core import autocomplete, players as players_core
 from ..core.players import get_player_snapshot
-
-# ------------------------------------------------------------
-# Interaction -> ctx adapter (uses followup if interaction already responded/deferred)
-# ------------------------------------------------------------
-class InteractionCtx:
-    def __init__(self, interaction: discord.Interaction):
-        self._i = interaction
-        self.guild = interaction.guild
-        self.bot = interaction.client  # type: ignore
-        self.channel = interaction.channel
-        self.author = interaction.user
-        self.message = None  # compat
-
-    async def reply(self, content: str = None, **kwargs):
-        try:
-            if self._i.response.is_done():
-                return await self._i.followup.send(content or "\u200b", **kwargs)
-            else:
-                return await self._i.response.send_message(content or "\u200b", **kwargs)
-        except Exception:
-            if self.channel:
-                try:
-                    return await self.channel.send(content or "\u200b", **kwargs)
-                except Exception:
-                    pass
-
-    async def send(self, content: str = None, **kwargs):
-        return await self.reply(content, **kwargs)
-
+from ..core.interactions import InteractionCtx
 
 # ------------------------------------------------------------
 # Canonical game flags (name -> {type, desc, aliases})
@@ -124,24 +96,21 @@ def _all_flag_keys_with_aliases() -> dict[str, str]:
             out[a.lower()] = key
     return out
 
+_FLAG_ALIASES = _all_flag_keys_with_aliases()
+
 def _canonical_flag_name(s: str) -> str | None:
     if not s:
         return None
-    return _all_flag_keys_with_aliases().get(s.lower())
+    return _FLAG_ALIASES.get(s.lower())
 
-async def _flag_name_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-    cur = (current or "").lower()
-    items: list[tuple[str, str]] = []
+def _flag_entries():
     for key, meta in FLAG_DEFS.items():
-        label = f"{key} — {meta.get('desc','')}"
-        if cur in key.lower() or cur in label.lower():
-            items.append((label, key))
-        else:
-            for a in meta.get("aliases", []):
-                if cur in a.lower():
-                    items.append((f"{key} (alias: {a}) — {meta.get('desc','')}", key))
-                    break
-    return [app_commands.Choice(name=lbl[:100], value=val) for lbl, val in items[:25]]
+        yield f"{key} — {meta.get('desc','')}", key, [key, *meta.get("aliases", [])]
+
+autocomplete.register_catalog("flags", _flag_entries)
+
+async def _flag_name_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    return autocomplete.choices("flags", current)
 
 async def _field_name_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
     cur = (current or "").lower()
@@ -375,6 +344,13 @@ class PlayersCog(commands.GroupCog, name="player", description="Gestión de juga
         ctx = InteractionCtx(interaction)
         await players_core.revive(ctx, member)
 
+    @app_commands.command(name="revive_all", description="Revivir a todos los jugadores muertos (admin)")
+    @app_commands.default_permissions(administrator=True)
+    async def revive_all_cmd(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        ctx = InteractionCtx(interaction)
+        await players_core.revive_all(ctx)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(PlayersCog(bot))
@@ -1,6 +1,25 @@
+import discord
 from discord import app_commands
 from discord.ext import commands
 from ..core.state import game
+from ..core import paginator
+from ..core.interactions import InteractionCtx
+
+ROLE_KEYS_PAGE_SIZE = 80
+
+
+def _role_keys() -> list:
+    return sorted((getattr(game, "roles", {}) or {}).keys())
+
+
+def _render_role_keys(args, start, stop, page, pages) -> discord.Embed:
+    keys = _role_keys()
+    return discord.Embed(title=f"Loaded roles (keys): {len(keys)}", description=", ".join(keys[start:stop]) or "—")
+
+
+paginator.register("role_keys", count=lambda args: len(_role_keys()), render=_render_role_keys,
+                   page_size=ROLE_KEYS_PAGE_SIZE, admin_only=True)
+
 
 class DebugRoles(commands.Cog):
     def __init__(self, bot): self.bot = bot
@@ -8,11 +27,6 @@ class DebugRoles(commands.Cog):
     @app_commands.command(name="debug_roles", description="List role keys loaded (admin)")
     @app_commands.default_permissions(administrator=True)
     async def debug_roles(self, interaction):
-        idx = getattr(game, "roles", {}) or {}
-        keys = sorted(list(idx.keys()))
-        # Show the first N to avoid hitting the limit
-        sample = keys[:80]
-        text = "Loaded roles (keys):\n" + ", ".join(sample) + (", ..." if len(keys) > 80 else "")
-        await interaction.response.send_message(text[:1900], ephemeral=True)
+        await paginator.send(InteractionCtx(interaction, ephemeral=True), "role_keys")
 
 async def setup(bot): await bot.add_cog(DebugRoles(bot))
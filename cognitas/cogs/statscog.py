@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from ..core import analytics, paginator
+from ..core.interactions import InteractionCtx
+
+STATS_PAGE_SIZE = 15
+
+
+def _pct(x: float) -> str:
+    return f"{x * 100:.0f}%"
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if not seconds:
+        return "—"
+    h, m = divmod(int(seconds) // 60, 60)
+    return f"{h}h {m:02d}m" if h else f"{m}m"
+
+
+def _summary() -> Optional[dict]:
+    """The summary warmed by _warm(); never reads archives on the loop."""
+    return analytics.cached_summary()
+
+
+async def _warm(_args: str = "") -> None:
+    await asyncio.to_thread(analytics.summary)  # parses new archives off the loop; cached afterwards
+
+
+def _overview() -> discord.Embed:
+    s = _summary()
+    e = discord.Embed(title="📊 Estadísticas de partidas", color=0x3498DB)
+    e.description = (
+        f"**{s['games']}** partidas archivadas ({s['finished']} terminadas, {s['with_winner']} con ganador) • "
+        f"**{s['players']}** plazas de jugador."
+    )
+    if s["winners"]:
+        e.add_field(
+            name="Victorias por equipo",
+            value="\n".join(f"`{t}` {n} ({_pct(n / s['with_winner'])})" for t, n in s["winners"].most_common())[:1024],
+            inline=True,
+        )
+    if s["by_team"]:
+        e.add_field(
+            name="Tasa de victoria (jugadores)",
+            value="\n".join(f"`{t}` {_pct(r)} ({w}/{n})" for t, n, w, r in s["by_team"][:10])[:1024],
+            inline=True,
+        )
+    if s["lynches"]:
+        teams = ", ".join(f"{t} {n}" for t, n in s["lynched_teams"].most_common())
+        e.add_field(
+            name="Linchamientos",
+            value=f"{s['lynches']} • acierto (no-pueblo): **{_pct(s['lynch_hits'] / s['lynches'])}**\n{teams}"[:1024],
+            inline=False,
+        )
+    e.add_field(
+        name="Días",
+        value=(
+            f"{s['days']} días • duración media: **{_duration(s['avg_day_seconds'])}** "
+            f"({s['timed_days']} cronometrados) • cerrados por mayoría: {s['days_by_threshold']}"
+        ),
+        inline=False,
+    )
+    e.set_footer(text="Usa view:roles o view:acciones para el detalle.")
+    return e
+
+
+def _rows(view: str) -> list:
+    s = _summary()
+    if s is None:
+        return []
+    if view == "roles":
+        return [f"**{role}** — {_pct(r)} ({w}/{n})" for role, n, w, r in s["by_role"]]
+    if view == "acciones":
+        return [
+            f"**{role}** — " + ", ".join(f"{a} ×{c}" for a, c in counts.most_common(5))
+            for role, counts in s["actions"].items()
+        ]
+    return []
+
+
+def _render_stats(args: str, start: int, stop: int, page: int, pages: int) -> discord.Embed:
+    rows = _rows(args)
+    title = "📊 Tasa de victoria por rol" if args == "roles" else "📊 Uso de acciones por rol"
+    e = discord.Embed(title=title, color=0x3498DB, description="\n".join(rows[start:stop]) or "Sin datos todavía.")
+    e.set_footer(text=f"{(_summary() or {}).get('games', 0)} partidas archivadas")
+    return e
+
+
+paginator.register("stats", count=lambda args: len(_rows(args)), render=_render_stats,
+                   page_size=STATS_PAGE_SIZE, admin_only=True, prepare=_warm, version=analytics.revision)
+
+
+class StatsCog(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="stats", description="Estadísticas de todas las partidas archivadas (admin).")
+    @app_commands.describe(view="resumen (por defecto), roles o acciones")
+    @app_commands.choices(view=[
+        app_commands.Choice(name="resumen", value="resumen"),
+        app_commands.Choice(name="roles", value="roles"),
+        app_commands.Choice(name="acciones", value="acciones"),
+    ])
+    @app_commands.default_permissions(administrator=True)
+    async def stats(self, interaction: discord.Interaction, view: Optional[app_commands.Choice[str]] = None):
+        ctx = InteractionCtx(interaction, ephemeral=True)
+        v = view.value if view else "resumen"
+        if v == "resumen":
+            await _warm()
+            return await ctx.reply(embed=_overview())
+        await paginator.send(ctx, "stats", v)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(StatsCog(bot))
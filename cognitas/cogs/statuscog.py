@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import json
 from typing import Optional
 import discord
@@ -7,20 +8,46 @@ from discord.ext import commands
 
 from ..core.state import game
 from ..core.storage import save_state
-from ..core.players import send_to_player
-from ..status import list_registered, get_state_cls
+from ..core.players import send_to_player, stage_deaths, dispatch_deaths
+from ..core import autocomplete, paginator
+from ..core.interactions import InteractionCtx
+from ..status import get_state_cls
 from ..status import engine as SE
 from ..status import builtin
+from ..status import audit as status_audit
+
+HISTORY_PAGE_SIZE = 10
+EFFECTS_PAGE_SIZE = 20
+
+
+# ---------- /effects list pages (core/paginator.py); args: uid or "" for everyone ----------
+
+def _effects_rows(uid: str) -> list:
+    smap = getattr(game, "status_map", {}) or {}
+    uids = [uid] if uid else sorted(smap, key=lambda u: game.players.display_name(u).lower())
+    return [(u, name, entry) for u in uids for name, entry in sorted((smap.get(u) or {}).items())]
+
+
+def _render_effects_page(uid: str, start: int, stop: int, page: int, pages: int) -> discord.Embed:
+    rows = _effects_rows(uid)
+    lines = [
+        (f"- **{name}**" if uid else f"- {game.players.display_name(u, default=f'<@{u}>')}: **{name}**")
+        + f": {entry.get('remaining', 0)}t, stacks={entry.get('stacks', 1)}"
+        for u, name, entry in rows[start:stop]
+    ]
+    title = f"Active statuses — {game.players.display_name(uid, default=f'<@{uid}>')}" if uid else f"Total active statuses: {len(rows)}"
+    return discord.Embed(title=title, description="\n".join(lines) or "—", color=0x8E44AD)
+
+
+paginator.register("effects", count=lambda uid: len(_effects_rows(uid)), render=_render_effects_page,
+                   page_size=EFFECTS_PAGE_SIZE, admin_only=True)
 
 class StatusCog(commands.Cog, name="Status"):
     def __init__(self, bot): self.bot = bot
 
     # autocomplete for status names
     async def _status_autocomplete(self, interaction: discord.Interaction, current: str):
-        names = list(list_registered().keys())
-        current_l = (current or "").lower()
-        return [app_commands.Choice(name=n, value=n)
-                for n in names if current_l in n.lower()][:20]
+        return autocomplete.choices("statuses", current)
 
     group = app_commands.Group(name="effects", description="Altered states tools (GM)")
 
@@ -49,18 +76,20 @@ class StatusCog(commands.Cog, name="Status"):
             except Exception: pass
 
         ok, banner = SE.apply(game, str(user.id), name, source=source, duration=duration, meta=meta)
+        staged = stage_deaths(SE.drain_deaths(game))  # e.g. a lethal poison stack
         await save_state()
 
         if not ok:
             return await interaction.response.send_message(f"❌ Unknown status `{name}`.", ephemeral=True)
 
+        # Ack first: DMs, role swaps and death posters can outlast the 3 s window
+        await interaction.response.send_message(f"✅ Applied **{name}** to {user.mention}.", ephemeral=True)
+
         # deliver banner per visibility (night -> DM; day -> public) is handled by your policy;
         # here: send DM to user always; you can also post public depending on status.
-
         if banner:
             await send_to_player(interaction.guild, str(user.id), banner)
-
-        await interaction.response.send_message(f"✅ Applied **{name}** to {user.mention}.", ephemeral=True)
+        await dispatch_deaths(interaction.guild, staged)
 
     @group.command(name="heal", description="Cleanse statuses from a player (GM only).")
     @app_commands.autocomplete(name=_status_autocomplete)
@@ -80,27 +109,68 @@ class StatusCog(commands.Cog, name="Status"):
         banners = SE.heal(game, str(user.id), name=name, all_=bool(all))
         await save_state()
 
-        # DM banners to the user
-        for b in banners:
-            await send_to_player(interaction.guild, str(user.id), b)
-
         detail = f"all statuses" if all else (f"`{name}`" if name else "nothing")
         await interaction.response.send_message(f"✅ Cleansed {detail} from {user.mention}.", ephemeral=True)
 
+        # DM banners to the user (after the ack)
+        for b in banners:
+            await send_to_player(interaction.guild, str(user.id), b)
+
     @group.command(name="list", description="List statuses; if user omitted, shows totals.")
     @app_commands.default_permissions(administrator=True)
     async def list_(
         self, interaction: discord.Interaction, user: Optional[discord.Member] = None
     ):
-        if user:
-            m = SE.list_active(game, str(user.id))
-            if not m:
-                return await interaction.response.send_message(f"{user.mention} has no active statuses.", ephemeral=True)
-            lines = [f"- **{k}**: {v.get('remaining',0)}t, stacks={v.get('stacks',1)}" for k, v in m.items()]
-            return await interaction.response.send_message("\n".join(lines), ephemeral=True)
-        else:
-            total = sum(len(v) for v in getattr(game, "status_map", {}).values()) if hasattr(game, "status_map") else 0
-            return await interaction.response.send_message(f"Total active statuses: **{total}**", ephemeral=True)
+        uid = str(user.id) if user else ""
+        if not _effects_rows(uid):
+            msg = f"{user.mention} has no active statuses." if user else "Total active statuses: **0**"
+            return await interaction.response.send_message(msg, ephemeral=True)
+        await paginator.send(InteractionCtx(interaction, ephemeral=True), "effects", uid)
+
+    @group.command(name="history", description="Paged status history (apply/heal/expire) for this game.")
+    @app_commands.autocomplete(name=_status_autocomplete)
+    @app_commands.describe(
+        user="Only rows for this player",
+        name="Only rows for this status",
+        page="Page number (newest first)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def history(
+        self,
+        interaction: discord.Interaction,
+        user: Optional[discord.Member] = None,
+        name: Optional[str] = None,
+        page: Optional[int] = 1,
+    ):
+        uid = str(user.id) if user else None
+
+        def _query(page: int):
+            # SQLite reads (and the pending-row flush) stay off the event loop
+            total = status_audit.count(game, uid=uid, status=name)
+            pages = max(1, -(-total // HISTORY_PAGE_SIZE))
+            page = min(max(1, int(page or 1)), pages)
+            rows = status_audit.history(game, uid=uid, status=name,
+                                        limit=HISTORY_PAGE_SIZE, offset=(page - 1) * HISTORY_PAGE_SIZE)
+            return total, pages, page, rows
+
+        total, pages, page, rows = await asyncio.to_thread(_query, page)
+        if not rows:
+            return await interaction.response.send_message("No status history for that filter.", ephemeral=True)
+
+        lines = []
+        for r in rows:
+            extra = []
+            if r.get("stacks") is not None: extra.append(f"stacks={r['stacks']}")
+            if r.get("remaining") is not None: extra.append(f"rem={r['remaining']}")
+            if r.get("source"): extra.append(f"src={r['source']}")
+            lines.append(
+                f"<t:{int(r['ts'])}:R> D{r.get('day') or '?'} {r.get('phase') or ''} "
+                f"**{r['kind']}** `{r['status']}` → <@{r['uid']}>"
+                + (f" ({', '.join(extra)})" if extra else "")
+            )
+        embed = discord.Embed(title="Status history", description="\n".join(lines), color=0x8E44AD)
+        embed.set_footer(text=f"Page {page}/{pages} • {total} rows")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @group.command(name="inspect", description="Show docs for a status type.")
     @app_commands.autocomplete(name=_status_autocomplete)
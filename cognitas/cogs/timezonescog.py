@@ -81,7 +81,7 @@ def _state_save_guild(guild_id: int, cfg: GuildTZConfig) -> None:
 
 async def _persist():
     try:
-        await save_state()
+        await save_state(dirty=("tzclocks",))
     except Exception:
         pass
 
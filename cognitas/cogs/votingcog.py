@@ -4,45 +4,80 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..core import phases, votes as votes_core
+from ..core import autocomplete, phases, throttle, voteboard, votes as votes_core
+from ..core.interactions import InteractionCtx
 from ..status import engine as SE
 from ..core.state import game
 
 
-# --- Adapter to bridge slash Interaction <-> legacy ctx-style calls ---
-class InteractionCtx:
+# --- Vote board controls (persistent view, see core/voteboard.py) ---
+VOTE_SELECT_ID = "asdru:vote:select:{}"
+VOTE_UNVOTE_ID = "asdru:vote:unvote"
+VOTE_END_DAY_ID = "asdru:vote:end_day"
+MAX_SELECTS = voteboard.BOARD_SELECTS         # rows 0-3; row 4 holds the buttons
+OPTIONS_PER_SELECT = voteboard.OPTIONS_PER_SELECT  # Discord limit
+
+
+class VoteBoardView(discord.ui.View):
     """
-    Minimal context adapter so core functions that expect a 'ctx' with
-    .reply(), .send(), .guild, .bot, .channel, .author keep working.
+    Select menu(s) over the alive players plus unvote / end-day buttons.
+    Only the first BOARD_CAPACITY players (by name) fit; the board embed
+    points everyone else to /vote cast name:.
+    Votes go through the same core paths as /vote (gates, tally, auto-close).
+    VoteBoardView() builds the board from the alive index; the instance
+    registered with bot.add_view() only needs the stable custom_ids.
     """
-    def __init__(self, interaction: discord.Interaction):
-        self._i = interaction
-        self.guild: discord.Guild | None = interaction.guild
-        self.bot: discord.Client = interaction.client  # type: ignore
-        self.channel = interaction.channel
-        self.author = interaction.user
-        self.message = None
-
-    async def reply(self, content: str = None, **kwargs):
-        # Prefer followup if we've already responded or deferred
-        try:
-            if self._i.response.is_done():
-                return await self._i.followup.send(content or "\u200b", **kwargs)
-            else:
-                return await self._i.response.send_message(content or "\u200b", **kwargs)
-        except Exception:
-            # Fallback to channel send
-            try:
-                if self.channel:
-                    return await self.channel.send(content or "\u200b", **kwargs)
-            except Exception:
-                pass
-
-    async def send(self, content: str = None, **kwargs):
-        return await self.reply(content, **kwargs)
-
-    async def delete(self, *args, **kwargs):
-        return
+    def __init__(self, alive_uids: list[str] | None = None):
+        super().__init__(timeout=None)
+        if alive_uids is None:
+            alive_uids = sorted(game.players.alive_ids(), key=lambda u: votes_core._player_name(u).lower())
+        chunks = [alive_uids[i:i + OPTIONS_PER_SELECT] for i in range(0, len(alive_uids), OPTIONS_PER_SELECT)]
+        for slot, chunk in enumerate(chunks[:MAX_SELECTS]):
+            first, last = votes_core._player_name(chunk[0]), votes_core._player_name(chunk[-1])
+            select = discord.ui.Select(
+                custom_id=VOTE_SELECT_ID.format(slot),
+                placeholder="🗳️ Votar para linchar..." if len(chunks) == 1 else f"🗳️ Votar: {first[:20]} – {last[:20]}",
+                min_values=1, max_values=1, row=slot,
+                options=[
+                    discord.SelectOption(label=votes_core._player_name(uid)[:100], value=uid)
+                    for uid in chunk
+                ],
+            )
+            select.callback = self._make_select_callback(select)
+            self.add_item(select)
+
+    @classmethod
+    def persistent(cls) -> "VoteBoardView":
+        """Dispatcher instance: every select slot present, placeholder options."""
+        return cls([str(i) for i in range(MAX_SELECTS * OPTIONS_PER_SELECT)])
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Board clicks share the /vote cast and /vote clear buckets
+        cid = str((interaction.data or {}).get("custom_id") or "")
+        if cid.startswith(VOTE_SELECT_ID.format("")):
+            return await throttle.gate(interaction, "vote cast")
+        if cid == VOTE_UNVOTE_ID:
+            return await throttle.gate(interaction, "vote clear")
+        return True
+
+    def _make_select_callback(self, select: discord.ui.Select):
+        async def _cb(interaction: discord.Interaction):
+            # Board clicks stay private even where /vote cast answers publicly
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await votes_core.vote(InteractionCtx(interaction), select.values[0])
+        return _cb
+
+    @discord.ui.button(label="Retirar voto", emoji="↩️", style=discord.ButtonStyle.secondary,
+                       custom_id=VOTE_UNVOTE_ID, row=4)
+    async def unvote_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        await votes_core.unvote(InteractionCtx(interaction))
+
+    @discord.ui.button(label="Terminar el Día", emoji="🌅", style=discord.ButtonStyle.secondary,
+                       custom_id=VOTE_END_DAY_ID, row=4)
+    async def end_day_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        await votes_core.request_end_day(InteractionCtx(interaction))
 
 
 class VotingAdminCog(commands.Cog):
@@ -94,13 +129,12 @@ class VotingAdminCog(commands.Cog):
 
     @app_commands.command(name="votes", description="Ver recuento de votos detallado (Embed)")
     async def votes(self, interaction: discord.Interaction):
-        await interaction.response.defer() 
-        ctx = InteractionCtx(interaction)
+        # With a live board the reply is private (the board is the public tally)
+        ctx = InteractionCtx(interaction, ephemeral=voteboard.is_live())
         await votes_core.votes_breakdown(ctx)
 
     @app_commands.command(name="status", description="Ver estado actual de la partida")
     async def status(self, interaction: discord.Interaction):
-        await interaction.response.defer() 
         ctx = InteractionCtx(interaction)
         await votes_core.status(ctx)
 
@@ -112,38 +146,42 @@ class VotingAdminCog(commands.Cog):
         await votes_core.clearvotes(ctx)
 
 
+async def _player_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    return autocomplete.choices("players", current)
+
+
 class VoteCog(commands.GroupCog, name="vote", description="Sistema de Votación"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
     @app_commands.command(name="cast", description="Votar para linchar a un jugador")
-    @app_commands.describe(member="Jugador objetivo")
-    async def cast(self, interaction: discord.Interaction, member: discord.Member):
-        await interaction.response.defer(ephemeral=False)
+    @app_commands.describe(member="Jugador objetivo", name="...o su nombre/alias en la partida")
+    @app_commands.autocomplete(name=_player_autocomplete)
+    async def cast(self, interaction: discord.Interaction, member: discord.Member | None = None, name: str | None = None):
         ctx = InteractionCtx(interaction)
-
-        await votes_core.vote(ctx, member)
+        if member is None and not name:
+            return await ctx.reply("❌ Indica un jugador (`member` o `name`).", ephemeral=True)
+        await votes_core.vote(ctx, member or name)
 
     @app_commands.command(name="clear", description="Retirar tu voto actual")
     async def clear(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        ctx = InteractionCtx(interaction)
+        ctx = InteractionCtx(interaction, ephemeral=True)
         await votes_core.unvote(ctx)
 
     @app_commands.command(name="mine", description="Ver por quién has votado")
     async def mine(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        ctx = InteractionCtx(interaction)
+        ctx = InteractionCtx(interaction, ephemeral=True)
         await votes_core.myvote(ctx)
 
     @app_commands.command(name="end_day", description="Solicitar terminar el día (Solo Día 1).")
     async def end_day(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        ctx = InteractionCtx(interaction)
+        ctx = InteractionCtx(interaction, ephemeral=True)
         await votes_core.request_end_day(ctx)
 
 
 async def setup(bot: commands.Bot):
+    voteboard.set_view_factory(VoteBoardView)
+    bot.add_view(VoteBoardView.persistent())
     await bot.add_cog(VotingAdminCog(bot))
     await bot.add_cog(VoteCog(bot))
 
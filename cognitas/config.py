@@ -11,6 +11,30 @@ INTENTS_KWARGS = {
     "message_content": True,
 }
 
+# -------------------------------------------------------------------
+# Gateway cache profile (bot.py)
+# -------------------------------------------------------------------
+# "lean": no member chunking at startup, no gateway member cache, no message
+#         cache; members are fetched on demand (core/members.py: players kept,
+#         everyone else in a small LRU) and memes only answer in game channels.
+# "full": discord.py defaults (every member of every guild cached).
+CACHE_PROFILE = os.getenv("ASDRUBOT_CACHE_PROFILE", "lean").lower()
+MAX_MESSAGES = None              # message cache size in "lean" (None = disabled)
+MEMBER_LRU_SIZE = 256            # non-player members kept by core/members.py
+MEMBER_CACHE_TTL = 300           # seconds before a resolved member is fetched again
+
+# -------------------------------------------------------------------
+# Gateway sharding (bot.py, core/sharding.py)
+# -------------------------------------------------------------------
+# Unset: one commands.Bot process. ASDRUBOT_AUTO_SHARD=1: AutoShardedBot with
+# Discord's recommended shard count. ASDRUBOT_SHARD_COUNT=N plus
+# ASDRUBOT_SHARD_IDS="0-3": this process runs only those shards and keeps its
+# own state store (state.shards-0-3-of-N.json) and status audit DB; start one
+# process per range.
+SHARD_COUNT = int(os.getenv("ASDRUBOT_SHARD_COUNT", "0") or 0)
+SHARD_IDS = os.getenv("ASDRUBOT_SHARD_IDS", "")
+AUTO_SHARD = os.getenv("ASDRUBOT_AUTO_SHARD", "").lower() in ("1", "true", "yes")
+
 # -------------------------------------------------------------------
 # State file location
 # -------------------------------------------------------------------
@@ -19,10 +43,45 @@ INTENTS_KWARGS = {
 BASE_DIR = Path(__file__).resolve().parents[1]  # ascend from cognitas/ to root
 # Absolute path to state.json at root
 STATE_PATH = Path(os.getenv("STATE_PATH", str(BASE_DIR / "state.json")))
+# Persistence backend: "json" (STATE_PATH), "sqlite" (STATE_DB_PATH, WAL mode)
+# or "sections" (STATE_DIR: one file per section + manifest.json)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").lower()
+STATE_DB_PATH = Path(os.getenv("STATE_DB_PATH", str(BASE_DIR / "state.db")))
+STATE_DIR = Path(os.getenv("STATE_DIR", str(BASE_DIR / "state")))
 DEFAULT_PROFILE = os.getenv("ASDRUBOT_DEFAULT_PROFILE", "default")
 
+# -------------------------------------------------------------------
+# Admin log sink (core/logs.py)
+# -------------------------------------------------------------------
+# Local JSONL audit file used when no Discord log channel is configured
+AUDIT_LOG_PATH = Path(os.getenv("AUDIT_LOG_PATH", str(BASE_DIR / "logs" / "audit.jsonl")))
+AUDIT_LOG_MAX_BYTES = 1_000_000  # rotate after ~1 MB
+AUDIT_LOG_BACKUPS = 5            # keep audit.jsonl.1 ... audit.jsonl.5
+LOG_FLUSH_INTERVAL = 1.0         # seconds to coalesce a burst into one message
+
+# Banner asset index + CDN URL cache (core/assets.py)
+ASSET_CACHE_PATH = Path(os.getenv("ASSET_CACHE_PATH", str(BASE_DIR / "asset_cache.json")))
+
+# Status history (status/audit.py): SQLite file, separate from the game state
+STATUS_AUDIT_PATH = Path(os.getenv("STATUS_AUDIT_PATH", str(BASE_DIR / "status_audit.db")))
+
+# Finished-game archives (core/archive.py, read by core/analytics.py for /stats)
+ARCHIVE_DIR = Path(os.getenv("ARCHIVE_DIR", str(BASE_DIR / "archive")))
+
 # Reminder mentions
 MENTION_EVERYONE = True          # set False to disable @everyone
 MENTION_ROLE_ID = None           # set an int role id to ping that role instead
 REMINDER_CHECKPOINTS = ["half", 4*3600, 15*60, 5*60]
+VOTE_BOARD_DEBOUNCE = 2.0        # seconds to coalesce vote changes into one board edit
+INTERACTION_DEFER_BUDGET = 2.0   # seconds a command may take before the adapter defers it (Discord allows 3)
+
+# Hot-command throttling (core/throttle.py): {command: {scope: (burst, per_seconds)}}
+# Admins are exempt. Set THROTTLE_RULES = {} to disable.
+THROTTLE_RULES = {
+    "votes":      {"user": (3, 30),  "guild": (20, 30)},
+    "status":     {"user": (3, 30),  "guild": (20, 30)},
+    "vote cast":  {"user": (4, 60),  "guild": (60, 60)},
+    "vote clear": {"user": (4, 60),  "guild": (60, 60)},
+    "lynch":      {"user": (2, 120), "guild": (6, 120)},
+}
 START_AT_DAY = 1
@@ -4,6 +4,7 @@ import time
 import logging
 from typing import Any, Dict, List, Tuple, Optional
 from .state import game
+from . import events
 from ..status import engine as SE
 
 log = logging.getLogger(__name__)
@@ -138,6 +139,7 @@ def enqueue_action(
     # Check replacement
     replaced = str(actor_uid) in bucket
     bucket[str(actor_uid)] = record
+    events.publish(events.ActionEnqueued(phase_norm, int(number), str(actor_uid), record["target"], record["action"]))
 
     return {"ok": True, "number": number, "record": record, "replaced": replaced}
 
@@ -146,15 +148,7 @@ def enqueue_action(
 def actors_for_phase(phase: str) -> List[str]:
     p = _normalize_phase(phase)
     flag_name = _flag_for_phase(p)
-    players = getattr(game, "players", {}) or {}
-    out: List[str] = []
-    for uid, pdata in players.items():
-        if not pdata or not pdata.get("alive", True):
-            continue
-        flags = pdata.get("flags", {}) or {}
-        if bool(flags.get(flag_name, False)):
-            out.append(uid)
-    return out
+    return sorted(game.players.with_flag(flag_name, alive_only=True))
 
 def acted_uids(phase: str, number: Optional[int] = None) -> List[str]:
     bucket = get_action_bucket(phase, number)
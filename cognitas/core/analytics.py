@@ -0,0 +1,218 @@
+# cognitas/core/analytics.py
+from __future__ import annotations
+
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import archive
+
+# -------------------------------------------------------------------
+# Cross-game analytics over core/archive.py files (admin /stats)
+# -------------------------------------------------------------------
+# Every archive is flattened once into three column stores (one list per
+# field, rows aligned by index):
+#
+#   players  game, role, team, won, alive
+#   days     game, number, seconds, lynched_team, by_threshold
+#   actions  game, role, action, phase
+#
+# Aggregations are single passes over the columns they need. Archives are
+# parsed once and kept by file name, so a new archive only costs its own
+# parse; the aggregated summary is cached until the set of archive files
+# changes (also picks up archives written by other shard processes).
+#
+# "won" is only defined for games with a winner team; a player won when
+# their team is the winner. A lynch "hit" is a lynch of a non-town player.
+
+TOWN_TEAMS = {"town", "village", "pueblo"}
+
+
+@dataclass
+class Columns:
+    names: Tuple[str, ...]
+    data: Dict[str, List[Any]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for n in self.names:
+            self.data.setdefault(n, [])
+
+    def append(self, **row: Any) -> None:
+        for n in self.names:
+            self.data[n].append(row.get(n))
+
+    def extend(self, other: "Columns") -> None:
+        for n in self.names:
+            self.data[n].extend(other.data[n])
+
+    def __len__(self) -> int:
+        return len(self.data[self.names[0]])
+
+    def col(self, name: str) -> List[Any]:
+        return self.data[name]
+
+
+def _new_tables() -> Dict[str, Columns]:
+    return {
+        "players": Columns(("game", "role", "team", "won", "alive")),
+        "days": Columns(("game", "number", "seconds", "lynched_team", "by_threshold")),
+        "actions": Columns(("game", "role", "action", "phase")),
+    }
+
+
+def flatten(doc: Dict[str, Any]) -> Dict[str, Columns]:
+    """One archive document -> its rows in the three column stores."""
+    t = _new_tables()
+    gid = doc.get("game_id")
+    winner = (doc.get("winner") or "").lower() or None
+    players = doc.get("players") or []
+    team_of = {p.get("uid"): (p.get("team") or None) for p in players}
+
+    for p in players:
+        team = p.get("team") or None
+        t["players"].append(
+            game=gid, role=p.get("role") or "?", team=team or "?",
+            won=(team == winner) if winner and team else None,
+            alive=bool(p.get("alive")),
+        )
+    for d in doc.get("days") or []:
+        start, end = d.get("start"), d.get("end")
+        lyn = d.get("lynched")
+        t["days"].append(
+            game=gid, number=d.get("number"),
+            seconds=(float(end) - float(start)) if start and end and end >= start else None,
+            lynched_team=(team_of.get(str(lyn)) or "?") if lyn else None,
+            by_threshold=bool(d.get("by_threshold")),
+        )
+    for a in doc.get("actions") or []:
+        t["actions"].append(game=gid, role=a.get("role") or "?", action=a.get("action") or "act", phase=a.get("phase"))
+    return t
+
+
+# ---------- Store ----------
+
+_parsed: Dict[str, Tuple[Dict[str, Any], Dict[str, Columns]]] = {}  # file name -> (meta, rows)
+_summary: Optional[Tuple[Tuple[str, ...], Dict[str, Any]]] = None
+_revision = 0  # bumped whenever a new summary is computed
+_lock = threading.Lock()  # summary() runs in worker threads
+
+
+def _signature() -> Tuple[str, ...]:
+    return tuple(p.name for p in archive.list_archives())
+
+
+def tables() -> Tuple[Dict[str, Columns], List[Dict[str, Any]]]:
+    """(merged column stores, per-game meta) over every archive on disk."""
+    paths = archive.list_archives()
+    names = {p.name for p in paths}
+    for stale in [n for n in _parsed if n not in names]:
+        _parsed.pop(stale, None)
+    for p in paths:
+        if p.name in _parsed:
+            continue
+        doc = archive.load(p)
+        if doc is None:
+            continue
+        meta = {k: doc.get(k) for k in ("game_id", "guild_id", "profile", "result", "winner", "started_at", "ended_at")}
+        meta["players"] = len(doc.get("players") or [])
+        _parsed[p.name] = (meta, flatten(doc))
+
+    merged = _new_tables()
+    metas = []
+    for name in sorted(_parsed):
+        meta, rows = _parsed[name]
+        metas.append(meta)
+        for k, cols in rows.items():
+            merged[k].extend(cols)
+    return merged, metas
+
+
+def win_rates(players: Columns, key: str) -> List[Tuple[str, int, int, float]]:
+    """[(role|team, games with a winner, wins, rate)], most played first."""
+    played: Counter = Counter()
+    wins: Counter = Counter()
+    for k, won in zip(players.col(key), players.col("won")):
+        if won is None:
+            continue
+        played[k] += 1
+        wins[k] += bool(won)
+    return [(k, n, wins[k], wins[k] / n) for k, n in played.most_common()]
+
+
+def lynch_accuracy(days: Columns) -> Tuple[int, int, Counter]:
+    """(lynches, hits on non-town, lynches per lynched team)."""
+    teams = Counter(t for t in days.col("lynched_team") if t is not None)
+    hits = sum(n for t, n in teams.items() if t not in TOWN_TEAMS and t != "?")
+    return sum(teams.values()), hits, teams
+
+
+def day_lengths(days: Columns) -> Tuple[int, Optional[float], int]:
+    """(timed days, average seconds, days closed by /vote end_day majority)."""
+    secs = [s for s in days.col("seconds") if s is not None]
+    avg = sum(secs) / len(secs) if secs else None
+    return len(secs), avg, sum(1 for b in days.col("by_threshold") if b)
+
+
+def action_usage(actions: Columns) -> Dict[str, Counter]:
+    """role -> Counter(action)."""
+    out: Dict[str, Counter] = defaultdict(Counter)
+    for role, action in zip(actions.col("role"), actions.col("action")):
+        out[role][action] += 1
+    return dict(sorted(out.items(), key=lambda kv: -sum(kv[1].values())))
+
+
+def summary() -> Dict[str, Any]:
+    """
+    Every aggregate /stats shows; cached until an archive is added or removed.
+    Reads the archive directory: call it off the event loop.
+    """
+    with _lock:
+        return _summary_locked()
+
+
+def _summary_locked() -> Dict[str, Any]:
+    global _summary, _revision
+    sig = _signature()
+    if _summary is not None and _summary[0] == sig:
+        return _summary[1]
+
+    t, metas = tables()
+    lynches, hits, lynched_teams = lynch_accuracy(t["days"])
+    timed, avg_day, by_threshold = day_lengths(t["days"])
+    out = {
+        "games": len(metas),
+        "finished": sum(1 for m in metas if m.get("result") == "finished"),
+        "with_winner": sum(1 for m in metas if m.get("winner")),
+        "winners": Counter(m["winner"] for m in metas if m.get("winner")),
+        "players": len(t["players"]),
+        "by_team": win_rates(t["players"], "team"),
+        "by_role": win_rates(t["players"], "role"),
+        "lynches": lynches,
+        "lynch_hits": hits,
+        "lynched_teams": lynched_teams,
+        "days": len(t["days"]),
+        "timed_days": timed,
+        "avg_day_seconds": avg_day,
+        "days_by_threshold": by_threshold,
+        "actions": action_usage(t["actions"]),
+    }
+    _summary = (sig, out)
+    _revision += 1
+    return out
+
+
+def cached_summary() -> Optional[Dict[str, Any]]:
+    """The last summary() computed, without touching the disk (None before the first)."""
+    return _summary[1] if _summary is not None else None
+
+
+def revision() -> int:
+    return _revision
+
+
+def invalidate() -> None:
+    global _summary, _revision
+    _summary = None
+    _revision += 1
+    _parsed.clear()
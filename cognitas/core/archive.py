@@ -0,0 +1,317 @@
+# cognitas/core/archive.py
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import config as cfg
+from .state import game
+from . import events, sharding
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Finished-game archive
+# -------------------------------------------------------------------
+# While a game runs, the few events the live state forgets (phase changes,
+# day results, deaths, votes) are appended to a per-game journal
+# (ARCHIVE_DIR/journal-<game_id>.jsonl, buffered and written with each
+# save_state like the status audit). When the game finishes (game.finish) or
+# is reset (game.hard_reset), journal + roster + actions + status history are
+# folded into one gzipped JSON document:
+#
+#   ARCHIVE_DIR/<game_id>-<guild_id>.json.gz
+#
+#   {"schema": 1, "game_id", "guild_id", "profile", "result": finished|reset,
+#    "reason", "winner" (team or null), "started_at", "ended_at",
+#    "players": [{uid, name, role, team, alive, death_day, death_phase, death_reason}],
+#    "days":    [{number, start, end, lynched, by_threshold, tally: {uid: voters}}],
+#    "votes":   [{t, day, voter, target}],          target null = unvote
+#    "actions": [{phase, number, uid, role, action, target, at}],
+#    "statuses":[{ts, day, phase, kind, uid, status, stacks, source}]}
+#
+# The schema only grows: readers (core/analytics.py) must ignore unknown keys
+# and treat missing ones as empty. Bump SCHEMA only for breaking changes.
+
+SCHEMA = 1
+FLUSH_THRESHOLD = 200
+
+_pending: List[Tuple[Any, str]] = []  # (game_id, json line)
+_lock = threading.Lock()
+_flush_scheduled = False
+
+
+def archive_dir() -> Path:
+    return Path(cfg.ARCHIVE_DIR)
+
+
+def archive_path(game_id: Any, guild_id: Any) -> Path:
+    return archive_dir() / f"{game_id}-{guild_id or 0}.json.gz"
+
+
+def _journal_path(game_id: Any) -> str:
+    return sharding.scoped_path(archive_dir() / f"journal-{game_id}.jsonl")
+
+
+# ---------- Journal ----------
+
+def record(kind: str, **fields: Any) -> None:
+    """Buffer one journal line for the running game. A full buffer is flushed off the loop."""
+    global _flush_scheduled
+    game_id = getattr(game, "game_id", None)
+    if not game_id:
+        return
+    line = {"t": round(time.time(), 3), "ev": kind, "day": getattr(game, "current_day_number", None),
+            "phase": getattr(game, "phase", None), **fields}
+    with _lock:
+        _pending.append((game_id, json.dumps(line, ensure_ascii=False, default=str)))
+        full = len(_pending) >= FLUSH_THRESHOLD and not _flush_scheduled
+        if full:
+            _flush_scheduled = True
+    if full:
+        try:
+            asyncio.get_running_loop().run_in_executor(None, _flush_quietly)
+        except RuntimeError:
+            _flush_quietly()  # no loop (scripts/tools)
+
+
+def _flush_quietly() -> None:
+    global _flush_scheduled
+    try:
+        flush_journal()
+    except Exception:
+        pass  # retried on the next save
+    finally:
+        _flush_scheduled = False
+
+
+def flush_journal() -> int:
+    """Append buffered lines to their journals. Safe to call from a worker thread."""
+    global _pending
+    with _lock:
+        lines, _pending = _pending, []
+    if not lines:
+        return 0
+    by_game: Dict[Any, List[str]] = {}
+    for game_id, ln in lines:
+        by_game.setdefault(game_id, []).append(ln)
+    try:
+        archive_dir().mkdir(parents=True, exist_ok=True)
+        for game_id, chunk in by_game.items():
+            with open(_journal_path(game_id), "a", encoding="utf-8") as f:
+                f.write("\n".join(chunk) + "\n")
+    except Exception:
+        with _lock:
+            _pending = lines + _pending
+        raise
+    return len(lines)
+
+
+def read_journal(game_id: Any) -> List[Dict[str, Any]]:
+    flush_journal()
+    out: List[Dict[str, Any]] = []
+    try:
+        with open(_journal_path(game_id), "r", encoding="utf-8") as f:
+            for ln in f:
+                try:
+                    out.append(json.loads(ln))
+                except ValueError:
+                    continue  # torn last line after a crash
+    except FileNotFoundError:
+        pass
+    return out
+
+
+def _on_event(ev: events.Event) -> None:
+    record(type(ev).__name__, **asdict(ev))
+
+
+for _ev in (events.PhaseChanged, events.DayEnded, events.PlayerDied, events.PlayerRevived, events.VoteCast):
+    events.subscribe(_ev, _on_event)
+
+
+@events.subscribe(events.VoteCleared)
+def _on_unvote(ev: events.VoteCleared) -> None:
+    if ev.voter is not None:  # day-end clears are implied by DayEnded
+        record("VoteCast", voter=ev.voter, target=None)
+
+
+# ---------- Building ----------
+
+def _team_of(role_name: Optional[str]) -> Optional[str]:
+    if not role_name:
+        return None
+    from .game import _lookup_role
+    rd = _lookup_role(role_name, getattr(game, "roles", {}) or {}, getattr(game, "roles_def", {})) or {}
+    team = rd.get("team") or rd.get("alignment")
+    return str(team).lower() if team else None
+
+
+def infer_winner() -> Optional[str]:
+    """The team of every surviving player when they all share one, else None."""
+    teams = {_team_of(p.get("role")) for p in game.players.values() if p.get("alive", True)}
+    return teams.pop() if len(teams) == 1 and None not in teams else None
+
+
+def read_statuses(game_id: Any) -> List[Dict[str, Any]]:
+    """Status audit rows of one game, trimmed to the archive fields."""
+    try:
+        from ..status import audit as status_audit
+        return [
+            {k: r.get(k) for k in ("ts", "day", "phase", "kind", "uid", "status", "stacks", "source")}
+            for r in status_audit.rows_for_game(game_id)
+        ]
+    except Exception as e:
+        log.info(f"[archive] status history unavailable: {e!r}")
+        return []
+
+
+def build(*, guild_id: Optional[int], result: str, reason: Optional[str] = None,
+          winner: Optional[str] = None, journal: Optional[List[Dict[str, Any]]] = None,
+          statuses: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    The archive document for the game currently in memory. journal/statuses
+    are read from disk when not given (archive_current reads them off the loop).
+    """
+    if journal is None:
+        journal = read_journal(game.game_id)
+    if statuses is None:
+        statuses = read_statuses(game.game_id)
+
+    deaths: Dict[str, Dict[str, Any]] = {}
+    days: Dict[int, Dict[str, Any]] = {}
+    votes: List[Dict[str, Any]] = []
+    for e in journal:
+        kind = e.get("ev")
+        if kind == "PlayerDied":
+            deaths[str(e.get("uid"))] = e
+        elif kind == "PlayerRevived":
+            deaths.pop(str(e.get("uid")), None)
+        elif kind == "PhaseChanged" and e.get("phase") == "day":
+            days.setdefault(int(e.get("number") or 0), {})["start"] = e.get("t")
+        elif kind == "DayEnded":
+            d = days.setdefault(int(e.get("number") or 0), {})
+            d.update(end=e.get("t"), lynched=e.get("lynched"), by_threshold=bool(e.get("by_threshold")),
+                     tally={str(k): int(v) for k, v in (e.get("tally") or ())})
+        elif kind == "VoteCast":
+            votes.append({"t": e.get("t"), "day": e.get("day"), "voter": e.get("voter"), "target": e.get("target")})
+
+    players = []
+    for uid, p in game.players.items():
+        d = deaths.get(str(uid)) or {}
+        players.append({
+            "uid": str(uid),
+            "name": p.get("name"),
+            "role": p.get("role"),
+            "team": _team_of(p.get("role")),
+            "alive": bool(p.get("alive", True)),
+            "death_day": d.get("day"),
+            "death_phase": d.get("phase"),
+            "death_reason": d.get("reason"),
+        })
+
+    actions = []
+    for phase, attr in (("day", "day_actions"), ("night", "night_actions")):
+        for number, bucket in (getattr(game, attr, None) or {}).items():
+            for uid, rec in (bucket or {}).items():
+                actions.append({
+                    "phase": phase,
+                    "number": int(number) if str(number).isdigit() else number,
+                    "uid": str(uid),
+                    "role": (game.players.get(str(uid)) or {}).get("role"),
+                    "action": rec.get("action"),
+                    "target": rec.get("target"),
+                    "at": rec.get("at"),
+                })
+
+    return {
+        "schema": SCHEMA,
+        "game_id": game.game_id,
+        "guild_id": guild_id,
+        "profile": getattr(game, "profile", None),
+        "result": result,
+        "reason": reason,
+        "winner": (winner or "").lower() or (infer_winner() if result == "finished" else None),
+        "started_at": game.game_id,
+        "ended_at": int(time.time()),
+        "players": players,
+        "days": [{"number": n, "start": None, "end": None, "lynched": None, "by_threshold": False, "tally": {}, **d}
+                 for n, d in sorted(days.items())],
+        "votes": votes,
+        "actions": actions,
+        "statuses": statuses,
+    }
+
+
+# ---------- Writing ----------
+
+def _discard_journal(game_id: Any) -> None:
+    global _pending
+    with _lock:
+        _pending = [(g, ln) for g, ln in _pending if g != game_id]
+    try:
+        os.remove(_journal_path(game_id))
+    except OSError:
+        pass
+
+
+def _write(doc: Dict[str, Any], path: Path) -> None:
+    from .storage import _atomic_write_bytes
+    data = gzip.compress(json.dumps(doc, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8"))
+    _atomic_write_bytes(str(path), data, make_backup=False)
+    _discard_journal(doc["game_id"])
+
+
+async def archive_current(*, guild_id: Optional[int], result: str, reason: Optional[str] = None,
+                          winner: Optional[str] = None) -> Optional[Path]:
+    """
+    Archive the game in memory (once per game). Returns the file written, or
+    None when there is nothing to archive or it already is. Never raises.
+    """
+    game_id = getattr(game, "game_id", None)
+    if not game_id:
+        return None
+    if not game.players:
+        _discard_journal(game_id)
+        return None
+    path = archive_path(game_id, guild_id)
+    if path.exists():
+        return None
+    try:
+        journal = await asyncio.to_thread(read_journal, game_id)
+        statuses = await asyncio.to_thread(read_statuses, game_id)
+        doc = build(guild_id=guild_id, result=result, reason=reason, winner=winner,
+                    journal=journal, statuses=statuses)
+        await asyncio.to_thread(_write, doc, path)
+    except Exception as e:
+        log.error(f"[archive] Failed to archive game {game_id}: {e!r}")
+        return None
+    log.info(f"[archive] Game {game_id} archived ({result}) -> {path}")
+    return path
+
+
+def load(path: str | Path) -> Optional[Dict[str, Any]]:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            doc = json.load(f)
+    except Exception as e:
+        log.info(f"[archive] Unreadable archive {path}: {e!r}")
+        return None
+    if not isinstance(doc, dict) or int(doc.get("schema") or 0) > SCHEMA:
+        return None
+    return doc
+
+
+def list_archives() -> List[Path]:
+    try:
+        return sorted(p for p in archive_dir().glob("*.json.gz") if p.is_file())
+    except OSError:
+        return []
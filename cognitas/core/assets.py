@@ -0,0 +1,172 @@
+# cognitas/core/assets.py
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+import logging
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import parse_qs, urlparse
+
+import discord
+
+from .. import config as cfg
+from .storage import _atomic_write_json
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Banner assets
+# -------------------------------------------------------------------
+# - Index: every expansions/assets/<dir>/ is scanned once (os.scandir) and
+#   kept in memory as {filename: path}; find() never probes the disk.
+#   Content hashes are computed once per file and reused across restarts
+#   while size/mtime match.
+# - Upload cache: after an asset is uploaded once, the CDN attachment URL is
+#   remembered by content hash and later banners are sent as an embed that
+#   points at it, so nothing is re-uploaded. Discord signs attachment URLs
+#   with an expiry (`ex`, hex epoch); expired links are dropped and the file
+#   is uploaded again.
+# Both live in ASSET_CACHE_PATH (outside the game state).
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "expansions", "assets")
+URL_EXPIRY_MARGIN = 3600  # re-upload when a link has less than this left (seconds)
+
+_dirs: Dict[str, Dict[str, str]] = {}                   # subdir -> {filename: path}
+_cache: Optional[Dict[str, Dict[str, Any]]] = None      # {"files": {path: {...}}, "urls": {sha1: {...}}}
+
+
+def _load_cache() -> Dict[str, Dict[str, Any]]:
+    global _cache
+    if _cache is None:
+        try:
+            with open(cfg.ASSET_CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
+        _cache = {"files": dict(data.get("files") or {}), "urls": dict(data.get("urls") or {})}
+    return _cache
+
+
+async def _persist() -> None:
+    snapshot = json.loads(json.dumps(_load_cache()))
+    try:
+        await asyncio.to_thread(_atomic_write_json, str(cfg.ASSET_CACHE_PATH), snapshot, make_backup=False)
+    except Exception as e:
+        log.info(f"[assets] cache save failed: {e!r}")
+
+
+# ---------- Index ----------
+
+def index_dir(subdir: str) -> Dict[str, str]:
+    """{filename: path} for expansions/assets/<subdir>, scanned on first use only."""
+    idx = _dirs.get(subdir)
+    if idx is not None:
+        return idx
+    idx = {}
+    files = _load_cache()["files"]
+    base = os.path.join(ASSETS_DIR, subdir)
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                idx[entry.name] = entry.path
+                known = files.get(entry.path)
+                if not known or known.get("size") != st.st_size or known.get("mtime") != int(st.st_mtime):
+                    files[entry.path] = {"size": st.st_size, "mtime": int(st.st_mtime), "sha1": None}
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.info(f"[assets] could not index {base}: {e!r}")
+    _dirs[subdir] = idx
+    return idx
+
+
+def find(subdir: str, candidates: Iterable[str]) -> Optional[str]:
+    """First candidate filename present in the indexed directory."""
+    idx = index_dir(subdir)
+    for name in candidates:
+        path = idx.get(name)
+        if path:
+            return path
+    return None
+
+
+def content_hash(path: str) -> str:
+    files = _load_cache()["files"]
+    rec = files.setdefault(path, {})
+    if not rec.get("sha1"):
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+        rec["sha1"] = h.hexdigest()
+    return rec["sha1"]
+
+
+# ---------- CDN URL cache ----------
+
+def _url_expiry(url: str) -> Optional[int]:
+    try:
+        ex = parse_qs(urlparse(url).query).get("ex")
+        return int(ex[0], 16) if ex else None
+    except Exception:
+        return None
+
+
+def cached_url(sha1: str) -> Optional[str]:
+    urls = _load_cache()["urls"]
+    rec = urls.get(sha1)
+    if not rec:
+        return None
+    exp = _url_expiry(rec.get("url") or "")
+    if exp is not None and exp - URL_EXPIRY_MARGIN <= time.time():
+        urls.pop(sha1, None)
+        return None
+    return rec.get("url")
+
+
+async def send_image(channel: discord.abc.Messageable, path: str, *, content: Optional[str] = None) -> Optional[discord.Message]:
+    """
+    Send `content` with the image at `path` as an embed image. Reuses the CDN
+    URL of an earlier upload of the same bytes when it is still valid.
+    """
+    try:
+        sha1 = content_hash(path)
+    except Exception as e:
+        log.error(f"[assets] Could not read {path}: {e}")
+        return await channel.send(content=content) if content else None
+
+    url = cached_url(sha1)
+    if url:
+        return await channel.send(content=content, embed=discord.Embed().set_image(url=url))
+
+    fname = os.path.basename(path)
+    embed = discord.Embed().set_image(url=f"attachment://{fname}")
+    msg = await channel.send(content=content, embed=embed, file=discord.File(path, filename=fname))
+    try:
+        att = msg.attachments[0] if msg.attachments else None
+        if att is not None:
+            _load_cache()["urls"][sha1] = {"url": att.url, "name": fname, "ts": int(time.time())}
+            await _persist()
+    except Exception:
+        pass
+    return msg
+
+
+async def send_banner(channel: discord.abc.Messageable, banner: Any) -> None:
+    """Post an expansion banner: a string, or {"content", "file_path"}."""
+    content, path = None, None
+    if isinstance(banner, str):
+        content = banner
+    elif isinstance(banner, dict):
+        content = banner.get("content")
+        path = banner.get("file_path")
+    if path:
+        await send_image(channel, path, content=content)
+    elif content:
+        await channel.send(content=content)
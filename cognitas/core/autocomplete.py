@@ -0,0 +1,230 @@
+# cognitas/core/autocomplete.py
+from __future__ import annotations
+
+import bisect
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from discord import app_commands
+
+from .state import game
+from .game import _norm_key
+from . import events
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Autocomplete catalogs
+# -------------------------------------------------------------------
+# A catalog is a list of entries (label, value, search keys) built by a
+# registered builder and indexed once:
+#   - prefix: sorted normalized keys, bisected per keystroke
+#   - grams:  1-, 2- and 3-grams of every key -> entry ids; short queries are
+#             answered by one lookup, longer ones by intersecting trigrams
+#             (substring), then by trigram overlap (typos)
+# Keys are normalized like game._norm_key (accents stripped, case folded).
+#
+# Catalogs are rebuilt lazily on the next query after invalidate() (event
+# handlers below) or when their version() changes, e.g. game.roles being
+# replaced on load/start. Built-ins: "statuses", "roles", "teams", "players"; cogs
+# register their own ("flags" in playerscog).
+
+MAX_CHOICES = 25          # Discord limit
+FUZZY_MIN_OVERLAP = 0.5   # share of the query's trigrams an entry must have
+
+Entry = Tuple[str, str, Tuple[str, ...]]  # (label, value, normalized keys)
+
+
+def norm(s: Any) -> str:
+    return _norm_key(s if isinstance(s, str) else str(s or "")).lower()
+
+
+def _grams(s: str, n: int) -> Set[str]:
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+class Index:
+    """Prefix + n-gram index over a fixed list of entries."""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, Iterable[str]]]):
+        self.entries: List[Entry] = []
+        self._prefix: List[Tuple[str, int]] = []
+        self._grams: Dict[str, Set[int]] = {}
+        for label, value, keys in entries:
+            nkeys = tuple(dict.fromkeys(k for k in (norm(x) for x in keys) if k))
+            eid = len(self.entries)
+            self.entries.append((str(label)[:100], str(value)[:100], nkeys))
+            for k in nkeys:
+                self._prefix.append((k, eid))
+                for n in (1, 2, 3):
+                    for g in _grams(k, n):
+                        self._grams.setdefault(g, set()).add(eid)
+        self._prefix.sort()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _prefix_hits(self, q: str, limit: int) -> List[int]:
+        out: List[int] = []
+        seen: Set[int] = set()
+        i = bisect.bisect_left(self._prefix, (q, -1))
+        while i < len(self._prefix) and len(out) < limit:
+            key, eid = self._prefix[i]
+            if not key.startswith(q):
+                break
+            if eid not in seen:
+                seen.add(eid)
+                out.append(eid)
+            i += 1
+        return out
+
+    def _substring_hits(self, q: str) -> Set[int]:
+        if len(q) <= 3:
+            return set(self._grams.get(q, ()))
+        sets = [self._grams.get(g) for g in _grams(q, 3)]
+        if not all(sets):
+            return set()
+        cand = set.intersection(*sorted(sets, key=len))
+        return {eid for eid in cand if any(q in k for k in self.entries[eid][2])}
+
+    def _fuzzy_hits(self, q: str) -> List[int]:
+        qg = _grams(q, 3)
+        if not qg:
+            return []
+        score: Dict[int, int] = {}
+        for g in qg:
+            for eid in self._grams.get(g, ()):
+                score[eid] = score.get(eid, 0) + 1
+        need = max(1, int(len(qg) * FUZZY_MIN_OVERLAP + 0.5))
+        hits = [eid for eid, s in score.items() if s >= need]
+        hits.sort(key=lambda eid: (-score[eid], eid))
+        return hits
+
+    def search_ids(self, query: str, limit: int = MAX_CHOICES, *, fuzzy: bool = True) -> List[int]:
+        q = norm(query)
+        if not q:
+            return list(range(min(limit, len(self.entries))))
+        out = self._prefix_hits(q, limit)
+        if len(out) < limit:
+            seen = set(out)
+            out.extend(sorted(self._substring_hits(q) - seen)[: limit - len(out)])
+        if fuzzy and len(out) < limit and len(q) > 3:
+            seen = set(out)
+            out.extend([eid for eid in self._fuzzy_hits(q) if eid not in seen][: limit - len(out)])
+        return out
+
+    def search(self, query: str, limit: int = MAX_CHOICES, *, fuzzy: bool = True) -> List[Tuple[str, str]]:
+        return [self.entries[eid][:2] for eid in self.search_ids(query, limit, fuzzy=fuzzy)]
+
+
+# ---------- Catalog registry ----------
+
+Builder = Callable[[], Iterable[Tuple[str, str, Iterable[str]]]]
+
+_builders: Dict[str, Tuple[Builder, Optional[Callable[[], Any]]]] = {}
+_built: Dict[str, Tuple[Any, Index]] = {}
+
+
+def register_catalog(name: str, builder: Builder, *, version: Optional[Callable[[], Any]] = None) -> None:
+    """builder() -> [(label, value, keys)]; version() -> anything that changes with the source."""
+    _builders[name] = (builder, version)
+    _built.pop(name, None)
+
+
+def invalidate(name: Optional[str] = None) -> None:
+    if name is None:
+        _built.clear()
+    else:
+        _built.pop(name, None)
+
+
+def index(name: str) -> Index:
+    builder, version = _builders[name]
+    ver = version() if version else None
+    hit = _built.get(name)
+    if hit is not None and hit[0] == ver:
+        return hit[1]
+    try:
+        idx = Index(builder())
+    except Exception as e:
+        log.info(f"[autocomplete] building {name!r} failed: {e!r}")
+        idx = Index(())
+    _built[name] = (ver, idx)
+    return idx
+
+
+def search(name: str, query: str, limit: int = MAX_CHOICES) -> List[Tuple[str, str]]:
+    return index(name).search(query, limit)
+
+
+def choices(name: str, query: str, limit: int = MAX_CHOICES) -> List[app_commands.Choice[str]]:
+    return [app_commands.Choice(name=label, value=value) for label, value in search(name, query, limit)]
+
+
+# ---------- Built-in catalogs ----------
+
+def _status_entries():
+    from ..status import list_registered
+    for key, cls in sorted(list_registered().items()):
+        yield key, key, (key, getattr(cls, "name", "") or "")
+
+
+def _status_version():
+    from ..status import list_registered
+    return len(list_registered())
+
+
+def _role_entries():
+    roles_def = getattr(game, "roles_def", None) or {}
+    roles = roles_def.get("roles") if isinstance(roles_def, dict) else roles_def
+    for r in roles or []:
+        if not isinstance(r, dict):
+            continue
+        code = r.get("code") or r.get("id") or r.get("name")
+        if not isinstance(code, str) or not code.strip():
+            continue
+        name = r.get("name") if isinstance(r.get("name"), str) else ""
+        label = f"{name} ({code})" if name and name != code else code
+        keys = [code, r.get("id"), name] + [a for a in (r.get("aliases") or []) if isinstance(a, str)]
+        yield label, code, [k for k in keys if isinstance(k, str)]
+
+
+def _role_version():
+    return id(getattr(game, "roles_def", None)), id(getattr(game, "roles", None))
+
+
+def _team_entries():
+    teams = {}
+    roles_def = getattr(game, "roles_def", None) or {}
+    roles = roles_def.get("roles") if isinstance(roles_def, dict) else roles_def
+    for r in roles or []:
+        team = isinstance(r, dict) and (r.get("team") or r.get("alignment"))
+        if isinstance(team, str) and team.strip():
+            teams.setdefault(team.strip().lower(), None)
+    for team in sorted(teams):
+        yield team, team, (team,)
+
+
+def _player_entries():
+    for uid, p in (getattr(game, "players", None) or {}).items():
+        name = p.get("name") or uid
+        keys = [name] + list(p.get("aliases") or [])
+        if p.get("alias"):
+            keys.append(p["alias"])
+        yield name, uid, keys
+
+
+def _player_version():
+    players = getattr(game, "players", None)
+    return id(players), len(players or ())
+
+
+register_catalog("statuses", _status_entries, version=_status_version)
+register_catalog("roles", _role_entries, version=_role_version)
+register_catalog("teams", _team_entries, version=_role_version)
+register_catalog("players", _player_entries, version=_player_version)
+
+
+@events.subscribe(events.RosterChanged)
+def _on_roster(ev: events.Event) -> None:
+    invalidate("players")
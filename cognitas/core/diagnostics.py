@@ -0,0 +1,206 @@
+# cognitas/core/diagnostics.py
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .state import game
+
+# -------------------------------------------------------------------
+# In-process diagnostics (cogs/debugcog.py exposes them as /debug ...)
+# -------------------------------------------------------------------
+# - memory: tracemalloc start/stop + top allocation sites (diffed against the
+#   snapshot taken at start), size of each persisted game section, RSS, gc.
+# - profile: a sampling profiler; a helper thread reads the event loop
+#   thread's stack every PROFILE_INTERVAL seconds and folds the samples into
+#   collapsed stacks ("outer;inner;leaf count", flamegraph.pl / speedscope).
+# - tasks: every live asyncio task, flagging phase timers that no longer
+#   belong to the current phase (orphans).
+
+TRACE_FRAMES = 10
+PROFILE_INTERVAL = 0.005   # seconds between samples
+PROFILE_MAX_SECONDS = 60
+
+_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+# ---------- Memory ----------
+
+def trace_start(frames: int = TRACE_FRAMES) -> bool:
+    """Start tracemalloc (False if it was already running)."""
+    global _baseline
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    _baseline = tracemalloc.take_snapshot()
+    return True
+
+
+def trace_stop() -> None:
+    global _baseline
+    tracemalloc.stop()
+    _baseline = None
+
+
+def _site(stat) -> str:
+    frame = stat.traceback[0]
+    path = frame.filename
+    for root in sys.path:
+        if root and path.startswith(root):
+            path = os.path.relpath(path, root)
+            break
+    return f"{path}:{frame.lineno}"
+
+
+def top_allocations(limit: int = 10) -> List[Tuple[str, int, int]]:
+    """[(site, size_bytes, count)] growth since trace_start(); [] when not tracing."""
+    if not tracemalloc.is_tracing():
+        return []
+    snap = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    if _baseline is not None:
+        stats = snap.compare_to(_baseline, "lineno")
+        return [(_site(s), s.size_diff, s.count_diff) for s in stats[:limit] if s.size_diff > 0]
+    return [(_site(s), s.size, s.count) for s in snap.statistics("lineno")[:limit]]
+
+
+def section_sizes() -> Dict[str, int]:
+    """Serialized size (bytes) of each persisted game section, largest first."""
+    from .storage import _build_payload
+    out: Dict[str, int] = {}
+    for key, value in _build_payload().items():
+        try:
+            out[key] = len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        except Exception:
+            out[key] = -1
+    return dict(sorted(out.items(), key=lambda kv: -kv[1]))
+
+
+def process_memory() -> Dict[str, Any]:
+    info: Dict[str, Any] = {"gc_counts": gc.get_count(), "gc_objects": len(gc.get_objects())}
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    k, v = line.split(":", 1)
+                    info[k] = v.strip()
+    except OSError:
+        try:
+            import resource
+            info["maxrss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        except Exception:
+            pass
+    if tracemalloc.is_tracing():
+        cur, peak = tracemalloc.get_traced_memory()
+        info["traced"], info["traced_peak"] = cur, peak
+    return info
+
+
+# ---------- CPU profile ----------
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _sample(thread_id: int, seconds: float, interval: float) -> Tuple[Counter, int]:
+    stacks: Counter = Counter()
+    n = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        frame = sys._current_frames().get(thread_id)
+        if frame is None:
+            break
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        stacks[";".join(reversed(labels))] += 1
+        n += 1
+        time.sleep(interval)
+    return stacks, n
+
+
+async def profile_loop(seconds: float, *, interval: float = PROFILE_INTERVAL) -> Tuple[str, int, List[Tuple[str, int]]]:
+    """
+    Sample the event loop thread for `seconds` (capped at PROFILE_MAX_SECONDS).
+    Returns (collapsed stacks text, sample count, [(leaf function, samples)] top 10).
+    """
+    seconds = max(1.0, min(float(seconds), PROFILE_MAX_SECONDS))
+    loop_thread = threading.get_ident()
+    result: Dict[str, Any] = {}
+
+    def _run():
+        result["stacks"], result["n"] = _sample(loop_thread, seconds, interval)
+
+    sampler = threading.Thread(target=_run, name="asdrubot-profiler", daemon=True)
+    sampler.start()
+    while sampler.is_alive():
+        await asyncio.sleep(0.1)
+
+    stacks: Counter = result.get("stacks") or Counter()
+    leaves: Counter = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    text = "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+    return text, int(result.get("n") or 0), leaves.most_common(10)
+
+
+# ---------- Tasks ----------
+
+def _coro_info(task: asyncio.Task) -> Tuple[str, Dict[str, Any], str]:
+    coro = task.get_coro()
+    name = getattr(coro, "__qualname__", None) or type(coro).__name__
+    frame = getattr(coro, "cr_frame", None)
+    where = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}" if frame else "-"
+    return name, (frame.f_locals if frame else {}), where
+
+
+def _orphan_reason(task: asyncio.Task, name: str, local: Dict[str, Any]) -> Optional[str]:
+    if name == "_timer_worker":
+        if task not in (getattr(game, "day_timer_task", None), getattr(game, "night_timer_task", None)):
+            return "reminder worker not referenced by game.day/night_timer_task"
+    elif name == "_autoclose_after":
+        phase = local.get("phase")
+        if phase != getattr(game, "phase", None):
+            return f"auto-close for {phase} while the phase is {getattr(game, 'phase', None)}"
+        current = getattr(game, f"{phase}_deadline_epoch", None)
+        if current and local.get("unix_deadline") != current:
+            return "auto-close for a superseded deadline"
+    return None
+
+
+def task_report() -> List[Dict[str, Any]]:
+    """One row per live task: name, coroutine, where it is suspended, orphan reason."""
+    rows = []
+    current = asyncio.current_task()
+    seen_autoclose = set()
+    for t in asyncio.all_tasks():
+        if t is current:
+            continue
+        coro, local, where = _coro_info(t)
+        orphan = _orphan_reason(t, coro, local)
+        if coro == "_autoclose_after" and orphan is None:
+            key = (local.get("phase"), local.get("unix_deadline"))
+            if key in seen_autoclose:
+                orphan = "duplicate auto-close for the same deadline"
+            seen_autoclose.add(key)
+        rows.append({
+            "name": t.get_name(),
+            "coro": coro,
+            "where": where,
+            "done": t.done(),
+            "orphan": orphan,
+        })
+    rows.sort(key=lambda r: (r["orphan"] is None, r["coro"], r["name"]))
+    return rows
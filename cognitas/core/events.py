@@ -0,0 +1,171 @@
+# cognitas/core/events.py
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# In-process pub/sub for state changes.
+#
+# Mutations publish() typed events; nothing runs inline. Everything published
+# during one synchronous step is dispatched as one batch on the next loop
+# iteration (or by an explicit `await flush()`), in publish order. Without a
+# running loop (scripts/tools) publish() dispatches at once, on a throwaway loop.
+# Handlers may be sync or async; a failing handler never affects the others.
+#
+#   from .events import subscribe, PlayerDied
+#
+#   @subscribe(PlayerDied)
+#   def _on_death(ev: PlayerDied): ...
+#
+# Subscribing to Event receives everything.
+# -------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Event:
+    pass
+
+@dataclass(frozen=True)
+class VoteCast(Event):
+    voter: str
+    target: str
+
+@dataclass(frozen=True)
+class VoteCleared(Event):
+    voter: Optional[str] = None   # None = every vote was cleared
+
+@dataclass(frozen=True)
+class PlayerDied(Event):
+    uid: str
+    reason: str
+
+@dataclass(frozen=True)
+class PlayerRevived(Event):
+    uid: str
+
+@dataclass(frozen=True)
+class RosterChanged(Event):
+    uid: Optional[str] = None     # registered, unregistered, renamed or aliases edited
+
+@dataclass(frozen=True)
+class StatusApplied(Event):
+    uid: str
+    status: str
+    stacks: int = 1
+    remaining: int = 0
+    source: Optional[str] = None
+
+@dataclass(frozen=True)
+class StatusExpired(Event):
+    uid: str
+    status: str
+    healed: bool = False          # True when removed by a cleanse, False on natural expiry
+
+@dataclass(frozen=True)
+class ActionEnqueued(Event):
+    phase: str
+    number: int
+    uid: str
+    target: Optional[str] = None
+    action: str = "act"
+
+@dataclass(frozen=True)
+class PhaseChanged(Event):
+    phase: str
+    number: int
+
+@dataclass(frozen=True)
+class DayEnded(Event):
+    number: int
+    lynched: Optional[str] = None
+    by_threshold: bool = False
+    tally: Tuple[Tuple[str, int], ...] = ()   # (target uid, voters) at close
+
+
+Handler = Callable[[Event], Any]
+
+_handlers: Dict[Type[Event], List[Handler]] = {}
+_pending: List[Event] = []
+_scheduled = False
+_tasks: Set[asyncio.Task] = set()  # asyncio keeps only weak refs to tasks
+
+
+def subscribe(event_type: Type[Event], handler: Optional[Handler] = None):
+    """Register a handler for an event type (usable as a decorator)."""
+    def _add(fn: Handler) -> Handler:
+        lst = _handlers.setdefault(event_type, [])
+        if fn not in lst:
+            lst.append(fn)
+        return fn
+    return _add(handler) if handler is not None else _add
+
+
+def unsubscribe(event_type: Type[Event], handler: Handler) -> None:
+    try:
+        _handlers.get(event_type, []).remove(handler)
+    except ValueError:
+        pass
+
+
+def publish(event: Event) -> None:
+    """Queue an event; the batch is dispatched once the current step yields."""
+    global _scheduled
+    _pending.append(event)
+    if _scheduled:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_drain())  # no loop (scripts/tools): dispatch now
+        return
+    _scheduled = True
+    loop.call_soon(_spawn_flush, loop)
+
+
+def _spawn_flush(loop: asyncio.AbstractEventLoop) -> None:
+    task = loop.create_task(flush(), name="asdrubot-events")
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def _drain() -> None:
+    """flush() until nothing is left, including events handlers publish meanwhile."""
+    global _scheduled
+    try:
+        while _pending:
+            await flush()
+    finally:
+        _scheduled = False  # a flush scheduled here dies with this loop
+
+
+def _targets(event: Event) -> List[Handler]:
+    out: List[Handler] = []
+    for cls in type(event).__mro__:
+        out.extend(_handlers.get(cls, ()))
+    return out
+
+
+async def flush() -> int:
+    """Dispatch every queued event now. Returns how many were delivered."""
+    global _pending, _scheduled
+    batch, _pending = _pending, []
+    _scheduled = False
+    for ev in batch:
+        waits = []
+        for fn in _targets(ev):
+            try:
+                res = fn(ev)
+                if inspect.isawaitable(res):
+                    waits.append(res)
+            except Exception as e:
+                log.error(f"[events] {getattr(fn, '__name__', fn)} failed on {type(ev).__name__}: {e!r}")
+        if waits:
+            for r in await asyncio.gather(*waits, return_exceptions=True):
+                if isinstance(r, Exception):
+                    log.error(f"[events] async handler failed on {type(ev).__name__}: {r!r}")
+    return len(batch)
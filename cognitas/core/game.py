@@ -1,10 +1,12 @@
 import os
+import time
 import discord
 from .state import game      
 from .roles import load_roles
 from .storage import save_state
 from .logs import log_event
 from .infra import get_infra
+from . import archive
 import unicodedata
 
 
@@ -133,7 +135,10 @@ async def start(
     """
     # Imports necesarios dentro de la función para evitar ciclos
     from ..expansions import load_expansion_instance
-    from .infra import get_infra, set_infra, set_roles
+    from .infra import get_infra, set_infra, set_roles, sync_alive_dead_roles
+
+    # 0. Una partida sin terminar que se sobrescribe se archiva como "reset"
+    await archive.archive_current(guild_id=ctx.guild.id, result="reset", reason="game_start")
     
     # 1. Cargar configuración y expansión
     game.profile = profile.lower()
@@ -149,9 +154,11 @@ async def start(
     game.votes = {}
     game.end_day_votes = [] 
     game.status_map = {} 
-    game.status_log = []
+    game.game_id = int(time.time())  # scopes status history (status/audit.py)
     game.day_actions = {}
     game.night_actions = {}
+    game.resolved_nights = []
+    game.vote_board = None
     
     game.game_over = False
     game.current_day_number = 1
@@ -195,11 +202,17 @@ async def start(
 
     # También llamamos al helper set_roles por compatibilidad si se especificaron
     if alive_role_id or dead_role_id:
-        await set_roles(guild_id, alive=alive_role_id, dead=dead_role_id)
+        set_roles(guild_id, alive=alive_role_id, dead=dead_role_id)
 
     # 4. Guardado final y Feedback
     await save_state()
 
+    # Roles Vivo/Muerto de todos los jugadores registrados: un solo lote
+    try:
+        await sync_alive_dead_roles(ctx.guild)
+    except Exception:
+        pass
+
     roles_msg = "Roles cargados."
     if alive_role_id and dead_role_id:
         roles_msg += " Roles Vivo/Muerto vinculados."
@@ -218,6 +231,19 @@ async def hard_reset(ctx_or_interaction):
     - commands.Context (ctx)  -> uses ctx.reply(...)
     - discord.Interaction     -> uses interaction.response / followup
     """
+    guild = getattr(ctx_or_interaction, "guild", None)
+
+    # 0) archive the game being thrown away (no-op if it was finished and archived)
+    await archive.archive_current(guild_id=getattr(guild, "id", None), result="reset")
+
+    # 0b) strip Alive/Dead roles from everyone who was playing (one batch)
+    try:
+        from .infra import sync_alive_dead_roles
+        if guild and game.players:
+            await sync_alive_dead_roles(guild, {uid: None for uid in game.players})
+    except Exception:
+        pass
+
     # 1) clear memory
     game.players = {}
     game.votes = {}
@@ -230,6 +256,10 @@ async def hard_reset(ctx_or_interaction):
     game.roles_def = {}
     game.roles = {}
     game.night_actions = {}
+    game.resolved_nights = []
+    game.vote_board = None
+    game.status_map = {}
+    game.game_id = None
     game.game_over = False
     # TODO: cancel timers if they exist
 
@@ -269,11 +299,22 @@ async def hard_reset(ctx_or_interaction):
         pass
  
 
-async def finish(ctx, *, reason: str | None = None):
+async def finish(ctx, *, reason: str | None = None, winner: str | None = None):
+    """
+    End the game and archive it (core/archive.py). `winner` is a team
+    ("town", "mafia"...); if omitted it is inferred when every survivor
+    shares one team.
+    """
     game.game_over = True
+    path = await archive.archive_current(guild_id=ctx.guild.id, result="finished", reason=reason, winner=winner)
     await save_state()
-    await ctx.reply(f"🏁 **Juego terminado.** {('Razón: ' + reason) if reason else ''}".strip())
-    await log_event(ctx.bot, ctx.guild.id, "GAME_FINISH", reason=reason or "-")
+    parts = ["🏁 **Juego terminado.**"]
+    if reason:
+        parts.append(f"Razón: {reason}")
+    if path:
+        parts.append("Partida archivada.")
+    await ctx.reply(" ".join(parts))
+    await log_event(ctx.bot, ctx.guild.id, "GAME_FINISH", reason=reason or "-", winner=winner or "-")
 
 
 async def who(ctx, member: discord.Member | None = None):
@@ -289,7 +330,7 @@ async def who(ctx, member: discord.Member | None = None):
         alive = "✅" if pdata.get("alive", True) else "☠️"
         return await ctx.reply(f"<@{uid}> — **{pdata.get('name','?')}** | Role: **{role}** | {alive}")
     # quick list if no member is passed
-    alive = [u for u, p in game.players.items() if p.get("alive", True)]
+    alive = game.alive_ids()
     await ctx.reply(f"Jugadores Vivos: {', '.join(f'<@{u}>' for u in alive) if alive else '—'}")
 
 async def assign_role(ctx, member: discord.Member, role_name: str):
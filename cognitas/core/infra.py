@@ -1,9 +1,11 @@
 # cognitas/core/infra.py
 from __future__ import annotations
 from typing import Optional, Dict, Any, Tuple, List
+import asyncio
 import discord
 
 from .state import game
+from . import members
 
 import logging
 log = logging.getLogger(__name__)
@@ -148,6 +150,11 @@ async def ensure_game_channel(guild: discord.Guild):
 
     return ch
 
+def _resolve_game_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
+    """Game channel from infra, else the legacy game.game_channel_id. No API calls."""
+    cid = (get_infra(guild.id).get("channels") or {}).get("game") or getattr(game, "game_channel_id", None)
+    return guild.get_channel(int(cid)) if cid else None
+
 async def ensure_game_channel(guild: discord.Guild, *, category: Optional[discord.CategoryChannel] = None) -> discord.TextChannel:
     infra = get_infra(guild.id)
     ch = _resolve_game_channel(guild)
@@ -262,40 +269,88 @@ async def ensure_role(
     )
     return role
 
+# ---- Alive/Dead role sync ----
+# Role objects are cached per guild (keyed by the configured ids) and every
+# member change is a single member.edit(roles=...) diffed against the
+# member's cached roles. Batches run concurrently under a semaphore.
+
+ROLE_SYNC_CONCURRENCY = 5
+_role_cache: Dict[int, Tuple[tuple, Optional[discord.Role], Optional[discord.Role]]] = {}
+
+def resolve_role_ids(guild_id: int) -> Dict[str, Optional[int]]:
+    """Alive/Dead role ids: game attributes first, infra as fallback."""
+    ids = get_role_ids(guild_id)
+    alive = getattr(game, "alive_role_id", None) or ids.get("alive")
+    dead = getattr(game, "dead_role_id", None) or ids.get("dead")
+    return {"alive": int(alive) if alive else None, "dead": int(dead) if dead else None}
+
+def alive_dead_roles(guild: discord.Guild) -> Tuple[Optional[discord.Role], Optional[discord.Role]]:
+    ids = resolve_role_ids(guild.id)
+    key = (ids["alive"], ids["dead"])
+    hit = _role_cache.get(guild.id)
+    if hit and hit[0] == key and all(r is None or guild.get_role(r.id) is r for r in hit[1:]):
+        return hit[1], hit[2]
+    r_alive = guild.get_role(ids["alive"]) if ids["alive"] else None
+    r_dead = guild.get_role(ids["dead"]) if ids["dead"] else None
+    _role_cache[guild.id] = (key, r_alive, r_dead)
+    return r_alive, r_dead
+
+def desired_roles(member: discord.Member, alive: Optional[bool],
+                  r_alive: Optional[discord.Role], r_dead: Optional[discord.Role]) -> Optional[List[discord.Role]]:
+    """
+    New role list for `member` (alive=True/False, None strips both), or None
+    if nothing changes.
+    """
+    want = {True: r_alive, False: r_dead}.get(alive)
+    drop = {r for r in (r_alive, r_dead) if r is not None and r is not want}
+    current = [r for r in member.roles if not r.is_default()]
+    new = [r for r in current if r not in drop]
+    if want is not None and want not in new:
+        new.append(want)
+    return None if len(new) == len(current) and set(new) == set(current) else new
+
+async def sync_alive_dead_roles(
+    guild: discord.Guild,
+    targets: Optional[Dict[str, Optional[bool]]] = None,
+    *,
+    concurrency: int = ROLE_SYNC_CONCURRENCY) -> int:
+    """
+    Bring Alive/Dead roles in line with `targets` ({uid: alive|None}); by
+    default every player from game.players. Returns members edited.
+    """
+    if targets is None:
+        targets = {uid: bool(p.get("alive", True)) for uid, p in (game.players or {}).items()}
+    r_alive, r_dead = alive_dead_roles(guild)
+    if not targets or not (r_alive or r_dead):
+        return 0
+
+    sem = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def _one(uid: str, alive: Optional[bool]) -> bool:
+        async with sem:
+            try:
+                member = await members.resolve(guild, uid)
+                if member is None:
+                    return False
+                new = desired_roles(member, alive, r_alive, r_dead)
+                if new is None:
+                    return False
+                updated = await member.edit(roles=new, reason="Asdrubot: alive/dead role sync")
+                if updated is not None:
+                    members.remember(updated)
+                else:
+                    members.forget(guild.id, uid)
+                return True
+            except Exception as e:
+                log.info(f"[infra] role sync failed for {uid}: {e!r}")
+                return False
+
+    done = await asyncio.gather(*(_one(str(uid), a) for uid, a in targets.items()))
+    return sum(1 for ok in done if ok)
+
 async def apply_alive_dead_role(
     guild: discord.Guild,
     member_id: int,
     *,
     alive: bool) -> None:
-    
-    try:
-        member = guild.get_member(member_id) or await guild.fetch_member(member_id)
-    except Exception:
-        return
-
-    ids = get_role_ids(guild.id)
-    # Buscar IDs guardados
-    id_alive = ids.get("alive")
-    id_dead = ids.get("dead")
-    
-    # Resolver objetos Role
-    r_alive = guild.get_role(id_alive) if id_alive else None
-    r_dead  = guild.get_role(id_dead)  if id_dead  else None
-
-    if not (r_alive or r_dead):
-        return
-
-    try:
-        if alive:
-            add = [r_alive] if r_alive and r_alive not in member.roles else []
-            rem = [r_dead]  if r_dead  and r_dead  in member.roles else []
-        else:
-            add = [r_dead]  if r_dead  and r_dead  not in member.roles else []
-            rem = [r_alive] if r_alive and r_alive in member.roles else []
-
-        if add:
-            await member.add_roles(*add, reason="Asdrubot: alive/dead role swap")
-        if rem:
-            await member.remove_roles(*rem, reason="Asdrubot: alive/dead role swap")
-    except Exception:
-        pass
+    await sync_alive_dead_roles(guild, {str(member_id): alive})
@@ -0,0 +1,170 @@
+# cognitas/core/interactions.py
+from __future__ import annotations
+
+import asyncio
+import time
+import logging
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Optional
+
+import discord
+
+from .. import config as cfg
+from . import throttle
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Slash interactions
+# -------------------------------------------------------------------
+# InteractionCtx: the ctx-style adapter every cog hands to core functions
+# (.reply/.send/.guild/.bot/.channel/.author). Handlers do not need to defer:
+# if no response was sent INTERACTION_DEFER_BUDGET seconds after Discord
+# created the interaction, the adapter defers on its own and later replies
+# become followups. Fast handlers answer with a single response call.
+#
+# Latency: bot.py's command tree calls begin() before every app command and
+# end() when it completes or fails; latency_summary() reports per command.
+
+LATENCY_SAMPLES = 500  # per command (rolling)
+
+_started: Dict[int, float] = {}
+_latency: Dict[str, Deque[float]] = {}
+_failures: Counter = Counter()
+_auto_defers: Counter = Counter()
+
+
+def _elapsed_since_created(interaction: discord.Interaction) -> float:
+    try:
+        return max(0.0, (discord.utils.utcnow() - interaction.created_at).total_seconds())
+    except Exception:
+        return 0.0
+
+
+def _command_name(interaction: discord.Interaction) -> str:
+    cmd = getattr(interaction, "command", None)
+    return getattr(cmd, "qualified_name", None) or "?"
+
+
+class InteractionCtx:
+    """
+    Minimal context adapter so core functions that expect a 'ctx' with
+    .reply(), .send(), .guild, .bot, .channel, .author keep working.
+    ephemeral: visibility used if the adapter has to defer by itself.
+    """
+
+    def __init__(self, interaction: discord.Interaction, *, ephemeral: bool = False, budget: Optional[float] = None):
+        self._i = interaction
+        self.interaction = interaction
+        self.guild: discord.Guild | None = interaction.guild
+        self.bot: discord.Client = interaction.client  # type: ignore
+        self.channel = interaction.channel
+        self.author = interaction.user
+        self.message = None  # compat
+        self.ephemeral = ephemeral
+        self._deferring: Optional[asyncio.Task] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        budget = cfg.INTERACTION_DEFER_BUDGET if budget is None else budget
+        if not interaction.response.is_done():
+            try:
+                delay = max(0.0, budget - _elapsed_since_created(interaction))
+                self._timer = asyncio.get_running_loop().call_later(delay, self._auto_defer)
+            except RuntimeError:
+                pass
+
+    # ---- auto-defer ----
+    def _auto_defer(self) -> None:
+        self._timer = None
+        if self._i.response.is_done() or self._deferring is not None:
+            return
+        self._deferring = asyncio.get_running_loop().create_task(self._defer())
+
+    async def _defer(self) -> None:
+        try:
+            await self._i.response.defer(ephemeral=self.ephemeral, thinking=True)
+            _auto_defers[_command_name(self._i)] += 1
+        except (discord.InteractionResponded, discord.HTTPException):
+            pass
+
+    async def _settle(self) -> None:
+        """Wait for an in-flight auto-defer so we never race it."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._deferring is not None:
+            await self._deferring
+
+    async def defer(self, *, ephemeral: Optional[bool] = None) -> None:
+        await self._settle()
+        if not self._i.response.is_done():
+            await self._i.response.defer(ephemeral=self.ephemeral if ephemeral is None else ephemeral, thinking=True)
+
+    # ---- replies ----
+    async def reply(self, content: str = None, **kwargs):
+        await self._settle()
+        if kwargs.get("embed") is not None:
+            # Served back to throttled callers (core/throttle.py)
+            throttle.remember_embed(_command_name(self._i), self._i.guild_id, kwargs["embed"])
+        try:
+            # Prefer followup if we've already responded or deferred
+            if self._i.response.is_done():
+                return await self._i.followup.send(content or "\u200b", **kwargs)
+            kwargs.setdefault("ephemeral", self.ephemeral)
+            return await self._i.response.send_message(content or "\u200b", **kwargs)
+        except Exception:
+            # Fallback to channel send (ephemeral has no meaning there)
+            kwargs.pop("ephemeral", None)
+            try:
+                if self.channel:
+                    return await self.channel.send(content or "\u200b", **kwargs)
+            except Exception:
+                pass
+
+    async def send(self, content: str = None, **kwargs):
+        return await self.reply(content, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        return
+
+
+# ---------- Latency tracking ----------
+
+def begin(interaction: discord.Interaction) -> None:
+    _started[interaction.id] = time.perf_counter()
+
+
+def end(interaction: discord.Interaction, *, failed: bool = False) -> Optional[float]:
+    t0 = _started.pop(interaction.id, None)
+    if t0 is None:
+        return None
+    name = _command_name(interaction)
+    dt = time.perf_counter() - t0
+    _latency.setdefault(name, deque(maxlen=LATENCY_SAMPLES)).append(dt)
+    if failed:
+        _failures[name] += 1
+    if dt > cfg.INTERACTION_DEFER_BUDGET:
+        log.info(f"[interactions] /{name} took {dt:.2f}s")
+    return dt
+
+
+def _pct(sorted_vals, p: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = max(0, min(len(sorted_vals) - 1, int(round(p / 100.0 * len(sorted_vals) + 0.5)) - 1))
+    return sorted_vals[k]
+
+
+def latency_summary() -> Dict[str, Dict[str, Any]]:
+    """{command: {n, p50, p95, p99, max, failures, auto_defers}} over the recent window (seconds)."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, samples in _latency.items():
+        s = sorted(samples)
+        out[name] = {
+            "n": len(s),
+            "p50": _pct(s, 50), "p95": _pct(s, 95), "p99": _pct(s, 99),
+            "max": s[-1] if s else 0.0,
+            "failures": _failures.get(name, 0),
+            "auto_defers": _auto_defers.get(name, 0),
+        }
+    return out
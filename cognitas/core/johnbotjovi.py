@@ -27,6 +27,10 @@ _IMG_DIR = os.path.join(_BASE_DIR, "img")
 # Track used background files to avoid immediate repeats
 _USED: set[str] = set()
 
+# Speculative renders for the current Day: uid -> (day, task -> PNG bytes | None)
+_PRERENDER: dict[str, tuple[int, asyncio.Task]] = {}
+PRERENDER_MAX = 3  # vote leaders rendered ahead of time at most
+
 
 # ---------------------------------------------------------------------
 # Helpers
@@ -121,7 +125,7 @@ async def _read_avatar_bytes(member: discord.Member, size: int = 128) -> bytes |
 # Public API
 # ---------------------------------------------------------------------
 
-def _generate_lynch_image(avatar_bytes: bytes, member_id: int) -> discord.File:
+def _render_lynch_png(avatar_bytes: bytes) -> bytes:
     """
     Synchronous CPU-bound image generation logic.
     Run this in an executor to avoid blocking the event loop.
@@ -154,17 +158,81 @@ def _generate_lynch_image(avatar_bytes: bytes, member_id: int) -> discord.File:
     # 4) Output
     buf = io.BytesIO()
     base.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
-    return discord.File(buf, filename=f"lynch_{member_id}.png")
+    return buf.getvalue()
+
+
+def _generate_lynch_image(avatar_bytes: bytes, member_id: int) -> discord.File:
+    return discord.File(io.BytesIO(_render_lynch_png(avatar_bytes)), filename=f"lynch_{member_id}.png")
+
+
+async def _render_bytes(member: discord.Member) -> bytes | None:
+    avatar_bytes = await _read_avatar_bytes(member, size=128)
+    if not avatar_bytes:
+        return None
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(_render_lynch_png, avatar_bytes))
+
 
+# ---------------------------------------------------------------------
+# Speculative pre-rendering (vote leaders)
+# ---------------------------------------------------------------------
 
-async def lynch(member: discord.Member) -> Optional[discord.File]:
+def prerender(member: discord.Member, *, day: int) -> None:
+    """
+    Start rendering `member`'s poster in the background so end_day can post
+    it at once. No-op if already cached for this day or the cache is full.
+    """
+    if not _PIL_OK:
+        return
+    uid = str(member.id)
+    cur = _PRERENDER.get(uid)
+    if cur and cur[0] == day and not cur[1].cancelled():
+        return
+    if len(_PRERENDER) >= PRERENDER_MAX:
+        return
+    try:
+        task = asyncio.get_running_loop().create_task(_render_bytes(member), name=f"asdrubot-poster-{uid}")
+    except RuntimeError:
+        return
+    _PRERENDER[uid] = (day, task)
+
+
+def keep_prerenders(uids, *, day: int) -> None:
+    """Drop (and cancel) every speculative render not for `uids` on `day`."""
+    keep = {str(u) for u in uids}
+    for uid, (d, task) in list(_PRERENDER.items()):
+        if uid not in keep or d != day:
+            task.cancel()
+            _PRERENDER.pop(uid, None)
+
+
+def clear_prerenders() -> None:
+    keep_prerenders((), day=-1)
+
+
+async def _take_prerender(member: discord.Member) -> bytes | None:
+    entry = _PRERENDER.pop(str(member.id), None)
+    if entry is None:
+        return None
+    try:
+        return await entry[1]  # usually done already; otherwise it is ahead of a fresh render
+    except (asyncio.CancelledError, Exception):
+        return None
+
+
+async def lynch(member: discord.Member, *, use_prerender: bool = False) -> Optional[discord.File]:
     """
     Async wrapper that offloads image processing to a thread.
+    use_prerender: take the speculative render for this member if there is one.
     """
     if not _PIL_OK:
         return None
 
+    if use_prerender:
+        data = await _take_prerender(member)
+        if data:
+            return discord.File(io.BytesIO(data), filename=f"lynch_{member.id}.png")
+
     # 1) Fetch bytes (Network I/O is async, keep it here)
     avatar_bytes = await _read_avatar_bytes(member, size=128)
     if not avatar_bytes:
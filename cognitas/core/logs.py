@@ -1,10 +1,21 @@
 # cognitas/core/logs.py
 from __future__ import annotations
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
 import discord
+from .. import config as cfg
 from .state import game
 from .storage import save_state
 from .infra import get_infra
 
+log = logging.getLogger(__name__)
 
 # En cognitas/core/logs.py
 
@@ -54,64 +65,250 @@ def _resolve_logs_channel(bot: discord.Client, guild_id: int) -> discord.abc.Mes
     return None
 
 
-async def log_event(bot: discord.Client, guild_id: int, kind: str, **data):
-    """
-    Send an embed to the configured log channel (if available).
-    kind: 'PHASE_START', 'PHASE_END', 'VOTE_CAST', 'VOTE_CLEAR', 'VOTES_CLEARED',
-          'END_DAY_REQUEST', 'LYNCH', 'GAME_START', 'GAME_RESET', 'GAME_FINISH', 'ASSIGN'
-    """
-    chan_id = getattr(game, "admin_log_channel_id", None)
-    if not chan_id:
-        return  # logging disabled
-    guild = bot.get_guild(guild_id)
-    if not guild:
-        return
-    chan = _resolve_logs_channel(bot, guild_id)
-    if not chan:
-        return
+# -------------------------------------------------------------------
+# Embed rendering
+# -------------------------------------------------------------------
+COLOR_MAP = {
+    "PHASE_START": 0x2ecc71,
+    "PHASE_END": 0xe67e22,
+    "VOTE_CAST": 0x3498db,
+    "VOTE_CLEAR": 0x95a5a6,
+    "VOTES_CLEARED": 0x95a5a6,
+    "END_DAY_REQUEST": 0xf1c40f,
+    "LYNCH": 0xc0392b,
+    "GAME_START": 0x1abc9c,
+    "GAME_RESET": 0x9b59b6,
+    "GAME_FINISH": 0x7f8c8d,
+    "ASSIGN": 0x8e44ad,
+}
+TITLE_MAP = {
+    "PHASE_START": "Phase started",
+    "PHASE_END": "Phase ended",
+    "VOTE_CAST": "Vote cast",
+    "VOTE_CLEAR": "Vote cleared",
+    "VOTES_CLEARED": "All votes cleared",
+    "END_DAY_REQUEST": "End-day request (2/3)",
+    "LYNCH": "Lynch",
+    "GAME_START": "Game started",
+    "GAME_RESET": "Game reset",
+    "GAME_FINISH": "Game finished",
+    "ASSIGN": "Role assigned",
+}
+
+MAX_EMBEDS_PER_MESSAGE = 10   # Discord hard limit
+MAX_EMBED_CHARS_PER_MESSAGE = 6000  # Discord hard limit, summed over every embed
+_COMPACT_DESC_LIMIT = 4000    # stay under the 4096-char embed description cap
 
-    color_map = {
-        "PHASE_START": 0x2ecc71,
-        "PHASE_END": 0xe67e22,
-        "VOTE_CAST": 0x3498db,
-        "VOTE_CLEAR": 0x95a5a6,
-        "VOTES_CLEARED": 0x95a5a6,
-        "END_DAY_REQUEST": 0xf1c40f,
-        "LYNCH": 0xc0392b,
-        "GAME_START": 0x1abc9c,
-        "GAME_RESET": 0x9b59b6,
-        "GAME_FINISH": 0x7f8c8d,
-        "ASSIGN": 0x8e44ad,
-    }
-    title_map = {
-        "PHASE_START": "Phase started",
-        "PHASE_END": "Phase ended",
-        "VOTE_CAST": "Vote cast",
-        "VOTE_CLEAR": "Vote cleared",
-        "VOTES_CLEARED": "All votes cleared",
-        "END_DAY_REQUEST": "End-day request (2/3)",
-        "LYNCH": "Lynch",
-        "GAME_START": "Game started",
-        "GAME_RESET": "Game reset",
-        "GAME_FINISH": "Game finished",
-        "ASSIGN": "Role assigned",
-    }
 
+def _fmt_value(k: str, v: Any) -> str:
+    # Render user IDs as mentions if they look like IDs
+    if isinstance(v, str) and v.isdigit() and k.lower().endswith(("id", "uid", "user", "target")):
+        return f"<@{v}>"
+    return str(v)
+
+
+def _build_embed(entry: dict) -> discord.Embed:
+    kind = entry["kind"]
     embed = discord.Embed(
-        title=title_map.get(kind, kind),
-        color=color_map.get(kind, 0x34495e),
+        title=TITLE_MAP.get(kind, kind),
+        color=COLOR_MAP.get(kind, 0x34495e),
+        timestamp=datetime.fromtimestamp(entry["ts"], tz=timezone.utc),
     )
-
     # Useful common fields
-    day_no = getattr(game, "current_day_number", None)
-    if day_no:
-        embed.add_field(name="Day", value=str(day_no), inline=True)
-
+    if entry.get("day"):
+        embed.add_field(name="Day", value=str(entry["day"]), inline=True)
     # Add payload key/value pairs
-    for k, v in data.items():
-        # Render user IDs as mentions if they look like IDs
-        if isinstance(v, str) and v.isdigit() and k.lower().endswith(("id", "uid", "user", "target")):
-            v = f"<@{v}>"
-        embed.add_field(name=k, value=str(v), inline=True)
+    for k, v in entry["data"].items():
+        embed.add_field(name=k, value=_fmt_value(k, v), inline=True)
+    return embed
+
+
+def _compact_line(entry: dict) -> str:
+    kind = entry["kind"]
+    parts = [f"<t:{int(entry['ts'])}:T> **{TITLE_MAP.get(kind, kind)}**"]
+    if entry.get("day"):
+        parts.append(f"D{entry['day']}")
+    parts.extend(f"{k}={_fmt_value(k, v)}" for k, v in entry["data"].items())
+    return " · ".join(parts)
+
+
+def _compact_embeds(entries: list[dict]) -> list[tuple[discord.Embed, list[dict]]]:
+    """Fold a large burst into as few multi-line embeds as possible, each with the entries it carries."""
+    out: list[tuple[discord.Embed, list[dict]]] = []
+    lines: list[str] = []
+    carried: list[dict] = []
+    size = 0
+    for e in entries:
+        line = _compact_line(e)[:500]
+        if lines and size + len(line) + 1 > _COMPACT_DESC_LIMIT:
+            out.append((discord.Embed(title="Event burst", description="\n".join(lines), color=0x34495e), carried))
+            lines, carried, size = [], [], 0
+        lines.append(line)
+        carried.append(e)
+        size += len(line) + 1
+    if lines:
+        out.append((discord.Embed(title="Event burst", description="\n".join(lines), color=0x34495e), carried))
+    return out
+
+
+def _pack_messages(items: list[tuple[discord.Embed, list[dict]]]) -> list[tuple[list[discord.Embed], list[dict]]]:
+    """Group embeds into messages within Discord's per-message embed count and total size limits."""
+    messages: list[tuple[list[discord.Embed], list[dict]]] = []
+    embeds: list[discord.Embed] = []
+    carried: list[dict] = []
+    size = 0
+    for embed, entries in items:
+        n = len(embed)
+        if embeds and (len(embeds) >= MAX_EMBEDS_PER_MESSAGE or size + n > MAX_EMBED_CHARS_PER_MESSAGE):
+            messages.append((embeds, carried))
+            embeds, carried, size = [], [], 0
+        embeds.append(embed)
+        carried.extend(entries)
+        size += n
+    if embeds:
+        messages.append((embeds, carried))
+    return messages
+
+
+# -------------------------------------------------------------------
+# Local JSONL fallback (rotating)
+# -------------------------------------------------------------------
+_audit_logger: logging.Logger | None = None
+
+def _get_audit_logger() -> logging.Logger:
+    global _audit_logger
+    if _audit_logger is None:
+        path = Path(cfg.AUDIT_LOG_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(
+            path, maxBytes=cfg.AUDIT_LOG_MAX_BYTES, backupCount=cfg.AUDIT_LOG_BACKUPS, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        lg = logging.getLogger("asdrubot.audit")
+        lg.setLevel(logging.INFO)
+        lg.propagate = False
+        lg.addHandler(handler)
+        _audit_logger = lg
+    return _audit_logger
 
-    await chan.send(embed=embed)
+
+def _write_jsonl(entries: list[dict]) -> None:
+    lg = _get_audit_logger()
+    for e in entries:
+        lg.info(json.dumps(e, ensure_ascii=False, default=str))
+
+
+# -------------------------------------------------------------------
+# Buffered sink: log_event() enqueues, a background task drains
+# -------------------------------------------------------------------
+_queue: asyncio.Queue | None = None
+_worker: asyncio.Task | None = None
+
+
+def _ensure_worker() -> asyncio.Queue:
+    global _queue, _worker
+    if _queue is None:
+        _queue = asyncio.Queue()
+    if _worker is None or _worker.done():
+        _worker = asyncio.get_running_loop().create_task(_drain_forever(), name="asdrubot-log-sink")
+    return _queue
+
+
+async def _collect_burst(q: asyncio.Queue) -> list[tuple]:
+    """Block for the first event, then gather whatever arrives within the flush window."""
+    batch = [await q.get()]
+    loop = asyncio.get_running_loop()
+    until = loop.time() + cfg.LOG_FLUSH_INTERVAL
+    while True:
+        timeout = until - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(q.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    while not q.empty():
+        batch.append(q.get_nowait())
+    return batch
+
+
+async def _deliver(batch: list[tuple]) -> None:
+    # Group by guild so each log channel receives one message per burst
+    groups: dict[int | None, list[dict]] = {}
+    bots: dict[int | None, discord.Client] = {}
+    for bot, guild_id, entry in batch:
+        groups.setdefault(guild_id, []).append(entry)
+        if bot is not None:
+            bots.setdefault(guild_id, bot)
+
+    to_file: list[dict] = []
+    for guild_id, entries in groups.items():
+        bot = bots.get(guild_id)
+        chan = _resolve_logs_channel(bot, guild_id) if bot and guild_id else None
+        if not chan:
+            to_file.extend(entries)
+            continue
+        if len(entries) <= MAX_EMBEDS_PER_MESSAGE:
+            items = [(_build_embed(e), [e]) for e in entries]
+        else:
+            items = _compact_embeds(entries)
+        messages = _pack_messages(items)
+        for i, (embeds, _) in enumerate(messages):
+            try:
+                await chan.send(embeds=embeds)
+            except Exception as e:
+                unsent = [entry for _, rest in messages[i:] for entry in rest]
+                log.warning(f"[logs] Could not deliver {len(unsent)} event(s) to Discord: {e!r}")
+                to_file.extend(unsent)
+                break
+
+    if to_file:
+        try:
+            await asyncio.to_thread(_write_jsonl, to_file)
+        except Exception as e:
+            log.error(f"[logs] Audit file write failed: {e!r}")
+
+
+async def _drain_forever() -> None:
+    q = _queue
+    while True:
+        batch = await _collect_burst(q)
+        try:
+            await _deliver(batch)
+        except Exception as e:
+            log.error(f"[logs] Sink crashed on a batch of {len(batch)}: {e!r}")
+        finally:
+            for _ in batch:
+                q.task_done()
+
+
+async def flush_logs(timeout: float = 5.0) -> None:
+    """Wait until every queued event has been delivered (used on shutdown)."""
+    if _queue is None:
+        return
+    try:
+        await asyncio.wait_for(_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        log.warning("[logs] Flush timed out; some events may be lost.")
+
+
+async def log_event(bot: discord.Client, guild_id: int, kind: str, **data):
+    """
+    Queue an event for the admin log. Returns immediately; a background task
+    batches bursts into a single message (or the local JSONL audit file when
+    no log channel is configured).
+    kind: 'PHASE_START', 'PHASE_END', 'VOTE_CAST', 'VOTE_CLEAR', 'VOTES_CLEARED',
+          'END_DAY_REQUEST', 'LYNCH', 'GAME_START', 'GAME_RESET', 'GAME_FINISH', 'ASSIGN'
+    """
+    entry = {
+        "ts": time.time(),
+        "guild_id": guild_id,
+        "kind": kind,
+        "day": getattr(game, "current_day_number", None),
+        "data": data,
+    }
+    try:
+        _ensure_worker().put_nowait((bot, guild_id, entry))
+    except RuntimeError:
+        # No running loop (e.g. called from a sync script): write straight to disk
+        _write_jsonl([entry])
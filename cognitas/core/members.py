@@ -0,0 +1,97 @@
+# cognitas/core/members.py
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import discord
+
+from .. import config as cfg
+from .state import game
+
+# -------------------------------------------------------------------
+# Member resolution without the gateway member cache
+# -------------------------------------------------------------------
+# With the "lean" cache profile (see bot.py) discord.py keeps no members, so
+# guild.get_member() mostly misses. resolve() falls back to fetch_member()
+# and remembers the result:
+#   - registered players: kept while they are registered (small, bounded set);
+#     the bot's own role edits refresh them (infra.py)
+#   - anyone else: small LRU (MEMBER_LRU_SIZE), entries expire after
+#     MEMBER_CACHE_TTL seconds so role changes made outside the bot are
+#     picked up again
+# Player entries left over from a previous game fall back to the TTL.
+
+Key = Tuple[int, str]
+
+_players: Dict[Key, Tuple[discord.Member, float]] = {}
+_lru: "OrderedDict[Key, Tuple[discord.Member, float]]" = OrderedDict()
+
+
+def _key(guild_id: int, uid) -> Key:
+    return int(guild_id), str(uid)
+
+
+def remember(member: Optional[discord.Member]) -> None:
+    guild = getattr(member, "guild", None)
+    if member is None or guild is None:
+        return
+    k = _key(guild.id, member.id)
+    entry = (member, time.monotonic())
+    if k[1] in (getattr(game, "players", None) or {}):
+        _lru.pop(k, None)
+        _players[k] = entry
+        return
+    _lru[k] = entry
+    _lru.move_to_end(k)
+    while len(_lru) > max(1, int(cfg.MEMBER_LRU_SIZE)):
+        _lru.popitem(last=False)
+
+
+def forget(guild_id: int, uid) -> None:
+    k = _key(guild_id, uid)
+    _players.pop(k, None)
+    _lru.pop(k, None)
+
+
+def clear() -> None:
+    _players.clear()
+    _lru.clear()
+
+
+def cached(guild: discord.Guild, uid) -> Optional[discord.Member]:
+    """Gateway cache first, then ours. Never hits the API."""
+    try:
+        m = guild.get_member(int(uid))
+    except (TypeError, ValueError):
+        return None
+    if m is not None:
+        return m
+    k = _key(guild.id, uid)
+    for store in (_players, _lru):
+        entry = store.get(k)
+        if entry is None:
+            continue
+        member, ts = entry
+        pinned = store is _players and k[1] in (getattr(game, "players", None) or {})
+        if not pinned and time.monotonic() - ts > cfg.MEMBER_CACHE_TTL:
+            store.pop(k, None)
+            return None
+        if store is _lru:
+            _lru.move_to_end(k)
+        return member
+    return None
+
+
+async def resolve(guild: discord.Guild, uid) -> Optional[discord.Member]:
+    """cached() or one fetch_member() call. None if the user left / is unknown."""
+    m = cached(guild, uid)
+    if m is not None:
+        return m
+    try:
+        m = await guild.fetch_member(int(uid))
+    except (discord.NotFound, discord.Forbidden, TypeError, ValueError):
+        return None
+    remember(m)
+    return m
@@ -0,0 +1,157 @@
+# cognitas/core/paginator.py
+from __future__ import annotations
+
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import discord
+
+from .storage import current_generation
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Paginated listings
+# -------------------------------------------------------------------
+# A source is registered once per listing kind:
+#
+#   paginator.register("players", count=_count, render=_render, page_size=30)
+#
+#   count(args)                         -> total rows (cheap)
+#   render(args, start, stop, page, n)  -> embed for rows [start, stop) only
+#
+# Only the requested page is rendered; rendered pages are cached per
+# (kind, args, page) and state generation (storage.current_generation()), so
+# any save invalidates them. Sources whose data does not live in the game
+# state can also pass:
+#
+#   prepare(args)  -> awaitable, run before every render (load data off the loop)
+#   version()      -> hashable, part of the cache key (bumps when the data changes)
+# Prev/next buttons carry everything in their
+# custom_id ("asdru:pg:<kind>:<page>:<args>") and are dispatched by the
+# PageButton dynamic item (bot.add_dynamic_items), so old listings keep
+# paging after a restart. `args` is a short source-defined string
+# (filters); keep it small, custom_ids max out at 100 chars.
+
+CACHE_SIZE = 64
+CUSTOM_ID = "asdru:pg:{kind}:{page}:{args}"
+
+
+@dataclass
+class Source:
+    kind: str
+    count: Callable[[str], int]
+    render: Callable[[str, int, int, int, int], discord.Embed]
+    page_size: int = 10
+    admin_only: bool = False
+    prepare: Optional[Callable[[str], Awaitable[Any]]] = None
+    version: Optional[Callable[[], Any]] = None
+
+
+_sources: Dict[str, Source] = {}
+_cache: "OrderedDict[Tuple[str, str, int, int, Any], discord.Embed]" = OrderedDict()
+
+
+def register(kind: str, *, count, render, page_size: int = 10, admin_only: bool = False,
+             prepare=None, version=None) -> None:
+    _sources[kind] = Source(kind, count, render, max(1, int(page_size)), admin_only, prepare, version)
+    clear_cache(kind)
+
+
+def clear_cache(kind: Optional[str] = None) -> None:
+    for k in [k for k in _cache if kind is None or k[0] == kind]:
+        _cache.pop(k, None)
+
+
+def pages_for(kind: str, args: str = "") -> int:
+    src = _sources[kind]
+    return max(1, -(-int(src.count(args) or 0) // src.page_size))
+
+
+def render_page(kind: str, args: str = "", page: int = 1) -> Tuple[discord.Embed, int, int]:
+    """(embed, page, pages); page is clamped to the listing's range."""
+    src = _sources[kind]
+    pages = pages_for(kind, args)
+    page = min(max(1, int(page)), pages)
+    key = (kind, args, page, current_generation(), src.version() if src.version else None)
+    embed = _cache.get(key)
+    if embed is not None:
+        _cache.move_to_end(key)
+        return embed, page, pages
+
+    start = (page - 1) * src.page_size
+    embed = src.render(args, start, start + src.page_size, page, pages)
+    if pages > 1:
+        footer = embed.footer.text if embed.footer and embed.footer.text else ""
+        embed.set_footer(text=f"{footer} • Página {page}/{pages}" if footer else f"Página {page}/{pages}")
+    _cache[key] = embed
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return embed, page, pages
+
+
+# ---------- View ----------
+
+class PageButton(discord.ui.DynamicItem[discord.ui.Button], template=r"asdru:pg:(?P<kind>[a-z_]+):(?P<page>\d+):(?P<args>.*)"):
+    """Prev/next button; the target page and filters live in the custom_id."""
+
+    def __init__(self, kind: str, page: int, args: str = "", *, label: str = "", disabled: bool = False):
+        super().__init__(discord.ui.Button(
+            label=label,
+            style=discord.ButtonStyle.secondary,
+            custom_id=CUSTOM_ID.format(kind=kind, page=max(0, page), args=args),
+            disabled=disabled,
+        ))
+        self.kind, self.page, self.args = kind, page, args
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match: re.Match[str], /):
+        return cls(match["kind"], int(match["page"]), match["args"])
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        src = _sources.get(self.kind)
+        if src is None:
+            return await interaction.response.send_message("⚠️ Este listado ya no está disponible.", ephemeral=True)
+        if src.admin_only and not getattr(getattr(interaction.user, "guild_permissions", None), "administrator", False):
+            return await interaction.response.send_message("Solo administradores.", ephemeral=True)
+        if src.prepare is not None:
+            await interaction.response.defer()
+            edit, fail = interaction.edit_original_response, interaction.followup.send
+        else:
+            edit, fail = interaction.response.edit_message, interaction.response.send_message
+        try:
+            if src.prepare is not None:
+                await src.prepare(self.args)
+            embed, page, pages = render_page(self.kind, self.args, self.page)
+        except Exception as e:
+            log.info(f"[paginator] render {self.kind}:{self.page} failed: {e!r}")
+            return await fail("⚠️ No se pudo mostrar esa página.", ephemeral=True)
+        await edit(embed=embed, view=make_view(self.kind, self.args, page, pages))
+
+
+def make_view(kind: str, args: str, page: int, pages: int) -> Optional[discord.ui.View]:
+    if pages <= 1:
+        return None
+    view = discord.ui.View(timeout=None)
+    view.add_item(PageButton(kind, page - 1, args, label="◀", disabled=page <= 1))
+    view.add_item(discord.ui.Button(
+        label=f"{page}/{pages}", style=discord.ButtonStyle.secondary, disabled=True,
+        custom_id=f"asdru:pg:{kind}:at:{page}",
+    ))
+    view.add_item(PageButton(kind, page + 1, args, label="▶", disabled=page >= pages))
+    return view
+
+
+async def send(ctx: Any, kind: str, args: str = "", *, page: int = 1, **kwargs) -> Any:
+    """Reply through a ctx adapter with the first page (plus buttons if there are more)."""
+    src = _sources[kind]
+    if src.prepare is not None:
+        await src.prepare(args)
+    embed, page, pages = render_page(kind, args, page)
+    view = make_view(kind, args, page, pages)
+    if view is not None:
+        kwargs["view"] = view
+    return await ctx.reply(embed=embed, **kwargs)
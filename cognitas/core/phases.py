@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections import Counter
 import asyncio
 import discord
 from typing import Optional
@@ -8,12 +9,12 @@ import logging
 
 from ..status import engine as SE
 from .state import game
+from . import assets, events, johnbotjovi, voteboard
 from .storage import save_state
 from .logs import log_event
-from .johnbotjovi import lynch as make_lynch_poster
-from .infra import ensure_game_channel, rename_game_channel, set_game_channel_posting, get_infra, apply_alive_dead_role
+from .infra import ensure_game_channel, rename_game_channel, set_game_channel_posting, get_infra
 from .. import config as cfg
-from .players import process_death, send_to_player
+from .players import send_to_player, stage_deaths, dispatch_deaths
 from .reminders import (
     parse_duration_to_seconds,
     start_day_timer,
@@ -182,14 +183,18 @@ async def start_day(
             game.votes = {}
     except Exception:
         game.votes = {}
+    events.publish(events.VoteCleared())
 
         # --- Status engine: 1 tick at Day start (announce day banners publicly) ---
     try:
+        events.publish(events.PhaseChanged("day", int(game.current_day_number or 0)))
         banners = SE.tick(game, "day")
-        for uid, text in banners:
-            if not text: continue
-            await send_to_player(guild, uid, str(text))
+        staged = stage_deaths(SE.drain_deaths(game))  # poison/wounds: one batch
         await save_state()
+        await asyncio.gather(
+            *(send_to_player(guild, uid, str(text)) for uid, text in banners if text),
+            dispatch_deaths(guild, staged),
+        )
     except Exception:
         pass
 
@@ -220,28 +225,11 @@ async def start_day(
     except Exception:
         pass
 
-    # Expansion banner logic (Rich support)
+    # Expansion banner logic (Rich support; images reuse their CDN upload)
     try:
         banner_data = getattr(game, "expansion", None) and game.expansion.banner_for_day(game)
-        
         if banner_data:
-            content = None
-            file = None
-
-            if isinstance(banner_data, str):
-                content = banner_data
-            elif isinstance(banner_data, dict):
-                content = banner_data.get("content")
-                path = banner_data.get("file_path")
-                if path:
-                    try:
-                        file = discord.File(path)
-                    except Exception:
-                        log.error(f"[phases] Could not load banner image at {path}")
-
-            if content or file:
-                await ch.send(content=content, file=file)
-                
+            await assets.send_banner(ch, banner_data)
     except Exception as e:
         log.error(f"[phases] Banner error: {e}")
 
@@ -253,6 +241,9 @@ async def start_day(
     except Exception:
         pass
 
+    # Live vote board (pinned, edited in place for the whole Day)
+    await voteboard.post(ctx.bot, ch)
+
     # Persist state
     await save_state()
 
@@ -260,7 +251,7 @@ async def start_day(
     total_minutes = max(1, seconds // 60)
     cp = _minutes_checkpoints_from_config(cfg.REMINDER_CHECKPOINTS, minutes_left=total_minutes)
     await start_day_timer(ctx.bot, ctx.guild.id, target.id, checkpoints=cp)
-    asyncio.create_task(_autoclose_after(ctx.bot, ctx.guild.id, "day", game.day_deadline_epoch))
+    asyncio.create_task(_autoclose_after(ctx.bot, ctx.guild.id, "day", game.day_deadline_epoch), name="asdrubot-autoclose-day")
 
     # Log event
     await log_event(ctx.bot, ctx.guild.id, "PHASE_START", phase="Day", number=game.current_day_number, deadline=game.day_deadline_epoch)
@@ -291,65 +282,29 @@ async def end_day(
     if not ch:
         return await ctx.reply("No hay canal de Día configurado.") #  
 
-    lynch_member: Optional[discord.Member] = None
-
     # Announce end (with or without lynch)
     if lynch_target_id:
-        # Try to resolve the member object for poster + mention
-        try:
-            lynch_member = guild.get_member(lynch_target_id) or await guild.fetch_member(lynch_target_id)
-        except Exception:
-            lynch_member = None
-
-        try:
-            #  
-            await ch.send(f"⚖️ **El Día ha terminado.** Linchado: <@{lynch_target_id}>.")
-        except Exception:
-            pass
-
-        # Mark player as dead if tracked
-        try:
-            await process_death(ctx.guild, lynch_target_id, reason="Lynched")
-        except Exception as e:
-            log.info(f"[phases] Error processing lynch death: {e!r}")
-
-        # Try to generate and send lynch poster
-        if lynch_member is not None:
-            try:
-                poster = await make_lynch_poster(lynch_member)
-            except Exception:
-                poster = None
-
-            if poster is not None:
-                try:
-                    #  
-                    await ch.send(content=f"🪓 **¡LINCHADO!** {lynch_member.mention}", file=poster)
-                except Exception:
-                    pass
-
-
+        msg = f"⚖️ **El Día ha terminado.** Linchado: <@{lynch_target_id}>."
     elif closed_by_threshold:
-        try:
-            #  
-            await ch.send("⛔ **El Día ha terminado** por mayoría de votos (/vote end_day).")
-        except Exception:
-            pass
+        msg = "⛔ **El Día ha terminado** por mayoría de votos (/vote end_day)."
     else:
-        try:
-            #  
-            await ch.send("🌇 **El Día ha terminado.**")
-        except Exception:
-            pass
-
-    # Close messages for @everyone
+        msg = "🌇 **El Día ha terminado.**"
     try:
-        everyone = ch.guild.default_role
-        ow = ch.overwrites_for(everyone)
-        ow.send_messages = False
-        await ch.set_permissions(everyone, overwrite=ow)
+        await ch.send(msg)
     except Exception:
         pass
 
+    # Freeze the vote board with the final tally before votes are cleared
+    board_closed = voteboard.close()
+
+    # Mark player as dead if tracked (state only; Discord effects run after the save)
+    staged = []
+    if lynch_target_id:
+        try:
+            staged = stage_deaths([(lynch_target_id, "Lynched")])
+        except Exception as e:
+            log.info(f"[phases] Error processing lynch death: {e!r}")
+
     # Cancel timer & clear deadline
     try:
         if getattr(game, "day_timer_task", None) and not game.day_timer_task.done():
@@ -358,8 +313,20 @@ async def end_day(
         pass
     game.day_timer_task = None
     game.day_deadline_epoch = None
-    
-    # Clear votes at day end to avoid stale tallies carrying over 
+
+    # Record the result (core/archive.py journals it) before the tally is gone
+    try:
+        tally = Counter(str(t) for t in (getattr(game, "votes", None) or {}).values() if t)
+        events.publish(events.DayEnded(
+            int(game.current_day_number or 0),
+            str(lynch_target_id) if lynch_target_id else None,
+            bool(closed_by_threshold),
+            tuple(tally.most_common()),
+        ))
+    except Exception as e:
+        log.info(f"[phases] DayEnded not published: {e!r}")
+
+    # Clear votes at day end to avoid stale tallies carrying over
     try:
         if hasattr(game, "votes"):
             game.votes.clear()
@@ -367,11 +334,30 @@ async def end_day(
             game.votes = {}
     except Exception:
         game.votes = {}
+    events.publish(events.VoteCleared())
 
+    # Persist once, then fan out: channel lock, role swap, poster, banners, expansion hook
+    await save_state()
 
+    async def _close_channel():
+        try:
+            everyone = ch.guild.default_role
+            ow = ch.overwrites_for(everyone)
+            ow.send_messages = False
+            await ch.set_permissions(everyone, overwrite=ow)
+        except Exception:
+            pass
 
-    # Persist & log
-    await save_state()
+    await asyncio.gather(
+        _close_channel(),
+        board_closed,
+        dispatch_deaths(guild, staged, poster_channel=ch),
+        return_exceptions=True,
+    )
+
+    johnbotjovi.clear_prerenders()  # leftovers for players who were not lynched
+
+    # Log
     await log_event(ctx.bot, ctx.guild.id, "PHASE_END", phase="Day", lynch_target_id=lynch_target_id or None)
 
     # Acknowledge
@@ -447,11 +433,14 @@ async def start_night(
 
         # --- Status engine: 1 tick at Night start (night messages via DM) ---
     try:
+        events.publish(events.PhaseChanged("night", int(game.current_day_number or 0)))
         banners = SE.tick(game, "night")
-        for uid, text in banners:
-            if not text: continue
-            await send_to_player(guild, uid, str(text))
+        staged = stage_deaths(SE.drain_deaths(game))  # poison/wounds: one batch
         await save_state()
+        await asyncio.gather(
+            *(send_to_player(guild, uid, str(text)) for uid, text in banners if text),
+            dispatch_deaths(guild, staged),
+        )
     except Exception:
         pass
 
@@ -487,25 +476,8 @@ async def start_night(
     try:
         # Llamamos al nuevo hook banner_for_night
         banner_data = getattr(game, "expansion", None) and game.expansion.banner_for_night(game)
-        
         if banner_data:
-            content = None
-            file = None
-            
-            if isinstance(banner_data, str):
-                content = banner_data
-            elif isinstance(banner_data, dict):
-                content = banner_data.get("content")
-                path = banner_data.get("file_path")
-                if path:
-                    try:
-                        file = discord.File(path)
-                    except Exception as e:
-                        log.error(f"[phases] Could not load night banner image at {path}: {e}")
-
-            if content or file:
-                await ch.send(content=content, file=file)
-                
+            await assets.send_banner(ch, banner_data)
     except Exception as e:
         log.error(f"[phases] Night banner error: {e}")
 
@@ -515,7 +487,7 @@ async def start_night(
     total_minutes = max(1, seconds // 60)
     cp = _minutes_checkpoints_from_config(cfg.REMINDER_CHECKPOINTS, minutes_left=total_minutes)
     await start_night_timer(ctx.bot, ctx.guild.id, ch.id, checkpoints=cp)
-    asyncio.create_task(_autoclose_after(ctx.bot, ctx.guild.id, "night", game.night_deadline_epoch))
+    asyncio.create_task(_autoclose_after(ctx.bot, ctx.guild.id, "night", game.night_deadline_epoch), name="asdrubot-autoclose-night")
 
     await log_event(ctx.bot, ctx.guild.id, "PHASE_START", phase="Night", number=game.current_day_number, deadline=game.night_deadline_epoch)
 
@@ -660,12 +632,14 @@ async def rehydrate_timers(bot: discord.Client, guild: discord.Guild):
             cp = _minutes_checkpoints_from_config(cfg.REMINDER_CHECKPOINTS, minutes_left=minutes_left)
             
             if phase == "day":
+                voteboard.bind(bot)
+                voteboard.request_update()
                 await start_day_timer(bot, guild.id, ch.id, checkpoints=cp)
             else:
                 await start_night_timer(bot, guild.id, ch.id, checkpoints=cp)
                 
             # Arm autoclose
-            asyncio.create_task(_autoclose_after(bot, guild.id, phase, ts))
+            asyncio.create_task(_autoclose_after(bot, guild.id, phase, ts), name=f"asdrubot-autoclose-{phase}")
         else:
             # Deadline already passed — announce and close ( )
             try:
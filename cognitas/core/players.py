@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import re
+import asyncio
+import inspect
 import discord
+from dataclasses import dataclass, field
 from discord.ext import commands
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 from enum import Enum
 
 from .state import game
+from . import events, members, paginator
 from .storage import save_state
+from .johnbotjovi import lynch as make_lynch_poster
 from ..status import engine as SE
-from ..core.infra import get_role_ids, apply_alive_dead_role, get_infra
+from ..core.infra import sync_alive_dead_roles
 
 NAME_RX = re.compile(r"\s+")
 
@@ -23,6 +28,24 @@ def _slug(name: str) -> str:
     return re.sub(r"[^a-z0-9\-]+", "-", s.replace(" ", "-")).strip("-") or "player"
 
 
+MENTION_RX = re.compile(r"^<@!?(\d+)>$")
+
+
+def resolve_player_ref(text: str | None, *, alive_only: bool = False) -> str | None:
+    """
+    uid for a mention, a raw id or a player name/alias (accent and case
+    insensitive, closest match on typos). None if unknown or ambiguous.
+    """
+    t = (text or "").strip()
+    if not t:
+        return None
+    m = MENTION_RX.match(t)
+    uid = m.group(1) if m else t
+    if uid in game.players:
+        return uid if not alive_only or game.players.is_alive(uid) else None
+    return game.players.find_by_name(t, alive_only=alive_only)
+
+
 def _ensure_player(uid: str, display_name: str | None = None):
     game.players.setdefault(uid, {
         "uid": uid,
@@ -43,23 +66,28 @@ def _is_admin(ctx: commands.Context | Any) -> bool:
         return False
 
 
+def _drop_votes_of(uid: str) -> None:
+    """In-memory part of sanitize_votes_for_uid (no save)."""
+    # Remove active vote
+    if isinstance(getattr(game, "votes", None), dict) and uid in game.votes:
+        del game.votes[uid]
+    # Remove end-day request (supports legacy list/tuple)
+    end_set = getattr(game, "end_day_votes", None)
+    if isinstance(end_set, set) and uid in end_set:
+        end_set.remove(uid)
+    elif isinstance(end_set, (list, tuple)) and uid in end_set:
+        s = set(end_set)
+        s.discard(uid)
+        game.end_day_votes = s
+
+
 async def sanitize_votes_for_uid(uid: str):
     """
     Remove the player's active vote and end-day request when they die.
     Best-effort; ignores errors.
     """
     try:
-        # Remove active vote
-        if isinstance(getattr(game, "votes", None), dict) and uid in game.votes:
-            del game.votes[uid]
-        # Remove end-day request (supports legacy list/tuple)
-        end_set = getattr(game, "end_day_votes", None)
-        if isinstance(end_set, set) and uid in end_set:
-            end_set.remove(uid)
-        elif isinstance(end_set, (list, tuple)) and uid in end_set:
-            s = set(end_set)
-            s.discard(uid)
-            game.end_day_votes = s
+        _drop_votes_of(uid)
         await save_state()
     except Exception:
         # keep going; this is best-effort hygiene
@@ -117,60 +145,53 @@ def get_player_snapshot(user_id: str) -> dict:
 # List & basic registration
 # ----------------------------
 
-async def list_players(ctx):
-    players = getattr(game, "players", {}) or {}
-    if not players:
-        return await ctx.reply("ℹ️ No hay jugadores registrados en la partida.")
-    
-    alive = []
-    dead = []
-    
-    sorted_players = sorted(players.values(), key=lambda x: x.get("name", "").lower())
-    
-    for p in sorted_players:
-        if p.get("alive", True):
-            alive.append(p)
-        else:
-            dead.append(p)
+PLAYERS_PAGE_SIZE = 30
+
 
-    def fmt_list(pl_list):
-        if not pl_list: return "*Ninguno*"
+def _roster_order() -> Tuple[List[str], int]:
+    """(alive uids by name + dead uids by name, alive count)."""
+    players = game.players
+    by_name = lambda uid: players.display_name(uid).lower()
+    alive = sorted(players.alive_ids(), key=by_name)
+    dead = sorted((uid for uid in players if not players.is_alive(uid)), key=by_name)
+    return alive + dead, len(alive)
 
-        names = [f"**{p.get('name', '?')}**" for p in pl_list]
-        return ", ".join(names)
 
+def _render_players_page(args: str, start: int, stop: int, page: int, pages: int) -> discord.Embed:
+    players = game.players
+    order, n_alive = _roster_order()
     embed = discord.Embed(
         title=f"👥 Lista de Jugadores ({len(players)})",
         color=0x2ECC71  # Verde genérico
     )
-    
-    embed.add_field(
-        name=f"💚 Vivos ({len(alive)})",
-        value=fmt_list(alive),
-        inline=False
-    )
+
+    def fmt_list(uids):
+        if not uids: return "*Ninguno*"
+        return ", ".join(f"**{players.display_name(uid, default='?')[:32]}**" for uid in uids)
+
+    alive = [uid for uid in order[start:stop] if players.is_alive(uid)]
+    dead = [uid for uid in order[start:stop] if not players.is_alive(uid)]
+    if alive or start < n_alive:
+        embed.add_field(name=f"💚 Vivos ({n_alive})", value=fmt_list(alive), inline=False)
     if dead:
-        embed.add_field(
-            name=f"💀 Muertos ({len(dead)})",
-            value=fmt_list(dead),
-            inline=False
-        )
+        embed.add_field(name=f"💀 Muertos ({len(players) - n_alive})", value=fmt_list(dead), inline=False)
+    return embed
 
-    await ctx.reply(embed=embed)
 
-def _get_safe_role_ids(guild_id: int):
-    alive = getattr(game, "alive_role_id", None)
-    dead = getattr(game, "dead_role_id", None)
-    
-    if not alive or not dead:
-        infra = get_infra(guild_id)
-        roles_data = infra.get("roles", {})
-        if not alive: alive = roles_data.get("alive")
-        if not dead: dead = roles_data.get("dead")
-        
-    return {"alive": alive, "dead": dead}
+paginator.register(
+    "players",
+    count=lambda args: len(game.players),
+    render=_render_players_page,
+    page_size=PLAYERS_PAGE_SIZE,
+)
 
 
+async def list_players(ctx):
+    players = getattr(game, "players", {}) or {}
+    if not players:
+        return await ctx.reply("ℹ️ No hay jugadores registrados en la partida.")
+    await paginator.send(ctx, "players")
+
 async def register(ctx, member: discord.Member | None = None, *, name: str | None = None):
     if not _is_admin(ctx):
         return await ctx.reply("Solo administradores.", ephemeral=True)
@@ -190,28 +211,16 @@ async def register(ctx, member: discord.Member | None = None, *, name: str | Non
     game.players[uid]["name"] = display
     game.players[uid]["alive"] = True
 
-    # --- CORRECCIÓN: Asignar Rol "Vivo" de forma segura ---
-    # Usamos la función helper que busca en infra si falla la memoria
-    ids = _get_safe_role_ids(guild.id)
-    r_alive_id = ids.get("alive")
-    r_dead_id = ids.get("dead")
-    
-    r_alive = guild.get_role(int(r_alive_id)) if r_alive_id else None
-    r_dead  = guild.get_role(int(r_dead_id))  if r_dead_id  else None
-
+    # Alive role (single role edit; cached role objects)
     try:
-        # AQUI ESTABA EL ERROR: Usamos 'target', no 'member' (que podía ser None)
-        if r_dead and r_dead in target.roles:
-            await target.remove_roles(r_dead, reason="Asdrubot: registration -> Alive")
-        
-        if r_alive and r_alive not in target.roles:
-            await target.add_roles(r_alive, reason="Asdrubot: registration -> Alive")
+        await sync_alive_dead_roles(guild, {uid: True})
     except Exception as e:
         print(f"[Register Error] Fallo al asignar roles a {display}: {e}")
         # No detenemos el registro, solo logueamos el fallo de rol
 
     # --- Create or reuse player's private role channel ---
     game.players[uid]["role_channel_id"] = None
+    events.publish(events.RosterChanged(uid))
 
     await save_state()
 
@@ -254,6 +263,7 @@ async def unregister(ctx, member: discord.Member):
                     pass
 
         del game.players[uid]
+        events.publish(events.RosterChanged(uid))
         await save_state()
         return await ctx.reply(f"🗑️ Jugador <@{uid}> eliminado y acceso a canal revocado.", ephemeral=True)
         
@@ -267,6 +277,7 @@ async def rename(ctx, member: discord.Member, *, new_name: str):
     if uid not in game.players:
         return await ctx.reply("Jugador no registrado.", ephemeral=True)
     game.players[uid]["name"] = _norm(new_name)
+    events.publish(events.RosterChanged(uid))
     await save_state()
     await ctx.reply(f"✏️ <@{uid}> ahora es **{new_name}**.", ephemeral=True)
 
@@ -296,6 +307,7 @@ async def alias_add(ctx, member: discord.Member, *, alias: str):
     if alias_n in arr:
         return await ctx.reply("Ese alias ya existe.", ephemeral=True)
     arr.append(alias_n)
+    events.publish(events.RosterChanged(uid))
     await save_state()
     await ctx.reply(f"➕ Alias añadido a <@{uid}>: `{alias_n}`", ephemeral=True)
 
@@ -311,6 +323,7 @@ async def alias_del(ctx, member: discord.Member, *, alias: str):
     if alias_n not in arr:
         return await ctx.reply("Alias no encontrado.", ephemeral=True)
     arr.remove(alias_n)
+    events.publish(events.RosterChanged(uid))
     await save_state()
     await ctx.reply(f"➖ Alias eliminado de <@{uid}>: `{alias_n}`", ephemeral=True)
 
@@ -410,7 +423,7 @@ async def edit_player(ctx, member: discord.Member, field: str, value: str):
             return await ctx.reply(f"Booleano inválido para `alive`: {e}", ephemeral=True)
         p["alive"] = bool(alive_val)
         if not alive_val:
-            await sanitize_votes_for_uid(uid)
+            _drop_votes_of(uid)  # saved below with the edit
     elif f_l == "effects":
         arr = [seg.strip() for seg in str(value).split(",") if seg.strip()]
         p["effects"] = arr
@@ -420,6 +433,8 @@ async def edit_player(ctx, member: discord.Member, field: str, value: str):
         # Generic best-effort coercion
         p[f] = _coerce_basic(value)
 
+    if f_l in ("name", "display_name", "alias"):
+        events.publish(events.RosterChanged(uid))
     await save_state()
     return await ctx.reply(f"✅ Set `{f}` = `{p.get(f_l, p.get(f, value))}` para <@{uid}>.", ephemeral=True)
 
@@ -515,7 +530,7 @@ async def send_to_player(guild: discord.Guild, uid: str, text: str):
 
     # 2. Fallback to DM
     try:
-        member = guild.get_member(int(uid)) or await guild.fetch_member(int(uid))
+        member = await members.resolve(guild, uid)
         if member:
             await member.send(text)
     except Exception:
@@ -541,60 +556,133 @@ async def set_alive(ctx, member: discord.Member, alive: bool):
     else:
         # Unified revive path
         game.players[uid]["alive"] = True
+        events.publish(events.PlayerRevived(uid))
         # IMPORTANT: Cleanse old statuses when reviving to prevent bugs
         SE.heal(game, uid, all_=True)
         
-        # --- Uso seguro de apply_alive_dead_role ---
-        ids = _get_safe_role_ids(ctx.guild.id) # Busca en infra si hace falta
-        
-        if ids["alive"]: game.alive_role_id = ids["alive"]
-        if ids["dead"]:  game.dead_role_id = ids["dead"]
-        
-        from ..core.infra import apply_alive_dead_role
-        await apply_alive_dead_role(ctx.guild, member.id, alive=True)
-        
         await save_state()
+        await sync_alive_dead_roles(ctx.guild, {uid: True})
         emoji = "💚"
 
     await ctx.reply(f"{emoji} Set `alive` = `{alive}` para <@{uid}>.", ephemeral=True)
 
 
-async def process_death(ctx_or_guild, member_id: int | str, reason: str = "Unknown"):
+@dataclass
+class Death:
+    uid: str
+    reason: str
+    banners: List[str] = field(default_factory=list)  # expire texts from the status cleanse
+
+
+def stage_deaths(deaths: Iterable[Tuple[int | str, str]]) -> List[Death]:
     """
-    Handle all side-effects of a player dying:
-    - Set alive=False
+    Apply every state change of a death batch in memory, with no I/O:
+    - Set alive=False and death_reason
     - Clear active votes/requests
-    - Heal all statuses (poison, silence, etc)
-    - Update Discord roles (Alive -> Dead)
+    - Heal all statuses (poison, silence, etc), keeping their banners
+    Unknown, already-dead or repeated uids are skipped.
+    The caller persists once, then runs dispatch_deaths().
     """
-    uid = str(member_id)
-    if uid not in game.players:
+    staged: List[Death] = []
+    seen = set()
+    for member_id, reason in deaths:
+        uid = str(member_id)
+        p = game.players.get(uid)
+        if not p or uid in seen or not p.get("alive", True):
+            continue
+        seen.add(uid)
+        p["alive"] = False
+        p["death_reason"] = reason
+        try:
+            _drop_votes_of(uid)
+        except Exception:
+            pass
+        banners = SE.heal(game, uid, all_=True)
+        staged.append(Death(uid, reason, list(banners or [])))
+        events.publish(events.PlayerDied(uid, reason))
+    return staged
+
+
+async def _death_poster(guild: discord.Guild, d: Death, channel) -> None:
+    try:
+        member = await members.resolve(guild, d.uid)
+        if member is None:
+            return
+        poster = await make_lynch_poster(member, use_prerender=True)
+        if poster is not None:
+            await channel.send(content=f"🪓 **¡LINCHADO!** {member.mention}", file=poster)
+    except Exception:
+        pass
+
+
+@events.subscribe(events.PlayerDied)
+async def _expansion_on_death(ev: events.PlayerDied) -> None:
+    """Expansion on_player_death hook, fed by the event bus."""
+    exp = getattr(game, "expansion", None)
+    if not exp:
         return
+    res = exp.on_player_death(game, ev.uid, cause=ev.reason)
+    if inspect.isawaitable(res):
+        await res
 
-    # a) Update state
-    game.players[uid]["alive"] = False
-    game.players[uid]["death_reason"] = reason
-    
-    # b) Clean up game mechanics
-    await sanitize_votes_for_uid(uid)  
-    SE.heal(game, uid, all_=True)      
-    
-    # c) Discord Roles
-    guild = getattr(ctx_or_guild, "guild", ctx_or_guild)
+
+async def dispatch_deaths(guild: discord.Guild | None, staged: List[Death], *, poster_channel=None) -> None:
+    """
+    Discord side of a staged batch, all concurrently: Alive -> Dead role swap,
+    expire banners and (if a channel is given) the lynch poster.
+    The expansion on_player_death hook runs from the PlayerDied event.
+    """
+    if not staged:
+        return
+    jobs = []
     if guild:
+        jobs.append(sync_alive_dead_roles(guild, {d.uid: False for d in staged}))
+        for d in staged:
+            jobs.extend(send_to_player(guild, d.uid, b) for b in d.banners if b)
+            if poster_channel is not None:
+                jobs.append(_death_poster(guild, d, poster_channel))
+    await asyncio.gather(*jobs, return_exceptions=True)
 
-        ids = _get_safe_role_ids(guild.id)
-        if ids["alive"]: game.alive_role_id = ids["alive"]
-        if ids["dead"]:  game.dead_role_id = ids["dead"]
 
-        from ..core.infra import apply_alive_dead_role
-        await apply_alive_dead_role(guild, int(member_id), alive=False)
-    
+async def process_deaths(ctx_or_guild, deaths: Iterable[Tuple[int | str, str]], *, poster_channel=None) -> List[str]:
+    """
+    Kill a batch of players: stage all state changes, save once, then run the
+    Discord effects concurrently. Returns the uids that actually died.
+    """
+    staged = stage_deaths(deaths)
+    if not staged:
+        return []
     await save_state()
+    guild = getattr(ctx_or_guild, "guild", ctx_or_guild)
+    await dispatch_deaths(guild, staged, poster_channel=poster_channel)
+    return [d.uid for d in staged]
+
+
+async def process_death(ctx_or_guild, member_id: int | str, reason: str = "Unknown", *, poster_channel=None):
+    """Single-player wrapper around process_deaths()."""
+    await process_deaths(ctx_or_guild, [(member_id, reason)], poster_channel=poster_channel)
+
 
 async def kill(ctx, member: discord.Member):
     await set_alive(ctx, member, False)
 
 
 async def revive(ctx, member: discord.Member):
-    await set_alive(ctx, member, True)
\ No newline at end of file
+    await set_alive(ctx, member, True)
+
+
+async def revive_all(ctx):
+    """Revive every dead player in one batch: state + one save + one role sync."""
+    if not _is_admin(ctx):
+        return await ctx.reply("Solo administradores.", ephemeral=True)
+    dead = [uid for uid, p in game.players.items() if not p.get("alive", True)]
+    if not dead:
+        return await ctx.reply("No hay jugadores muertos.", ephemeral=True)
+    for uid in dead:
+        game.players[uid]["alive"] = True
+        game.players[uid].pop("death_reason", None)
+        events.publish(events.PlayerRevived(uid))
+        SE.heal(game, uid, all_=True)
+    await save_state()
+    await sync_alive_dead_roles(ctx.guild, {uid: True for uid in dead})
+    await ctx.reply(f"💚 Revividos {len(dead)} jugadores.", ephemeral=True)
\ No newline at end of file
@@ -7,6 +7,7 @@ import asyncio
 from typing import List, Optional
 import discord
 from .state import game
+from . import voteboard
 import logging
 
 log = logging.getLogger(__name__)
@@ -75,6 +76,10 @@ async def _timer_worker(
                             chan = guild.get_channel(channel_id)
                         if not chan:
                             break
+                        # Day countdown lives on the vote board when there is one
+                        if phase_label == "Day" and voteboard.set_reminder(m):
+                            sent.add(m)
+                            continue
                         abs_ts = f"<t:{deadline_epoch}:F>"
                         rel_ts = f"<t:{deadline_epoch}:R>"
                         await _safe_send(
@@ -113,7 +118,8 @@ async def start_day_timer(
                 checkpoints_minutes_desc=checkpoints,
                 deadline_epoch=deadline,
                 phase_label="Day",
-            )
+            ),
+            name="asdrubot-timer-day",
         )
         game.day_timer_task = task
         log.info(f"[reminders] Day timer started (guild={guild_id}, channel={channel_id}, deadline={deadline}).")
@@ -143,7 +149,8 @@ async def start_night_timer(
                 checkpoints_minutes_desc=checkpoints,
                 deadline_epoch=deadline,
                 phase_label="Night",
-            )
+            ),
+            name="asdrubot-timer-night",
         )
         game.night_timer_task = task
         log.info(f"[reminders] Night timer started (guild={guild_id}, channel={channel_id}, deadline={deadline}).")
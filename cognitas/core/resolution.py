@@ -0,0 +1,230 @@
+# cognitas/core/resolution.py
+from __future__ import annotations
+
+import random
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .state import game
+from .actions import get_action_bucket, current_cycle_number, PHASE_NIGHT
+from ..status import engine as SE
+
+# -------------------------------------------------------------------
+# Night-action resolution
+# -------------------------------------------------------------------
+# Roles opt in by declaring a "night" block in roles_*.json:
+#
+#   {"name": "Doctor", ..., "night": {"effect": "protect"}}
+#   {"name": "Sicario", ..., "night": {"effect": "kill", "priority": 45}}
+#   {"name": "Vidente", ..., "night": {"effect": "investigate", "reveals": "team"}}
+#   {"name": "Bruja",   ..., "night": {"effect": "apply_status", "status": "Poisoned", "duration": 1}}
+#
+# Effects (default priority, lower resolves first):
+#   block 10         target's action this night is cancelled
+#   redirect 20      target's action now lands on the actor (decoy)
+#   protect 30       target survives kills this night
+#   apply_status 40  SE.apply(target, status, duration)
+#   kill 50          target dies unless protected
+#   investigate 60   actor learns target's role ("role") or team ("team", default)
+#
+# Actions from roles without a "night" block are listed as manual for the GM.
+# Status blocks (SE.check_action) are re-checked for every action; Confusion
+# redirects are not re-rolled here, /act already applied them to the stored
+# target (the record keeps "redirected_from" for the report).
+# The pass is deterministic: ties break by actor uid and any randomness in
+# status hooks is seeded with (game_id, night).
+
+EFFECTS: Dict[str, int] = {
+    "block": 10,
+    "redirect": 20,
+    "protect": 30,
+    "apply_status": 40,
+    "kill": 50,
+    "investigate": 60,
+}
+
+
+@dataclass
+class Step:
+    actor: str
+    effect: str                     # one of EFFECTS, or "manual"
+    target: Optional[str]
+    priority: int
+    spec: Dict[str, Any] = field(default_factory=dict)
+    outcome: str = "pending"        # done | blocked | no_target | manual | failed
+    detail: str = ""
+
+
+@dataclass
+class Resolution:
+    number: int
+    steps: List[Step] = field(default_factory=list)
+    deaths: List[Tuple[str, str]] = field(default_factory=list)           # (uid, reason)
+    statuses: List[Tuple[str, str, Optional[int], str]] = field(default_factory=list)  # (uid, status, duration, source)
+    messages: Dict[str, List[str]] = field(default_factory=dict)          # uid -> private results
+
+    def tell(self, uid: str, text: str) -> None:
+        self.messages.setdefault(uid, []).append(text)
+
+
+def _name(uid: Optional[str]) -> str:
+    if not uid:
+        return "—"
+    return game.players.display_name(uid, default=f"<@{uid}>")
+
+
+def _role_def(uid: str) -> Dict[str, Any]:
+    from .game import _lookup_role
+    role = (game.players.get(uid) or {}).get("role")
+    if not role:
+        return {}
+    return _lookup_role(role, getattr(game, "roles", {}) or {}, getattr(game, "roles_def", {})) or {}
+
+
+def night_spec(uid: str) -> Optional[Dict[str, Any]]:
+    spec = _role_def(uid).get("night")
+    if not isinstance(spec, dict) or spec.get("effect") not in EFFECTS:
+        return None
+    return spec
+
+
+@contextlib.contextmanager
+def _seeded(seed: str):
+    saved = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(saved)
+
+
+def _plan(number: int) -> List[Step]:
+    bucket = get_action_bucket(PHASE_NIGHT, number) or {}
+    steps: List[Step] = []
+    for uid in sorted(bucket):
+        rec = bucket[uid] or {}
+        if not (game.players.get(uid) or {}).get("alive", True):
+            continue
+        spec = night_spec(uid)
+        target = rec.get("target")
+        if spec is None:
+            steps.append(Step(uid, "manual", target, 999, {}, "manual", (rec.get("note") or "").strip()))
+            continue
+        prio = int(spec.get("priority", EFFECTS[spec["effect"]]))
+        # Confusion already redirected the target at /act time; only report it
+        detail = f"redirigido de {_name(rec['redirected_from'])}" if rec.get("redirected_from") else ""
+        steps.append(Step(uid, spec["effect"], target, prio, dict(spec), detail=detail))
+    steps.sort(key=lambda s: (s.priority, s.actor))
+    return steps
+
+
+def resolve_night(number: Optional[int] = None) -> Resolution:
+    """
+    Resolve night `number` (default: current) in one deterministic pass.
+    Pure: nothing in game state changes; commit() applies the result.
+    """
+    n = int(number if number is not None else current_cycle_number(PHASE_NIGHT))
+    res = Resolution(n)
+    steps = _plan(n)
+    res.steps = steps
+
+    by_actor = {s.actor: s for s in steps}
+    blocked: set = set()
+    protected: set = set()
+
+    with _seeded(f"{getattr(game, 'game_id', None)}:{n}"):
+        for s in steps:
+            if s.effect == "manual":
+                continue
+            if s.actor in blocked:
+                s.outcome, s.detail = "blocked", "bloqueado esta noche"
+                continue
+            # Status gate (Paralyzed/Drowsiness/Jailed...). Only the block result is
+            # used: Confusion redirects are rolled once, when /act stores the target.
+            chk = SE.check_action(game, s.actor, "night_action", s.target)
+            if not chk.get("allowed", True):
+                s.outcome, s.detail = "blocked", str(chk.get("reason") or "status")
+                continue
+            t = s.target
+            if not t or t not in game.players:
+                s.outcome = "no_target"
+                continue
+
+            if s.effect == "block":
+                blocked.add(t)
+            elif s.effect == "redirect":
+                victim = by_actor.get(t)
+                if victim and victim.priority > s.priority:
+                    victim.target = s.actor
+                    victim.detail = f"redirigido hacia {_name(s.actor)}"
+            elif s.effect == "protect":
+                protected.add(t)
+            elif s.effect == "apply_status":
+                name = s.spec.get("status")
+                if not name:
+                    s.outcome, s.detail = "failed", "falta 'status' en el rol"
+                    continue
+                res.statuses.append((t, name, s.spec.get("duration"), f"night:{s.actor}"))
+            elif s.effect == "kill":
+                if t in protected:
+                    s.outcome, s.detail = "failed", "objetivo protegido"
+                    res.tell(t, "🛡️ Alguien intentó matarte esta noche, pero fuiste protegido.")
+                    continue
+                if not (game.players.get(t) or {}).get("alive", True) or any(d[0] == t for d in res.deaths):
+                    s.outcome, s.detail = "failed", "objetivo ya muerto"
+                    continue
+                res.deaths.append((t, s.spec.get("reason") or "Asesinado (noche)"))
+            elif s.effect == "investigate":
+                rd = _role_def(t)
+                if (s.spec.get("reveals") or "team") == "role":
+                    found = rd.get("name") or (game.players.get(t) or {}).get("role") or "?"
+                else:
+                    found = rd.get("team") or rd.get("alignment") or "?"
+                res.tell(s.actor, f"🔎 **{_name(t)}**: {found}")
+            s.outcome = "done"
+    return res
+
+
+def preview_lines(res: Resolution) -> List[str]:
+    icons = {"done": "✅", "blocked": "⛔", "no_target": "➖", "manual": "✍️", "failed": "❌"}
+    lines = []
+    for s in res.steps:
+        extra = f" — {s.detail}" if s.detail else ""
+        lines.append(f"{icons.get(s.outcome, '•')} `{s.priority:>3}` **{_name(s.actor)}** "
+                     f"{s.effect} → {_name(s.target)}{extra}")
+    return lines
+
+
+async def commit(guild, res: Resolution) -> None:
+    """
+    Apply a resolution: statuses, deaths (one batch), private results.
+    Marks the night as resolved so it is not applied twice.
+    """
+    from .players import stage_deaths, dispatch_deaths, send_to_player
+    from .storage import save_state
+
+    banners: List[Tuple[str, str]] = []
+    for uid, name, duration, source in res.statuses:
+        ok, banner = SE.apply(game, uid, name, source=source, duration=duration)
+        if ok and banner:
+            banners.append((uid, banner))
+    staged = stage_deaths(list(res.deaths) + SE.drain_deaths(game))
+
+    done = getattr(game, "resolved_nights", None)
+    if not isinstance(done, list):
+        done = game.resolved_nights = []
+    if res.number not in done:
+        done.append(res.number)
+
+    await save_state()
+
+    for uid, text in banners:
+        await send_to_player(guild, uid, text)
+    for uid, msgs in res.messages.items():
+        await send_to_player(guild, uid, "\n".join(msgs))
+    await dispatch_deaths(guild, staged)
+
+
+def is_resolved(number: int) -> bool:
+    return int(number) in (getattr(game, "resolved_nights", None) or [])
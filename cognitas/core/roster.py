@@ -0,0 +1,555 @@
+# cognitas/core/roster.py
+from __future__ import annotations
+
+import random
+import unicodedata
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# game.players is a PlayerTable: a dict of uid -> PlayerRecord that keeps
+# membership indexes up to date as records change, so roster queries are set
+# lookups instead of scans.
+#
+# - PlayerRecord: slotted record that still behaves like the old player dict
+#   (p.get("alive", True), p["flags"][k] = v, p.setdefault(...), dict(p)).
+# - FlagDict: the record's "flags" mapping; reports boolean flag changes.
+# - AliasList: the record's "aliases" list; reports edits so the name index
+#   (name/alias/aliases -> uid, uid -> display name) stays current.
+# - to_payload() / PlayerTable(payload) round-trip the state.json shape.
+
+INDEXED_FLAGS = ("day_act", "night_act", "arcana", "sees", "oracle")
+NAME_FIELDS = ("name", "alias", "display_name", "aliases")
+FUZZY_MIN_SIMILARITY = 0.45  # trigram Jaccard needed for a fuzzy name match
+
+_MISSING = object()
+
+
+class FlagDict(dict):
+    """Flags mapping that tells its record when an indexed flag changes."""
+    __slots__ = ("_owner",)
+
+    def __init__(self, *args, owner: "PlayerRecord | None" = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._owner = owner
+
+    def _touch(self, key) -> None:
+        owner = self._owner
+        if owner is not None and key in INDEXED_FLAGS:
+            owner._reindex_flag(key)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touch(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch(key)
+
+    def pop(self, key, *default):
+        out = super().pop(key, *default)
+        self._touch(key)
+        return out
+
+    def setdefault(self, key, default=None):
+        out = super().setdefault(key, default)
+        self._touch(key)
+        return out
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        for key in INDEXED_FLAGS:
+            self._touch(key)
+
+    def clear(self):
+        super().clear()
+        for key in INDEXED_FLAGS:
+            self._touch(key)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._touch(key)
+        return key, value
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+def name_key(s: Any) -> str:
+    """Name lookup key; same normalization as game._norm_key (NFKD, no accents, upper)."""
+    if not isinstance(s, str):
+        return ""
+    s = unicodedata.normalize("NFKD", s.strip())
+    return "".join(ch for ch in s if not unicodedata.combining(ch)).upper()
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AliasList(list):
+    """Aliases list that tells its record when it changes."""
+    __slots__ = ("_owner",)
+
+    def __init__(self, *args, owner: "PlayerRecord | None" = None):
+        super().__init__(*args)
+        self._owner = owner
+
+    def _touch(self) -> None:
+        if self._owner is not None:
+            self._owner._reindex_names()
+
+    def append(self, item):
+        super().append(item)
+        self._touch()
+
+    def extend(self, items):
+        super().extend(items)
+        self._touch()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._touch()
+
+    def remove(self, item):
+        super().remove(item)
+        self._touch()
+
+    def pop(self, *args):
+        out = super().pop(*args)
+        self._touch()
+        return out
+
+    def clear(self):
+        super().clear()
+        self._touch()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._touch()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._touch()
+
+    def __iadd__(self, items):
+        super().__iadd__(items)
+        self._touch()
+        return self
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+class PlayerRecord:
+    """
+    One player. Common fields live in slots; anything else (role_channel_id,
+    notes, death_reason...) goes to `extra`. Unset fields read as missing, so
+    p.get("alive", True) keeps its old meaning.
+    """
+    __slots__ = ("uid", "name", "alive", "role", "flags", "effects", "aliases", "extra", "_table", "_key")
+    FIELDS = ("uid", "name", "alive", "role", "flags", "effects", "aliases")
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, *, table: "PlayerTable | None" = None):
+        self._table = None
+        self._key = None
+        for f in self.FIELDS:
+            object.__setattr__(self, f, _MISSING)
+        self.extra: Dict[str, Any] = {}
+        for k, v in (data or {}).items():
+            self[k] = v
+        self._table = table
+
+    # ---- mapping interface ----
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            v = getattr(self, key)
+            if v is _MISSING:
+                raise KeyError(key)
+            return v
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "flags":
+            value = FlagDict(value or {}, owner=self)
+        elif key == "aliases" and isinstance(value, (list, tuple)):
+            value = AliasList(value, owner=self)
+        if key in self.FIELDS:
+            object.__setattr__(self, key, value)
+        else:
+            self.extra[key] = value
+        if key == "alive":
+            self._reindex_alive()
+        elif key == "flags":
+            for f in INDEXED_FLAGS:
+                self._reindex_flag(f)
+        elif key in NAME_FIELDS:
+            self._reindex_names()
+
+    def __delitem__(self, key: str) -> None:
+        if key in self.FIELDS:
+            if getattr(self, key) is _MISSING:
+                raise KeyError(key)
+            object.__setattr__(self, key, _MISSING)
+            if key == "alive":
+                self._reindex_alive()
+            elif key == "flags":
+                for f in INDEXED_FLAGS:
+                    self._reindex_flag(f)
+            elif key in NAME_FIELDS:
+                self._reindex_names()
+        else:
+            del self.extra[key]
+            if key in NAME_FIELDS:
+                self._reindex_names()
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.FIELDS:
+            return getattr(self, key) is not _MISSING
+        return key in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        for f in self.FIELDS:
+            if getattr(self, f) is not _MISSING:
+                yield f
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (PlayerRecord, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PlayerRecord({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # copy/deepcopy/pickle as a detached record (never drag the table along)
+        return (PlayerRecord, (self.to_dict(),))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        try:
+            v = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return v
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        items = other.items() if hasattr(other, "items") else other
+        for k, v in items:
+            self[k] = v
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
+    def values(self):
+        return [self[k] for k in self]
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {k: self[k] for k in self}
+        if isinstance(out.get("flags"), FlagDict):
+            out["flags"] = dict(out["flags"])
+        if isinstance(out.get("aliases"), AliasList):
+            out["aliases"] = list(out["aliases"])
+        return out
+
+    # ---- index hooks ----
+    def is_alive(self) -> bool:
+        return self.alive is _MISSING or bool(self.alive)
+
+    def _reindex_alive(self) -> None:
+        if self._table is not None:
+            self._table._index_alive(self)
+
+    def _reindex_flag(self, flag: str) -> None:
+        if self._table is not None:
+            self._table._index_flag(self, flag)
+
+    def _reindex_names(self) -> None:
+        if self._table is not None:
+            self._table._index_names(self)
+
+
+# Not a dict subclass (slots + index hooks), but a full mapping: checks written
+# against collections.abc.Mapping/MutableMapping accept player records.
+MutableMapping.register(PlayerRecord)
+
+
+class PlayerTable(dict):
+    """
+    uid -> PlayerRecord with maintained indexes:
+    - alive: set + list/position map (O(1) count, membership and random pick)
+    - one uid set per boolean flag in INDEXED_FLAGS
+    - names: name_key(name/alias/aliases) -> uids, their trigrams, and the
+      display name per uid (O(1) rendering, text -> uid resolution)
+    Plain dicts assigned into the table are converted to records.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        self._alive_list: List[str] = []
+        self._alive_pos: Dict[str, int] = {}
+        self._flags: Dict[str, Set[str]] = {f: set() for f in INDEXED_FLAGS}
+        self._by_name: Dict[str, Set[str]] = {}          # name key -> uids
+        self._keys_of: Dict[str, Set[str]] = {}          # uid -> name keys
+        self._grams: Dict[str, Set[str]] = {}            # trigram -> name keys
+        self._display: Dict[str, Tuple[str, str]] = {}   # uid -> (name-first, alias-first)
+        for uid, p in (data or {}).items():
+            self[uid] = p
+
+    # ---- dict overrides (keep indexes in sync) ----
+    def __setitem__(self, uid: str, p: Any) -> None:
+        uid = str(uid)
+        if uid in self:
+            self._forget(uid)
+        rec = p if isinstance(p, PlayerRecord) and p._table is None else PlayerRecord(dict(p.items()) if p else {})
+        super().__setitem__(uid, rec)
+        rec._table, rec._key = self, uid
+        self._index_all(uid, rec)
+
+    def __delitem__(self, uid: str) -> None:
+        self._forget(uid)
+        super().__getitem__(uid)._table = None
+        super().__delitem__(uid)
+
+    def setdefault(self, uid: str, default: Any = None) -> PlayerRecord:
+        if uid not in self:
+            self[uid] = default or {}
+        return self[uid]
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        items = other.items() if hasattr(other, "items") else other
+        for uid, p in items:
+            self[uid] = p
+        for uid, p in kwargs.items():
+            self[uid] = p
+
+    def pop(self, uid: str, *default: Any) -> Any:
+        if uid not in self:
+            if default:
+                return default[0]
+            raise KeyError(uid)
+        rec = self[uid]
+        del self[uid]
+        return rec
+
+    def popitem(self):
+        uid = next(reversed(self))
+        return uid, self.pop(uid)
+
+    def clear(self) -> None:
+        for rec in self.values():
+            rec._table = None
+        super().clear()
+        self._alive_list.clear()
+        self._alive_pos.clear()
+        for s in self._flags.values():
+            s.clear()
+        self._by_name.clear()
+        self._keys_of.clear()
+        self._grams.clear()
+        self._display.clear()
+
+    def copy(self) -> Dict[str, Dict[str, Any]]:
+        return self.to_payload()
+
+    def __reduce__(self):
+        return (PlayerTable, (self.to_payload(),))
+
+    # ---- indexes ----
+    def _index_all(self, uid: str, rec: PlayerRecord) -> None:
+        self._index_alive(rec)
+        for f in INDEXED_FLAGS:
+            self._index_flag(rec, f)
+        self._index_names(rec)
+
+    def _forget(self, uid: str) -> None:
+        self._alive_remove(uid)
+        for s in self._flags.values():
+            s.discard(uid)
+        self._forget_names(uid)
+        self._display.pop(uid, None)
+
+    def _alive_remove(self, uid: str) -> None:
+        pos = self._alive_pos.pop(uid, None)
+        if pos is None:
+            return
+        last = self._alive_list.pop()
+        if last != uid:
+            self._alive_list[pos] = last
+            self._alive_pos[last] = pos
+
+    def _index_alive(self, rec: PlayerRecord) -> None:
+        uid = rec._key
+        if uid is None or super().get(uid) is not rec:
+            return
+        if rec.is_alive():
+            if uid not in self._alive_pos:
+                self._alive_pos[uid] = len(self._alive_list)
+                self._alive_list.append(uid)
+        else:
+            self._alive_remove(uid)
+
+    def _index_flag(self, rec: PlayerRecord, flag: str) -> None:
+        uid = rec._key
+        if uid is None or super().get(uid) is not rec:
+            return
+        flags = rec.get("flags") or {}
+        if flags.get(flag, False):
+            self._flags[flag].add(uid)
+        else:
+            self._flags[flag].discard(uid)
+
+    def _forget_names(self, uid: str) -> None:
+        for key in self._keys_of.pop(uid, ()):
+            uids = self._by_name.get(key)
+            if uids is None:
+                continue
+            uids.discard(uid)
+            if not uids:
+                del self._by_name[key]
+                for g in _trigrams(key):
+                    keys = self._grams.get(g)
+                    if keys is not None:
+                        keys.discard(key)
+                        if not keys:
+                            del self._grams[g]
+
+    def _index_names(self, rec: PlayerRecord) -> None:
+        uid = rec._key
+        if uid is None or super().get(uid) is not rec:
+            return
+        self._forget_names(uid)
+        name, alias, dname = rec.get("name"), rec.get("alias"), rec.get("display_name")
+        raw = [name, alias, dname, *(rec.get("aliases") or [])]
+        keys = {k for k in (name_key(x) for x in raw) if k}
+        self._keys_of[uid] = keys
+        for key in keys:
+            if key not in self._by_name:
+                self._by_name[key] = set()
+                for g in _trigrams(key):
+                    self._grams.setdefault(g, set()).add(key)
+            self._by_name[key].add(uid)
+        self._display[uid] = (name or alias or dname or "", alias or name or dname or "")
+
+    # ---- queries ----
+    def display_name(self, uid: str, *, prefer_alias: bool = False, default: Optional[str] = None) -> str:
+        """Display name for uid, O(1). `default` (else the uid) when it has none."""
+        uid = str(uid)
+        d = self._display.get(uid)
+        label = (d[1] if prefer_alias else d[0]) if d else ""
+        return label or (uid if default is None else default)
+
+    def find_by_name(self, text: str, *, alive_only: bool = False, fuzzy: bool = True) -> Optional[str]:
+        """
+        uid whose name or alias matches `text` (accent/case-insensitive).
+        Falls back to the closest name by trigram similarity. None when there
+        is no match or it is ambiguous.
+        """
+        key = name_key(text)
+        if not key:
+            return None
+        uids = self._by_name.get(key, set())
+        if alive_only:
+            uids = {u for u in uids if u in self._alive_pos}
+        if len(uids) == 1:
+            return next(iter(uids))
+        if uids or not fuzzy:
+            return None
+
+        qg = _trigrams(key)
+        shared: Dict[str, int] = {}
+        for g in qg:
+            for k in self._grams.get(g, ()):
+                shared[k] = shared.get(k, 0) + 1
+        best: Dict[str, float] = {}
+        for k, n in shared.items():
+            sim = n / (len(qg) + len(_trigrams(k)) - n)
+            if sim < FUZZY_MIN_SIMILARITY:
+                continue
+            for u in self._by_name.get(k, ()):
+                if alive_only and u not in self._alive_pos:
+                    continue
+                if sim > best.get(u, 0.0):
+                    best[u] = sim
+        if not best:
+            return None
+        ranked = sorted(best.items(), key=lambda kv: -kv[1])
+        if len(ranked) > 1 and ranked[1][1] == ranked[0][1]:
+            return None
+        return ranked[0][0]
+
+    def is_alive(self, uid: str) -> bool:
+        return uid in self._alive_pos
+
+    def alive_count(self) -> int:
+        return len(self._alive_list)
+
+    def alive_set(self) -> Set[str]:
+        return set(self._alive_pos)
+
+    def alive_ids(self) -> List[str]:
+        """Alive uids in roster (registration) order."""
+        if len(self._alive_list) == len(self):
+            return list(self.keys())
+        return [uid for uid in self.keys() if uid in self._alive_pos]
+
+    def random_alive(self, *, exclude: Optional[str] = None) -> Optional[str]:
+        """Uniform pick among alive players, O(1)."""
+        pool = self._alive_list
+        n = len(pool)
+        if exclude is not None and exclude in self._alive_pos:
+            if n <= 1:
+                return None
+            i = random.randrange(n - 1)
+            # skip over the excluded slot
+            return pool[i + 1] if i >= self._alive_pos[exclude] else pool[i]
+        return random.choice(pool) if n else None
+
+    def with_flag(self, flag: str, *, alive_only: bool = False) -> Set[str]:
+        """uids whose boolean flag is truthy (flag must be in INDEXED_FLAGS)."""
+        s = self._flags[flag]
+        return {u for u in s if u in self._alive_pos} if alive_only else set(s)
+
+    def count_flag(self, flag: str, *, alive_only: bool = False) -> int:
+        s = self._flags[flag]
+        if not alive_only:
+            return len(s)
+        small, big = (s, self._alive_pos) if len(s) <= len(self._alive_pos) else (self._alive_pos, s)
+        return sum(1 for u in small if u in big)
+
+    # ---- persistence ----
+    def to_payload(self) -> Dict[str, Dict[str, Any]]:
+        """Plain {uid: dict} in the state.json shape."""
+        return {uid: rec.to_dict() for uid, rec in self.items()}
+
+
+def as_table(players: Any) -> PlayerTable:
+    """Wrap a plain {uid: dict} mapping (or None) into a PlayerTable."""
+    if isinstance(players, PlayerTable):
+        return players
+    return PlayerTable(players if isinstance(players, dict) else {})
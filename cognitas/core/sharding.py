@@ -0,0 +1,202 @@
+# cognitas/core/sharding.py
+from __future__ import annotations
+
+import os
+import socket
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+from .. import config as cfg
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Gateway sharding + per-process state ownership
+# -------------------------------------------------------------------
+# Three modes (cfg.SHARD_COUNT / cfg.SHARD_IDS / cfg.AUTO_SHARD):
+#
+#   single  commands.Bot, one process, one state store (default)
+#   auto    commands.AutoShardedBot with Discord's recommended shard count,
+#           still one process and one state store
+#   range   SHARD_COUNT=N, SHARD_IDS="0-3": this process connects only the
+#           listed shards. Run one process per range; ranges must not overlap.
+#
+# A guild lives on shard (guild_id >> 22) % N, so it always reaches the same
+# process. The game state is one `game` per process (infra/tzclocks are keyed
+# by guild inside it), so in "range" mode each process gets its own store:
+# the configured state path with a ".shards-<ids>-of-<N>" suffix. It only ever
+# holds games started in guilds on those shards. Per-game side stores are
+# scoped the same way (status audit DB, archive journals); finished-game
+# archives are shared, their names include the guild id.
+#
+# Whatever the mode, the process takes an exclusive lease on its store
+# (<store>.lock, an OS file lock held until exit) before loading it, so two
+# processes started with the same range (or two unsharded bots on one
+# state.json) never write the same state. The lock dies with the process;
+# a crashed bot never leaves a stale lease behind.
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LeaseError(RuntimeError):
+    """Another live process holds the state store."""
+
+
+def parse_ids(spec: Optional[str]) -> List[int]:
+    """'0-3,6' -> [0, 1, 2, 3, 6]."""
+    out: List[int] = []
+    for part in (spec or "").replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            out.extend(range(int(lo), int(hi) + 1))
+        else:
+            out.append(int(part))
+    return sorted(set(out))
+
+
+def shard_count() -> Optional[int]:
+    n = int(getattr(cfg, "SHARD_COUNT", 0) or 0)
+    return n if n > 0 else None
+
+
+def shard_ids() -> Optional[List[int]]:
+    """Shards this process owns; None = all of them."""
+    n = shard_count()
+    if n is None:
+        return None
+    ids = parse_ids(getattr(cfg, "SHARD_IDS", None))
+    if not ids:
+        return None
+    bad = [i for i in ids if i < 0 or i >= n]
+    if bad:
+        raise ValueError(f"SHARD_IDS {bad} out of range for SHARD_COUNT={n}")
+    return ids if len(ids) < n else None
+
+
+def mode() -> str:
+    if shard_ids() is not None:
+        return "range"
+    if shard_count() is not None or getattr(cfg, "AUTO_SHARD", False):
+        return "auto"
+    return "single"
+
+
+def bot_kwargs() -> dict:
+    """AutoShardedBot kwargs; {} lets Discord pick the shard count."""
+    n, ids = shard_count(), shard_ids()
+    if n is None:
+        return {}
+    kw = {"shard_count": n}
+    if ids is not None:
+        kw["shard_ids"] = ids
+    return kw
+
+
+def shard_of(guild_id: int, count: Optional[int] = None) -> int:
+    n = count or shard_count() or 1
+    return (int(guild_id) >> 22) % n
+
+
+def owns(guild_id: Optional[int]) -> bool:
+    """True if this process is responsible for the guild's game."""
+    ids = shard_ids()
+    if ids is None or guild_id is None:
+        return True
+    return shard_of(guild_id) in ids
+
+
+def _ids_label(ids: List[int]) -> str:
+    runs, start = [], ids[0]
+    for prev, cur in zip(ids, ids[1:] + [None]):
+        if cur != prev + 1:
+            runs.append(str(start) if start == prev else f"{start}-{prev}")
+            start = cur
+    return "_".join(runs)
+
+
+def scope_label() -> Optional[str]:
+    """'shards-0-3-of-8' in range mode, None otherwise."""
+    ids = shard_ids()
+    if ids is None:
+        return None
+    return f"shards-{_ids_label(ids)}-of-{shard_count()}"
+
+
+def scoped_path(path: str | Path) -> str:
+    """state.json -> state.shards-0-3-of-8.json (directories get the bare suffix)."""
+    label = scope_label()
+    p = Path(path)
+    if label is None:
+        return str(p)
+    if p.suffix and not p.is_dir():
+        return str(p.with_name(f"{p.stem}.{label}{p.suffix}"))
+    return str(p.with_name(f"{p.name}.{label}"))
+
+
+# ---------- Lease ----------
+
+_lease = None  # (path, file object)
+
+
+def acquire_lease(store_path: str) -> str:
+    """
+    Lock <store_path>.lock for the rest of the process. Idempotent for the
+    same store; raises LeaseError if another process holds it.
+    """
+    global _lease
+    lock_path = str(store_path).rstrip("/\\") + ".lock"
+    if _lease is not None:
+        if _lease[0] == lock_path:
+            return lock_path
+        release_lease()
+
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)) or ".", exist_ok=True)
+    f = open(lock_path, "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        f.seek(0)
+        holder = f.read().strip() or "unknown process"
+        f.close()
+        raise LeaseError(f"{store_path} is owned by {holder} (lease {lock_path})")
+
+    f.seek(0)
+    f.truncate()
+    f.write(f"pid={os.getpid()} host={socket.gethostname()} shards={scope_label() or mode()}\n")
+    f.flush()
+    _lease = (lock_path, f)
+    log.info(f"[sharding] Lease acquired: {lock_path}")
+    return lock_path
+
+
+def release_lease() -> None:
+    global _lease
+    if _lease is None:
+        return
+    lock_path, f = _lease
+    _lease = None
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+    f.close()
+    log.info(f"[sharding] Lease released: {lock_path}")
+
+
+def lease_path() -> Optional[str]:
+    return _lease[0] if _lease else None
@@ -1,9 +1,11 @@
 from math import ceil
 
+from .roster import PlayerTable, as_table
+
 class GameState:
     def __init__(self):
         # --- Core runtime state ---
-        self.players = {}               # { uid: {nick, role, channel_id, alive, flags, effects} }
+        self.players = {}               # PlayerTable { uid: PlayerRecord(name, role, alive, flags, effects...) }
         self.votes = {}                 # { voter_uid: target_uid }
         self.roles = {}                 # loaded from roles.json
         self.phase: str = "day"
@@ -14,6 +16,7 @@ class GameState:
         self.day_deadline_epoch = None  # int | None (epoch seconds)
         self.day_timer_task = None      # asyncio.Task | None
         self.end_day_votes = set()   # uids (str) of living players who requested to end the day
+        self.vote_board = None          # {channel_id, message_id, day, reminder} (core/voteboard.py)
         
         # --- Night phase ---
         self.night_deadline_epoch = None    # epoch seconds
@@ -33,6 +36,16 @@ class GameState:
 
         # --- Game lifecycle ---
         self.game_over = False              # block new phases when True
+        self.pending_deaths = []            # [(uid, reason)] queued by statuses; runtime only
+
+    # Any mapping assigned to players becomes an indexed PlayerTable
+    @property
+    def players(self) -> PlayerTable:
+        return self._players
+
+    @players.setter
+    def players(self, value) -> None:
+        self._players = as_table(value)
 
     # -------------- Helpers  --------------
     def role_of(self, uid: str) -> dict:
@@ -49,10 +62,10 @@ class GameState:
         return self.players[uid].get("flags", {})
 
     def alive_ids(self):
-        return [uid for uid, p in self.players.items() if p.get("alive", True)]
+        return self.players.alive_ids()
 
     def base_threshold(self):
-        return ceil(len(self.alive_ids()) / 2)
+        return ceil(self.players.alive_count() / 2)
 
     # ----- voting math -----
     def _expired(self, eff: dict) -> bool:
@@ -5,19 +5,23 @@ import json
 import os
 import tempfile
 import asyncio
+import itertools
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 import logging
 from .. import config as cfg
 from .state import game
+from . import archive, sharding
 from ..expansions import load_expansion_instance
+from ..status import audit as status_audit
 
 log = logging.getLogger(__name__)
 
 # -------------------------------------------------------------------
-# Atomic JSON writer
+# Atomic writers
 # -------------------------------------------------------------------
-def _atomic_write_json(path: str, data: dict, *, make_backup: bool = True):
+def _atomic_write_bytes(path: str, data: bytes, *, make_backup: bool = True):
     dirpath = os.path.dirname(os.path.abspath(path)) or "."
     os.makedirs(dirpath, exist_ok=True)
 
@@ -32,8 +36,8 @@ def _atomic_write_json(path: str, data: dict, *, make_backup: bool = True):
 
     fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", dir=dirpath)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
@@ -45,6 +49,12 @@ def _atomic_write_json(path: str, data: dict, *, make_backup: bool = True):
             pass
         raise
 
+def _encode_json(data: dict) -> bytes:
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _atomic_write_json(path: str, data: dict, *, make_backup: bool = True):
+    _atomic_write_bytes(path, _encode_json(data), make_backup=make_backup)
+
 # -------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------
@@ -70,6 +80,9 @@ def _ensure_defaults():
         "day_timer_task": None,
         "night_timer_task": None,
         "night_actions": {},
+        "game_id": None,
+        "resolved_nights": [],
+        "vote_board": None,
         # --- NUEVO ---
         "infra": {},      # Datos de infraestructura (roles, canales)
         "tzclocks": {},   # Relojes de zona horaria
@@ -83,7 +96,6 @@ def _ensure_defaults():
         if not hasattr(game, "expansion") or game.expansion is None:
             game.expansion = load_expansion_instance(getattr(game, "profile", "default"))
         if not hasattr(game, "status_map"): game.status_map = {}
-        if not hasattr(game, "status_log"): game.status_log = []
     except Exception:
         pass
 
@@ -95,26 +107,148 @@ def _rehydrate_roles_index():
         game.roles = {}
 
 # -------------------------------------------------------------------
-# Public API
+# Backends
 # -------------------------------------------------------------------
-def load_state(path: str | Path | None = None) -> Dict[str, Any]:
-    _ensure_defaults()
-    eff_path = _effective_path(path)
+class StorageBackend:
+    """
+    Persistence interface behind load_state/save_state.
+    load() returns the state payload (same shape as state.json).
 
-    data: Dict[str, Any] = {}
-    try:
-        with open(eff_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception as e_main:
+    Saving is split in two so the worker thread never sees live game objects:
+    - encode(payload, dirty) runs on the event loop and returns a detached
+      snapshot (bytes, encoded rows...) that later mutations cannot touch.
+      `dirty` is an optional hint (payload keys or section names) that
+      backends able to write partially may use; None means "anything".
+    - write(snapshot) runs in a worker thread and does the I/O.
+    commit() serializes writes and drops snapshots older than the last one
+    written, so out-of-order worker threads can never roll the file back.
+    """
+    name = "base"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._write_lock = threading.Lock()
+        self._written_gen = 0
+
+    def load(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def encode(self, payload: Dict[str, Any], dirty: Optional[Iterable[str]] = None) -> Any:
+        raise NotImplementedError
+
+    def write(self, snapshot: Any) -> None:
+        raise NotImplementedError
+
+    def save(self, payload: Dict[str, Any]) -> None:
+        self.write(self.encode(payload))
+
+    def commit(self, generation: int, snapshot: Any) -> bool:
+        """Write `snapshot` unless a newer generation already landed. Thread-safe."""
+        with self._write_lock:
+            if generation <= self._written_gen:
+                return False
+            self.write(snapshot)
+            self._written_gen = generation
+            return True
+
+
+class JsonBackend(StorageBackend):
+    """Single JSON document, rewritten atomically (with .bak) on every save."""
+    name = "json"
+
+    def load(self) -> Dict[str, Any]:
         try:
-            with open(eff_path + ".bak", "r", encoding="utf-8") as f:
-                data = json.load(f)
-            log.warning("[storage] Main state file failed, loaded from backup.")
-        except Exception as e_bak:
-            log.critical(f"[storage] FATAL: Could not load state. {e_main} | {e_bak}")
-            raise RuntimeError("State load failed check state.json integrity.")
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e_main:
+            try:
+                with open(self.path + ".bak", "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                log.warning("[storage] Main state file failed, loaded from backup.")
+                return data
+            except Exception as e_bak:
+                log.critical(f"[storage] FATAL: Could not load state. {e_main} | {e_bak}")
+                raise RuntimeError("State load failed check state.json integrity.")
 
-    # Hydrate game object
+    def encode(self, payload: Dict[str, Any], dirty: Optional[Iterable[str]] = None) -> bytes:
+        return _encode_json(payload)  # one document: always written whole
+
+    def write(self, snapshot: bytes) -> None:
+        _atomic_write_bytes(self.path, snapshot, make_backup=True)
+
+
+_backends: Dict[tuple, StorageBackend] = {}
+
+def get_backend(path: str | Path | None = None) -> StorageBackend:
+    """
+    Resolve (and cache) the configured backend.
+    STORAGE_BACKEND=json     -> STATE_PATH (default)
+    STORAGE_BACKEND=sqlite   -> STATE_DB_PATH
+    STORAGE_BACKEND=sections -> STATE_DIR (one file per section + manifest)
+    An explicit path ending in .db/.sqlite always uses SQLite; an existing
+    directory uses the sectioned layout. Configured (default) paths are
+    scoped to this process's shard range (core/sharding.py).
+    """
+    kind = (cfg.STORAGE_BACKEND or "json").lower()
+    if path is not None and str(path).endswith((".db", ".sqlite", ".sqlite3")):
+        kind = "sqlite"
+    elif path is not None and os.path.isdir(str(path)):
+        kind = "sections"
+    if kind == "sqlite":
+        eff_path = _effective_path(path or sharding.scoped_path(cfg.STATE_DB_PATH))
+    elif kind == "sections":
+        eff_path = _effective_path(path or sharding.scoped_path(cfg.STATE_DIR))
+    else:
+        kind = "json"
+        eff_path = _effective_path(path or sharding.scoped_path(cfg.STATE_PATH))
+
+    key = (kind, eff_path)
+    backend = _backends.get(key)
+    if backend is None:
+        if kind == "sqlite":
+            from .storage_sqlite import SqliteBackend
+            backend = SqliteBackend(eff_path)
+        elif kind == "sections":
+            from .storage_sections import SectionedBackend
+            backend = SectionedBackend(eff_path, legacy_json=sharding.scoped_path(cfg.STATE_PATH))
+        else:
+            backend = JsonBackend(eff_path)
+        _backends[key] = backend
+    return backend
+
+# -------------------------------------------------------------------
+# Payload <-> game
+# -------------------------------------------------------------------
+def _build_payload() -> Dict[str, Any]:
+    return {
+        "players": game.players.to_payload(),
+        "votes": game.votes,
+        "game_channel_id": game.game_channel_id,  # GUARDAR NUEVO NOMBRE
+        "admin_log_channel_id": game.admin_log_channel_id,
+        "admin_channel_id": game.admin_channel_id,
+        "default_game_channel_id": game.default_game_channel_id,
+        "game_over": game.game_over,
+        "current_day_number": game.current_day_number,
+        "day_deadline_epoch": game.day_deadline_epoch,
+        "night_deadline_epoch": game.night_deadline_epoch,
+        "phase": getattr(game, "phase", "day"),
+        "profile": getattr(game, "profile", "default"),
+        "roles_def": getattr(game, "roles_def", {}),
+        "night_actions": getattr(game, "night_actions", {}),
+        "day_actions": getattr(game, "day_actions", {}),
+        "lunar_index": getattr(game, "lunar_index", 0),
+        "status_map": getattr(game, "status_map", {}),
+        "game_id": getattr(game, "game_id", None),
+        "resolved_nights": list(getattr(game, "resolved_nights", None) or []),
+        "vote_board": getattr(game, "vote_board", None),
+
+        # --- GUARDAR INFRAESTRUCTURA Y TIMEZONES ---
+        "infra": getattr(game, "infra", {}),
+        "tzclocks": getattr(game, "tzclocks", {}),
+        # -------------------------------------------
+    }
+
+def _hydrate(data: Dict[str, Any]) -> None:
     game.players = data.get("players", {})
     game.votes = data.get("votes", {})
     game.game_channel_id = data.get("game_channel_id") or data.get("day_channel_id")
@@ -133,56 +267,66 @@ def load_state(path: str | Path | None = None) -> Dict[str, Any]:
         log.info(f"[storage] Expansion rehydrated: {getattr(game.expansion, 'name', 'None')}")
     except Exception as e:
         log.error(f"[storage] Failed to rehydrate expansion '{game.profile}': {e}")
-    
+
     game.roles_def = data.get("roles_def", {})
     game.night_actions = data.get("night_actions", {})
     game.day_actions = data.get("day_actions", {})
     game.status_map = data.get("status_map", {})
-    game.status_log = data.get("status_log", [])
+    # Legacy "status_log" lists are ignored: history now lives in status/audit.py
+    game.game_id = data.get("game_id")
+    game.resolved_nights = list(data.get("resolved_nights") or [])
+    game.vote_board = data.get("vote_board")
     game.infra = data.get("infra", {})
     game.tzclocks = data.get("tzclocks", {})
 
-    # ------------------------------------------
+# -------------------------------------------------------------------
+# Public API
+# -------------------------------------------------------------------
+def load_state(path: str | Path | None = None) -> Dict[str, Any]:
+    global _last_generation
+    _ensure_defaults()
+    backend = get_backend(path)
+    data = backend.load()
 
+    # Hydrate game object
+    _hydrate(data)
     _rehydrate_roles_index()
+    _last_generation = next(_save_generation)
     return data
 
-async def save_state(path: str | Path | None = None):
-    _ensure_defaults()
-    eff_path = _effective_path(path)
+_save_generation = itertools.count(1)
+_last_generation = 0
 
-    payload = {
-        "players": game.players,
-        "votes": game.votes,
-        "game_channel_id": game.game_channel_id,  # GUARDAR NUEVO NOMBRE
-        "admin_log_channel_id": game.admin_log_channel_id,
-        "admin_channel_id": game.admin_channel_id,
-        "default_game_channel_id": game.default_game_channel_id,
-        "admin_log_channel_id": game.admin_log_channel_id,
-        "admin_channel_id": game.admin_channel_id,
-        "game_over": game.game_over,
-        "current_day_number": game.current_day_number,
-        "day_deadline_epoch": game.day_deadline_epoch,
-        "night_deadline_epoch": game.night_deadline_epoch,
-        "phase": getattr(game, "phase", "day"),
-        "profile": getattr(game, "profile", "default"),
-        "roles_def": getattr(game, "roles_def", {}),
-        "night_actions": getattr(game, "night_actions", {}),
-        "day_actions": getattr(game, "day_actions", {}),
-        "lunar_index": getattr(game, "lunar_index", 0),
-        "status_map": getattr(game, "status_map", {}),
-        "status_log": getattr(game, "status_log", []),
-        
-        # --- GUARDAR INFRAESTRUCTURA Y TIMEZONES ---
-        "infra": getattr(game, "infra", {}),
-        "tzclocks": getattr(game, "tzclocks", {}),
-        # -------------------------------------------
-    }
+
+def current_generation() -> int:
+    """Bumped by every save_state()/load_state(); caches keyed on it go stale with the state."""
+    return _last_generation
+
+async def save_state(path: str | Path | None = None, *, dirty: Iterable[str] | None = None):
+    """
+    Snapshot on the loop, write off the loop.
+    The payload is encoded here, in one synchronous step, so it is consistent
+    and detached from the live dicts; only the file/DB I/O and fsync run in
+    the worker thread.
+    dirty: optional payload keys this mutation touched (e.g. ("votes",)).
+    Only pass it when sure; leaving it out is always correct.
+    """
+    global _last_generation
+    _ensure_defaults()
+    backend = get_backend(path)
+    try:
+        snapshot = backend.encode(_build_payload(), dirty)
+    except Exception as e:
+        log.info(f"[storage] Failed to snapshot state: {e!r}")
+        return
+    generation = _last_generation = next(_save_generation)
 
     def _write():
-        _atomic_write_json(eff_path, payload, make_backup=True)
+        backend.commit(generation, snapshot)
+        status_audit.flush()
+        archive.flush_journal()
 
     try:
         await asyncio.to_thread(_write)
     except Exception as e:
-        log.info(f"[storage] Failed to write state to {eff_path}: {e!r}")
\ No newline at end of file
+        log.info(f"[storage] Failed to write state to {backend.path}: {e!r}")
@@ -0,0 +1,146 @@
+# cognitas/core/storage_sections.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from .storage import StorageBackend, JsonBackend, _atomic_write_bytes, _encode_json
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Layout
+# -------------------------------------------------------------------
+# state/
+#   manifest.json     {"version", "generation", "sections": {name: {"file", "sha1", "bytes"}}}
+#   players.json, votes.json, actions.json, status.json, roles.json,
+#   infra.json, tzclocks.json, meta.json
+#
+# Hot sections (votes, actions, status) are small and change often; cold ones
+# (roles_def, infra, tzclocks) are only rewritten when their bytes change.
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+
+# section -> payload keys it owns ("meta" takes every key not listed here)
+SECTIONS: Dict[str, tuple] = {
+    "players": ("players",),
+    "votes": ("votes",),
+    "actions": ("day_actions", "night_actions"),
+    "status": ("status_map",),
+    "roles": ("roles_def", "profile"),
+    "infra": ("infra",),
+    "tzclocks": ("tzclocks",),
+    "meta": (),
+}
+_OWNED = {k: name for name, keys in SECTIONS.items() for k in keys}
+
+
+def section_of(key: str) -> str:
+    """Section that stores a payload key (or a section name, passed through)."""
+    if key in SECTIONS:
+        return key
+    return _OWNED.get(key, "meta")
+
+
+def split_payload(payload: Dict[str, Any], only: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    wanted = set(SECTIONS) if only is None else {section_of(k) for k in only}
+    parts: Dict[str, Dict[str, Any]] = {name: {} for name in wanted}
+    for k, v in payload.items():
+        name = section_of(k)
+        if name in parts:
+            parts[name][k] = v
+    return parts
+
+
+class SectionedBackend(StorageBackend):
+    """
+    State directory with one atomically-written file per section plus a
+    manifest. encode() serializes only the sections a save dirtied (all of
+    them when no hint is given); write() rewrites a section only if its
+    bytes changed, then the manifest.
+    """
+    name = "sections"
+
+    def __init__(self, path: str, *, legacy_json: Optional[str] = None):
+        super().__init__(path)
+        self.legacy_json = legacy_json
+        self._manifest: Dict[str, Any] = {"version": MANIFEST_VERSION, "generation": 0, "sections": {}}
+        self._section_gen: Dict[str, int] = {}  # last save generation written, per section
+        # Sections fully written to disk. Replaced (never mutated) by write(), which
+        # runs under _write_lock, so encode() on the event loop can read it while a
+        # worker thread is inside write() mutating the manifest.
+        self._written: FrozenSet[str] = frozenset()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.json")
+
+    def _read_json(self, path: str) -> Dict[str, Any]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            with open(path + ".bak", "r", encoding="utf-8") as f:
+                log.warning(f"[storage] {os.path.basename(path)} failed, loaded from backup.")
+                return json.load(f)
+
+    # ---- StorageBackend ----
+    def load(self) -> Dict[str, Any]:
+        manifest_path = os.path.join(self.path, MANIFEST)
+        if not os.path.exists(manifest_path):
+            # First run on this layout: read the single-file state, the next save splits it
+            if self.legacy_json and os.path.exists(self.legacy_json):
+                log.info(f"[storage] No {MANIFEST} yet; loading {self.legacy_json}")
+                return JsonBackend(self.legacy_json).load()
+            raise RuntimeError(f"State load failed: no {MANIFEST} in {self.path}.")
+
+        self._manifest = self._read_json(manifest_path)
+        self._written = frozenset(self._manifest.get("sections") or {})
+        payload: Dict[str, Any] = {}
+        for name, info in (self._manifest.get("sections") or {}).items():
+            path = os.path.join(self.path, info.get("file") or f"{name}.json")
+            try:
+                payload.update(self._read_json(path))
+            except Exception as e:
+                log.critical(f"[storage] FATAL: Could not load section '{name}': {e}")
+                raise RuntimeError(f"State load failed: check {path} integrity.")
+        return payload
+
+    def encode(self, payload: Dict[str, Any], dirty: Optional[Iterable[str]] = None) -> Dict[str, bytes]:
+        if dirty is not None and not set(SECTIONS) <= self._written:
+            dirty = None  # directory not fully written yet (first save / migration)
+        return {name: _encode_json(part) for name, part in split_payload(payload, dirty).items()}
+
+    def commit(self, generation: int, snapshot: Dict[str, bytes]) -> bool:
+        # Snapshots can be partial, so staleness is judged per section:
+        # an older votes-only save must not be dropped because a newer
+        # players-only save landed first.
+        with self._write_lock:
+            fresh = {n: d for n, d in snapshot.items() if generation > self._section_gen.get(n, 0)}
+            if not fresh:
+                return False
+            self.write(fresh)
+            for n in fresh:
+                self._section_gen[n] = generation
+            self._written_gen = max(self._written_gen, generation)
+            return True
+
+    def write(self, snapshot: Dict[str, bytes]) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        sections = self._manifest.setdefault("sections", {})
+        changed = False
+        for name, data in snapshot.items():
+            digest = hashlib.sha1(data).hexdigest()
+            if sections.get(name, {}).get("sha1") == digest and os.path.exists(self._file(name)):
+                continue
+            _atomic_write_bytes(self._file(name), data, make_backup=True)
+            sections[name] = {"file": f"{name}.json", "sha1": digest, "bytes": len(data)}
+            changed = True
+        if changed:
+            self._manifest["version"] = MANIFEST_VERSION
+            self._manifest["generation"] = int(self._manifest.get("generation", 0)) + 1
+            _atomic_write_bytes(os.path.join(self.path, MANIFEST), _encode_json(self._manifest), make_backup=False)
+        self._written = self._written | frozenset(snapshot)
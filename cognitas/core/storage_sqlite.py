@@ -0,0 +1,200 @@
+# cognitas/core/storage_sqlite.py
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import threading
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .storage import StorageBackend, JsonBackend
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Schema
+# -------------------------------------------------------------------
+# One row per entity, so a save only touches the rows that changed.
+# Everything that is not a per-entity collection lives in `meta` (key -> JSON).
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta     (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS players  (uid TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS votes    (voter TEXT PRIMARY KEY, target TEXT);
+CREATE TABLE IF NOT EXISTS actions  (phase TEXT NOT NULL, cycle TEXT NOT NULL, uid TEXT NOT NULL, data TEXT NOT NULL,
+                                     PRIMARY KEY (phase, cycle, uid));
+CREATE TABLE IF NOT EXISTS statuses (uid TEXT NOT NULL, status TEXT NOT NULL, data TEXT NOT NULL,
+                                     PRIMARY KEY (uid, status));
+CREATE TABLE IF NOT EXISTS infra    (guild_id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tzclocks (guild_id TEXT PRIMARY KEY, data TEXT NOT NULL);
+"""
+
+# table -> (key columns, value column)
+TABLES: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "meta": (("key",), "value"),
+    "players": (("uid",), "data"),
+    "votes": (("voter",), "target"),
+    "actions": (("phase", "cycle", "uid"), "data"),
+    "statuses": (("uid", "status"), "data"),
+    "infra": (("guild_id",), "data"),
+    "tzclocks": (("guild_id",), "data"),
+}
+
+# payload keys that are stored in their own table (everything else -> meta)
+_TABLE_KEYS = {"players", "votes", "day_actions", "night_actions", "status_map", "infra", "tzclocks"}
+_ACTION_KEYS = {"day": "day_actions", "night": "night_actions"}
+
+Rows = Dict[str, Dict[tuple, str]]
+
+
+def _dumps(v: Any) -> str:
+    return json.dumps(v, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=list)
+
+
+def payload_to_rows(payload: Dict[str, Any]) -> Rows:
+    """Flatten a state payload into {table: {key_tuple: encoded_value}}."""
+    rows: Rows = {t: {} for t in TABLES}
+    for k, v in payload.items():
+        if k not in _TABLE_KEYS:
+            rows["meta"][(k,)] = _dumps(v)
+    for uid, p in (payload.get("players") or {}).items():
+        rows["players"][(str(uid),)] = _dumps(p)
+    for voter, target in (payload.get("votes") or {}).items():
+        rows["votes"][(str(voter),)] = None if target is None else str(target)
+    for phase, key in _ACTION_KEYS.items():
+        for cycle, bucket in (payload.get(key) or {}).items():
+            for uid, rec in (bucket or {}).items():
+                rows["actions"][(phase, str(cycle), str(uid))] = _dumps(rec)
+    for uid, effects in (payload.get("status_map") or {}).items():
+        for name, entry in (effects or {}).items():
+            rows["statuses"][(str(uid), str(name))] = _dumps(entry)
+    for gid, data in (payload.get("infra") or {}).items():
+        rows["infra"][(str(gid),)] = _dumps(data)
+    for gid, data in (payload.get("tzclocks") or {}).items():
+        rows["tzclocks"][(str(gid),)] = _dumps(data)
+    return rows
+
+
+def rows_to_payload(rows: Rows) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {k[0]: json.loads(v) for k, v in rows["meta"].items()}
+    payload["players"] = {k[0]: json.loads(v) for k, v in rows["players"].items()}
+    payload["votes"] = {k[0]: v for k, v in rows["votes"].items()}
+    payload["day_actions"], payload["night_actions"] = {}, {}
+    for (phase, cycle, uid), v in rows["actions"].items():
+        store = payload[_ACTION_KEYS.get(phase, "night_actions")]
+        store.setdefault(cycle, {})[uid] = json.loads(v)
+    payload["status_map"] = {}
+    for (uid, name), v in rows["statuses"].items():
+        payload["status_map"].setdefault(uid, {})[name] = json.loads(v)
+    payload["infra"] = {k[0]: json.loads(v) for k, v in rows["infra"].items()}
+    payload["tzclocks"] = {k[0]: json.loads(v) for k, v in rows["tzclocks"].items()}
+    return payload
+
+
+# -------------------------------------------------------------------
+# Backend
+# -------------------------------------------------------------------
+class SqliteBackend(StorageBackend):
+    """
+    SQLite (WAL) backend. Each save is one transaction that upserts only the
+    rows whose encoded value changed since the last save and deletes rows
+    that disappeared, so cost follows the size of the mutation, not the game.
+    """
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._last: Rows | None = None  # what the DB holds, as encoded rows
+
+    # ---- connection ----
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _read_rows(self, conn: sqlite3.Connection) -> Rows:
+        rows: Rows = {}
+        for table, (keys, val) in TABLES.items():
+            cur = conn.execute(f"SELECT {', '.join(keys)}, {val} FROM {table}")
+            rows[table] = {tuple(r[:-1]): r[-1] for r in cur.fetchall()}
+        return rows
+
+    # ---- StorageBackend ----
+    def load(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            self._last = self._read_rows(conn)
+            return rows_to_payload(self._last)
+
+    def encode(self, payload: Dict[str, Any], dirty: Optional[Iterable[str]] = None) -> Rows:
+        # Rows are plain strings, so the snapshot is detached from the live state
+        return payload_to_rows(payload)
+
+    def write(self, snapshot: Rows) -> None:
+        self.write_rows(snapshot)
+
+    def write_rows(self, new: Rows) -> int:
+        """Apply the diff between `new` and the DB contents in one transaction. Returns rows touched."""
+        with self._lock:
+            conn = self._connect()
+            if self._last is None:
+                self._last = self._read_rows(conn)
+            old = self._last
+            touched = 0
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table, (keys, val) in TABLES.items():
+                    before, after = old.get(table, {}), new.get(table, {})
+                    upserts = [(*k, v) for k, v in after.items() if before.get(k, _MISSING) != v]
+                    deletes = [k for k in before if k not in after]
+                    if upserts:
+                        cols = (*keys, val)
+                        conn.executemany(
+                            f"INSERT OR REPLACE INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})",
+                            upserts,
+                        )
+                    if deletes:
+                        where = " AND ".join(f"{k} = ?" for k in keys)
+                        conn.executemany(f"DELETE FROM {table} WHERE {where}", deletes)
+                    touched += len(upserts) + len(deletes)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                self._last = None  # resync from disk on next save
+                raise
+            self._last = {t: dict(r) for t, r in new.items()}
+            return touched
+
+
+_MISSING = object()
+
+
+# -------------------------------------------------------------------
+# Migration tool: python -m cognitas.core.storage_sqlite --from state.json --to state.db
+# -------------------------------------------------------------------
+def migrate_json_to_sqlite(json_path: str, db_path: str) -> Dict[str, int]:
+    payload = JsonBackend(json_path).load()
+    rows = payload_to_rows(payload)
+    SqliteBackend(db_path).write_rows(rows)
+    return {t: len(r) for t, r in rows.items()}
+
+
+def _main(argv: Iterable[str] | None = None) -> None:
+    from .. import config as cfg
+    ap = argparse.ArgumentParser(description="Migrate a state.json file into the SQLite backend.")
+    ap.add_argument("--from", dest="src", default=str(cfg.STATE_PATH), help="source state.json")
+    ap.add_argument("--to", dest="dst", default=str(cfg.STATE_DB_PATH), help="target SQLite file")
+    args = ap.parse_args(list(argv) if argv is not None else None)
+    counts = migrate_json_to_sqlite(args.src, args.dst)
+    print(f"Migrated {args.src} -> {args.dst}: " + ", ".join(f"{t}={n}" for t, n in counts.items()))
+    print("Set STORAGE_BACKEND=sqlite to use it.")
+
+
+if __name__ == "__main__":
+    _main()
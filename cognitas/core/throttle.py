@@ -0,0 +1,165 @@
+# cognitas/core/throttle.py
+from __future__ import annotations
+
+import time
+import logging
+from typing import Dict, Optional, Tuple
+
+import discord
+
+from .. import config as cfg
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Token-bucket throttling for hot commands
+# -------------------------------------------------------------------
+# cfg.THROTTLE_RULES maps a command's qualified name to bucket specs:
+#
+#   "votes": {"user": (burst, per_seconds), "guild": (burst, per_seconds)}
+#
+# Each (command, scope, id) gets its own bucket holding up to `burst` tokens
+# that refill at burst/per tokens per second. A call takes one token from the
+# user bucket AND the guild bucket; if either is empty it is refused.
+# Administrators are never throttled.
+#
+# Refused calls are answered cheaply: the last embed that command rendered
+# in the guild (remembered by InteractionCtx.reply) or a short notice.
+# bot.py's command tree calls gate() before every slash command; the vote
+# board view calls it for component clicks.
+
+Key = Tuple[str, str, int]
+
+_buckets: Dict[Key, "TokenBucket"] = {}
+_last_embed: Dict[Tuple[str, int], Tuple[discord.Embed, float]] = {}
+PRUNE_EVERY = 512  # checks between sweeps of idle (full) buckets
+_checks = 0
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "rate", "tokens", "stamp")
+
+    def __init__(self, capacity: float, per: float):
+        self.capacity = float(max(1.0, capacity))
+        self.rate = self.capacity / max(0.001, float(per))
+        self.tokens = self.capacity
+        self.stamp = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def peek(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= 1.0
+
+    def take(self) -> None:
+        self.tokens -= 1.0
+
+    def retry_after(self) -> float:
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+    def idle(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+def _is_admin(user) -> bool:
+    return bool(getattr(getattr(user, "guild_permissions", None), "administrator", False))
+
+
+def _bucket(name: str, scope: str, ident: int, spec) -> TokenBucket:
+    k = (name, scope, int(ident))
+    b = _buckets.get(k)
+    if b is None:
+        b = _buckets[k] = TokenBucket(*spec)
+    return b
+
+
+def _prune(now: float) -> None:
+    for k in [k for k, b in _buckets.items() if b.idle(now)]:
+        _buckets.pop(k, None)
+
+
+def check(name: str, user, guild_id: Optional[int]) -> Optional[float]:
+    """
+    Take a token for `name`. None if allowed, else seconds until the call
+    would be allowed again.
+    """
+    global _checks
+    rules = (getattr(cfg, "THROTTLE_RULES", None) or {}).get(name)
+    if not rules or user is None or _is_admin(user):
+        return None
+
+    now = time.monotonic()
+    _checks += 1
+    if _checks % PRUNE_EVERY == 0:
+        _prune(now)
+
+    buckets = []
+    if rules.get("user"):
+        buckets.append(_bucket(name, "user", user.id, rules["user"]))
+    if rules.get("guild") and guild_id:
+        buckets.append(_bucket(name, "guild", guild_id, rules["guild"]))
+
+    # All-or-nothing: a refused call must not drain the other bucket
+    empty = [b for b in buckets if not b.peek(now)]
+    if empty:
+        return max(b.retry_after() for b in empty)
+    for b in buckets:
+        b.take()
+    return None
+
+
+def reset() -> None:
+    _buckets.clear()
+    _last_embed.clear()
+
+
+# ---------- Cached replies ----------
+
+def remember_embed(name: str, guild_id: Optional[int], embed: discord.Embed) -> None:
+    if not guild_id or name not in (getattr(cfg, "THROTTLE_RULES", None) or {}):
+        return
+    _last_embed[(name, int(guild_id))] = (embed, time.monotonic())
+
+
+def cached_embed(name: str, guild_id: Optional[int]) -> Optional[Tuple[discord.Embed, float]]:
+    if not guild_id:
+        return None
+    return _last_embed.get((name, int(guild_id)))
+
+
+async def gate(interaction: discord.Interaction, name: Optional[str] = None) -> bool:
+    """
+    True if the interaction may run. Otherwise answers it (ephemeral, one
+    callback) with the cached embed or a notice, and returns False.
+    """
+    if name is None:
+        cmd = getattr(interaction, "command", None)
+        name = getattr(cmd, "qualified_name", None)
+    if not name:
+        return True
+    retry = check(name, interaction.user, interaction.guild_id)
+    if retry is None:
+        return True
+
+    wait = max(1, int(retry + 0.999))
+    hit = cached_embed(name, interaction.guild_id)
+    try:
+        if interaction.response.is_done():
+            return False
+        if hit is not None:
+            embed, ts = hit
+            age = int(time.monotonic() - ts)
+            await interaction.response.send_message(
+                f"⏳ Vas muy rápido. Último resultado (hace {age}s); inténtalo de nuevo en {wait}s.",
+                embed=embed, ephemeral=True,
+            )
+        else:
+            await interaction.response.send_message(
+                f"⏳ Vas muy rápido. Inténtalo de nuevo en {wait}s.", ephemeral=True
+            )
+    except Exception as e:
+        log.info(f"[throttle] notice failed for /{name}: {e!r}")
+    return False
@@ -0,0 +1,235 @@
+# cognitas/core/voteboard.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import discord
+
+from .. import config as cfg
+from .state import game
+from . import events
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Live vote board
+# -------------------------------------------------------------------
+# One pinned message per Day, posted by start_day and edited in place:
+#
+#   game.vote_board = {"channel_id", "message_id", "day", "reminder"}
+#
+# Vote/roster events only mark the board dirty; a single worker re-renders it
+# VOTE_BOARD_DEBOUNCE seconds later, so a burst of votes costs one edit.
+# Day reminders (reminders._timer_worker) update the board's countdown line
+# instead of posting new messages. end_day renders the final tally and unpins.
+#
+# The board carries a persistent view (select menu of alive players, unvote
+# and end-day buttons). The view class lives in cogs/votingcog.py, which
+# registers it here with set_view_factory() and with bot.add_view() so clicks
+# on an existing board keep working across restarts.
+
+# Board view capacity: 4 select rows (row 4 holds the buttons) x 25 options
+BOARD_SELECTS = 4
+OPTIONS_PER_SELECT = 25
+BOARD_CAPACITY = BOARD_SELECTS * OPTIONS_PER_SELECT
+
+_bot: Optional[discord.Client] = None
+_view_factory: Optional[Callable[[], discord.ui.View]] = None
+_dirty = False
+_task: Optional[asyncio.Task] = None
+
+
+def bind(bot: discord.Client) -> None:
+    global _bot
+    _bot = bot
+
+
+def set_view_factory(factory: Optional[Callable[[], discord.ui.View]]) -> None:
+    global _view_factory
+    _view_factory = factory
+
+
+def _view() -> Optional[discord.ui.View]:
+    try:
+        return _view_factory() if _view_factory else None
+    except Exception as e:
+        log.info(f"[voteboard] view build failed: {e!r}")
+        return None
+
+
+def _board() -> Optional[Dict[str, Any]]:
+    b = getattr(game, "vote_board", None)
+    return b if isinstance(b, dict) and b.get("message_id") else None
+
+
+def is_live() -> bool:
+    """True while the board belongs to the current, open Day."""
+    b = _board()
+    return bool(
+        b
+        and (getattr(game, "phase", "day") or "day").lower() == "day"
+        and int(b.get("day") or 0) == int(getattr(game, "current_day_number", 0) or 0)
+    )
+
+
+def jump_url() -> Optional[str]:
+    b = _board()
+    if not b:
+        return None
+    ch = _bot.get_channel(int(b["channel_id"])) if _bot else None
+    gid = getattr(getattr(ch, "guild", None), "id", None)
+    return f"https://discord.com/channels/{gid}/{b['channel_id']}/{b['message_id']}" if gid else None
+
+
+def render(*, closed: bool = False) -> discord.Embed:
+    from .votes import VOTES_PAGE_SIZE, _votes_targets_count, build_votes_embed
+    embed = build_votes_embed()
+    more = _votes_targets_count() - VOTES_PAGE_SIZE
+    if more > 0:
+        embed.description += f"\n*+{more} objetivos más — usa `/votes` para verlos todos.*"
+    b = _board() or {}
+    alive = len(game.players.alive_ids())
+    if not closed and alive > BOARD_CAPACITY:
+        embed.description += (
+            f"\n*Los menús muestran {BOARD_CAPACITY} de {alive} jugadores vivos; "
+            f"para votar al resto usa `/vote cast name:`.*"
+        )
+    if closed:
+        embed.title = f"{embed.title} (cerrado)"
+        embed.color = 0x95A5A6
+    elif b.get("reminder"):
+        embed.description += f"\n⏰ Quedan **{int(b['reminder'])} min**."
+    return embed
+
+
+# ---------- Posting / closing ----------
+
+async def post(bot: discord.Client, channel: discord.abc.Messageable) -> Optional[discord.Message]:
+    """Post and pin the board for the current Day (reuses it on a same-Day restart)."""
+    bind(bot)
+    if is_live() and int(_board()["channel_id"]) == getattr(channel, "id", None):
+        request_update()
+        return None
+    try:
+        view = _view()
+        msg = await channel.send(embed=render(), **({"view": view} if view else {}))
+    except Exception as e:
+        log.info(f"[voteboard] post failed: {e!r}")
+        return None
+    try:
+        await msg.pin(reason="Asdrubot: recuento de votos")
+    except Exception:
+        pass
+    game.vote_board = {
+        "channel_id": msg.channel.id,
+        "message_id": msg.id,
+        "day": int(getattr(game, "current_day_number", 0) or 0),
+        "reminder": None,
+    }
+    return msg
+
+
+def close():
+    """
+    Detach the board now (final tally rendered immediately, before votes are
+    cleared) and return a coroutine that does the final edit and unpin.
+    """
+    global _dirty
+    b = _board()
+    if not b:
+        return _noop()
+    embed = render(closed=True)
+    game.vote_board = None
+    _dirty = False
+    if _task and not _task.done():
+        _task.cancel()
+
+    async def _finish():
+        msg = _partial(b)
+        if msg is None:
+            return
+        try:
+            await msg.edit(embed=embed, view=None)
+        except Exception:
+            pass
+        try:
+            await msg.unpin(reason="Asdrubot: Día cerrado")
+        except Exception:
+            pass
+    return _finish()
+
+
+async def _noop():
+    return None
+
+
+# ---------- Debounced edits ----------
+
+def _partial(b: Dict[str, Any]) -> Optional[discord.PartialMessage]:
+    ch = _bot.get_channel(int(b["channel_id"])) if _bot else None
+    if ch is None or not hasattr(ch, "get_partial_message"):
+        return None
+    return ch.get_partial_message(int(b["message_id"]))
+
+
+def request_update() -> None:
+    """Mark the board dirty; the worker edits it once the burst settles."""
+    global _dirty, _task
+    if not is_live():
+        return
+    _dirty = True
+    if _task is not None and not _task.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _task = loop.create_task(_worker(), name="asdrubot-voteboard")
+
+
+async def _worker() -> None:
+    global _dirty
+    while _dirty:
+        await asyncio.sleep(cfg.VOTE_BOARD_DEBOUNCE)
+        _dirty = False
+        b = _board()
+        if not b or not is_live():
+            return
+        msg = _partial(b)
+        if msg is None:
+            return
+        try:
+            view = _view()
+            await msg.edit(embed=render(), **({"view": view} if view else {}))
+        except discord.NotFound:
+            # Board deleted by hand: post a fresh one in the same channel
+            game.vote_board = None
+            ch = _bot.get_channel(int(b["channel_id"])) if _bot else None
+            if ch is not None:
+                await post(_bot, ch)
+        except Exception as e:
+            log.info(f"[voteboard] edit failed: {e!r}")
+
+
+def set_reminder(minutes: int) -> bool:
+    """Show a countdown checkpoint on the board. False if there is no live board."""
+    b = _board()
+    if not b or not is_live():
+        return False
+    b["reminder"] = int(minutes)
+    request_update()
+    return True
+
+
+# ---------- Event wiring ----------
+
+@events.subscribe(events.VoteCast)
+@events.subscribe(events.VoteCleared)
+@events.subscribe(events.PlayerDied)
+@events.subscribe(events.PlayerRevived)
+@events.subscribe(events.StatusApplied)
+@events.subscribe(events.StatusExpired)
+def _on_change(ev: events.Event) -> None:
+    request_update()
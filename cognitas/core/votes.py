@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import math
 import random
 
@@ -7,11 +8,15 @@ import discord
 from discord.ext import commands
 
 from .state import game
+from . import events, johnbotjovi, members, paginator, voteboard
 from .storage import save_state  # async
 from .logs import log_event
+from .players import resolve_player_ref
 from . import phases
 from ..status import engine as SE
 
+VOTES_PAGE_SIZE = 10  # targets per /votes page (and on the vote board)
+
 
 # ---------- Helpers (names, hidden voters, etc.) ----------
 
@@ -19,8 +24,7 @@ def _player_record(uid: str) -> dict:
     return (getattr(game, "players", {}) or {}).get(uid, {})  # safe
 
 def _player_name(uid: str) -> str:
-    p = _player_record(uid)
-    return p.get("alias") or p.get("name") or p.get("display_name") or uid
+    return game.players.display_name(uid, prefer_alias=True)
 
 def _is_hidden_voter(uid: str) -> bool:
     return bool(_player_record(uid).get("flags", {}).get("hidden_vote", False))
@@ -38,23 +42,19 @@ def _glitch_name(length: int = 6) -> str:
     return "".join(out)
 
 def _alive_uids() -> list[str]:
-    players = getattr(game, "players", {}) or {}
-    return [uid for uid, p in players.items() if p.get("alive", True)]
+    return game.players.alive_ids()
 
 def _alive_display_names(uids: list[str], *, max_names: int = 24) -> str:
     """
     Returns a human-friendly list of alive player names (or mentions).
     Truncates if too long and appends '… (+N more)'.
     """
-    players = getattr(game, "players", {}) or {}
     names: list[str] = []
     for uid in uids[:max_names]:
-        p = players.get(uid) or {}
-        label = p.get("name") or p.get("alias") or f"<@{uid}>"
-        names.append(f"`{label}`")
+        names.append(f"`{game.players.display_name(uid, default=f'<@{uid}>')}`")
     extra = len(uids) - len(names)
     if extra > 0:
-        names.append(f"… (+{extra} más)") # Translated
+        names.append(f"… (+{extra} más, ver `/player list`)")
     return ", ".join(names) if names else "—"
 
 # ---------- Voting logic (simple majority + boosts & target extras) ----------
@@ -125,6 +125,55 @@ def _tally_votes_simple_plus_boosts() -> dict[str, float]:
         totals[target_id] = totals.get(target_id, 0.0) + val
     return totals
 
+_resolving: set[str] = set()        # targets with a member lookup in flight
+_lookups: set[asyncio.Task] = set()  # strong refs until done
+
+def _prerender_posters(guild, totals: dict[str, float] | None = None) -> None:
+    """
+    Speculative lynch posters: anyone within one vote of their threshold gets
+    a background render (johnbotjovi) so end_day can post it at once.
+    Renders for players who dropped out of that range are discarded.
+    Targets not in the member cache are fetched in a background task first.
+    """
+    try:
+        if totals is None:
+            totals = _tally_votes_simple_plus_boosts()
+        day = int(getattr(game, "current_day_number", 0) or 0)
+        near = sorted(
+            (tid for tid, total in totals.items() if total >= _needed_for_target(tid) - 1),
+            key=lambda tid: -totals[tid],
+        )
+        johnbotjovi.keep_prerenders(near, day=day)
+        if guild is None:
+            return
+        for tid in near:
+            member = members.cached(guild, tid)
+            if member is not None:
+                johnbotjovi.prerender(member, day=day)
+            elif tid not in _resolving:
+                _resolving.add(tid)
+                task = asyncio.get_running_loop().create_task(
+                    _resolve_and_prerender(guild, tid, day), name=f"asdrubot-poster-lookup-{tid}"
+                )
+                _lookups.add(task)
+                task.add_done_callback(_lookups.discard)
+    except Exception:
+        pass
+
+async def _resolve_and_prerender(guild, tid: str, day: int) -> None:
+    """Fetch a near-threshold target missing from the member cache, then render if still near."""
+    try:
+        member = await members.resolve(guild, tid)
+        if member is None or int(getattr(game, "current_day_number", 0) or 0) != day:
+            return
+        totals = _tally_votes_simple_plus_boosts()
+        if totals.get(tid, 0.0) >= _needed_for_target(tid) - 1:
+            johnbotjovi.prerender(member, day=day)
+    except Exception:
+        pass
+    finally:
+        _resolving.discard(tid)
+
 def _fmt_num(x: float) -> str:
     s = f"{x:.1f}"
     return s[:-2] if s.endswith(".0") else s
@@ -138,9 +187,20 @@ def _progress_bar(current: int, needed: int, width: int = 10) -> str:
 
 # ---------- Vote operations ----------
 
-async def vote(ctx: commands.Context | any, member: discord.Member):
+async def vote(ctx: commands.Context | any, member: discord.Member | str):
+    """Cast a vote. `member` may be a Member, a uid or a player name/alias."""
     voter_id = str(getattr(getattr(ctx, "author", None), "id", None) or getattr(getattr(ctx, "user", None), "id", None))
-    target_id = str(member.id)
+    target_id = str(getattr(member, "id", member))
+    if isinstance(member, discord.Member):
+        members.remember(member)
+    author = getattr(ctx, "author", None) or getattr(ctx, "user", None)
+    if isinstance(author, discord.Member):
+        members.remember(author)
+    if not hasattr(member, "id") and target_id not in game.players:
+        found = resolve_player_ref(target_id, alive_only=True)
+        if not found:
+            return await ctx.reply(f"❌ No encontré a ningún jugador vivo llamado `{target_id}`.", ephemeral=True)
+        target_id = found
 
     # Validations
     if voter_id not in game.players or not game.players[voter_id].get("alive", True):
@@ -164,7 +224,8 @@ async def vote(ctx: commands.Context | any, member: discord.Member):
     if not isinstance(getattr(game, "votes", None), dict):
         game.votes = {}
     game.votes[voter_id] = target_id
-    await save_state()  # async
+    events.publish(events.VoteCast(voter_id, target_id))
+    await save_state(dirty=("votes",))  # async
 
     # Show effective weight for transparency:
     w = SE.compute_vote_weight(game, voter_id, base=1.0)
@@ -196,6 +257,8 @@ async def vote(ctx: commands.Context | any, member: discord.Member):
             game.last_lynch_target = winner_id
             await save_state()
             await phases.end_day(ctx, closed_by_threshold=False, lynch_target_id=int(winner_id))
+        else:
+            _prerender_posters(getattr(ctx, "guild", None), totals)
     except Exception:
         pass
 
@@ -206,7 +269,10 @@ async def unvote(ctx: commands.Context | any):
         game.votes = {}
 
     existed = game.votes.pop(voter, None)
-    await save_state()
+    if existed is not None:
+        events.publish(events.VoteCleared(voter))
+        _prerender_posters(getattr(ctx, "guild", None))
+    await save_state(dirty=("votes",))
 
     if existed:
         return await ctx.reply("✅ Tu voto ha sido retirado.", ephemeral=True)
@@ -224,7 +290,9 @@ async def myvote(ctx: commands.Context | any):
 async def clearvotes(ctx: commands.Context | any):
     if isinstance(getattr(game, "votes", None), dict):
         game.votes.clear()
-    await save_state()
+    events.publish(events.VoteCleared())
+    johnbotjovi.clear_prerenders()
+    await save_state(dirty=("votes",))
     await ctx.reply("🧹 Todos los votos han sido limpiados.", ephemeral=True)
 
 
@@ -249,11 +317,28 @@ def _format_voter_list(voters: list[str]) -> str:
             labels.append(_player_name(uid))
     return ", ".join(labels) if labels else "—"
 
-async def votes_breakdown(ctx: commands.Context | any):
+def _join_capped(labels: list[str], limit: int = 1000) -> str:
+    """Comma list that fits an embed field, ending in '… (+N más)'."""
+    out: list[str] = []
+    size = 0
+    for i, label in enumerate(labels):
+        if size + len(label) + 2 > limit:
+            out.append(f"… (+{len(labels) - i} más)")
+            break
+        out.append(label)
+        size += len(label) + 2
+    return ", ".join(out)
+
+def _votes_targets_count(args: str = "") -> int:
+    return len(set((getattr(game, "votes", {}) or {}).values()))
+
+def build_votes_embed(start: int = 0, stop: int | None = VOTES_PAGE_SIZE, *, extras: bool = True) -> discord.Embed:
     """
-    UI: for each target shows current votes and its specific threshold (base + extras),
-    plus a progress bar. Anonymous votes hide voter identities.
-    Now includes 'End Day' progress bar if active.
+    Tally embed: for each target shows current votes and its specific threshold
+    (base + extras), plus a progress bar. Anonymous votes hide voter identities.
+    Includes the 'End Day' progress bar if active. Shared with the vote board.
+    Only targets [start, stop) of the progress ordering get a field (/votes
+    pages through the rest); extras=False drops the end-day/non-voter fields.
     """
     by_target = _group_votes_by_target()
     totals = _tally_votes_simple_plus_boosts()
@@ -279,10 +364,11 @@ async def votes_breakdown(ctx: commands.Context | any):
             need = max(1, _needed_for_target(tid))
             return totals.get(tid, 0) / need
 
-        for target_id, voters in sorted(
+        ranked = sorted(
             by_target.items(),
             key=lambda item: (-progress_ratio(item[0]), _player_name(item[0]).lower()),
-        ):
+        )
+        for target_id, voters in ranked[start:stop]:
             tname = _player_name(target_id)
             cur = totals.get(target_id, 0)
             need = _needed_for_target(target_id)
@@ -298,6 +384,10 @@ async def votes_breakdown(ctx: commands.Context | any):
                 inline=False
             )
 
+    if not extras:
+        embed.set_footer(text="Asdrubot v3.0 — Interfaz de Votación")
+        return embed
+
     # --- 2. End Day Requests (New) ---
     raw_reqs = getattr(game, "end_day_votes", [])
     alive_uids = _alive_uids()
@@ -324,12 +414,31 @@ async def votes_breakdown(ctx: commands.Context | any):
     if non_voters:
         embed.add_field(
             name=f"💤 Sin Votar ({len(non_voters)})",
-            value=", ".join(_player_name(uid) for uid in sorted(non_voters, key=_player_name)),
+            value=_join_capped([_player_name(uid) for uid in sorted(non_voters, key=_player_name)]),
             inline=False
         )
 
     embed.set_footer(text="Asdrubot v3.0 — Interfaz de Votación")
-    await ctx.reply(embed=embed)
+    return embed
+
+
+paginator.register(
+    "votes",
+    count=_votes_targets_count,
+    render=lambda args, start, stop, page, pages: build_votes_embed(start, stop, extras=page == 1),
+    page_size=VOTES_PAGE_SIZE,
+)
+
+
+async def votes_breakdown(ctx: commands.Context | any):
+    """
+    /game votes: while the Day has a live board, answer privately (plus a link)
+    instead of posting another public embed.
+    """
+    if voteboard.is_live():
+        link = voteboard.jump_url()
+        return await paginator.send(ctx, "votes", content=f"📌 Recuento en vivo: {link}" if link else None, ephemeral=True)
+    await paginator.send(ctx, "votes")
     
 
 async def status(ctx):
@@ -423,6 +532,7 @@ async def request_end_day(ctx: commands.Context | any):
 
     end_set.add(uid)
     game.end_day_votes = list(end_set)
+    voteboard.request_update()
     await save_state()
 
     # 4. Calculation
@@ -0,0 +1,626 @@
+# cognitas/devtools/loadtest.py
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import itertools
+import logging
+import random
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import discord
+
+from .. import config as cfg
+
+log = logging.getLogger(__name__)
+
+# -------------------------------------------------------------------
+# Load-test harness
+# -------------------------------------------------------------------
+# Boots AsdruBot with its real cogs against an in-process Discord stand-in
+# (guild, channels, members, interactions). No token and no network. Every
+# REST call the bot would make goes through FakeRest, which counts it per
+# route and sleeps a simulated latency. A scripted game is then replayed
+# with concurrent interactions:
+#
+#   Day:   vote storms (/vote cast, flip-flops with /vote clear) while
+#          viewers spam /votes and /status
+#   Night: an /act burst from every night actor at once
+#
+# The report gives p50/p95/p99 handler latency and time-to-ack per command,
+# how many interactions would have missed Discord's 3 s deadline, REST calls
+# per route, and state snapshots taken/written.
+#
+#   python -m cognitas.devtools.loadtest --players 80 --storms 3 --viewers 40
+#
+# State, audit log, status history and asset cache go to a temp directory.
+
+ACK_DEADLINE = 3.0  # seconds Discord waits for the first interaction response
+
+_ids = itertools.count(1_100_000_000_000_000_000)
+
+
+def _snowflake() -> int:
+    return next(_ids)
+
+
+# ---------- REST stand-in ----------
+
+class FakeRest:
+    """Counts calls per route and simulates their latency."""
+
+    def __init__(self, latency_ms: float = 40.0, jitter: float = 0.5):
+        self.latency = max(0.0, latency_ms) / 1000.0
+        self.jitter = jitter
+        self.calls: Counter = Counter()
+
+    async def __call__(self, route: str) -> None:
+        self.calls[route] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+class FakeAsset:
+    _png: Optional[bytes] = None
+
+    def __init__(self, rest: FakeRest):
+        self._rest = rest
+
+    def with_size(self, size):
+        return self
+
+    def with_static_format(self, fmt):
+        return self
+
+    async def read(self) -> bytes:
+        await self._rest("GET cdn/avatars/{user_id}")
+        if FakeAsset._png is None:
+            try:
+                from PIL import Image
+                buf = io.BytesIO()
+                Image.new("RGBA", (128, 128), (200, 40, 40, 255)).save(buf, format="PNG")
+                FakeAsset._png = buf.getvalue()
+            except Exception:
+                FakeAsset._png = b""
+        return FakeAsset._png
+
+
+class FakeRole:
+    def __init__(self, name: str, *, default: bool = False):
+        self.id = _snowflake()
+        self.name = name
+        self.mention = f"<@&{self.id}>"
+        self._default = default
+
+    def is_default(self) -> bool:
+        return self._default
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __eq__(self, other):
+        return getattr(other, "id", None) == self.id
+
+
+class FakeAttachment:
+    def __init__(self, filename: str):
+        exp = int(time.time()) + 86400
+        self.filename = filename
+        self.url = f"https://cdn.example.invalid/attachments/{_snowflake()}/{filename}?ex={exp:x}"
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", mid: Optional[int] = None, *, content=None, attachments=()):
+        self.id = mid or _snowflake()
+        self.channel = channel
+        self.guild = channel.guild
+        self.content = content
+        self.attachments = list(attachments)
+
+    async def edit(self, **kwargs):
+        await self.channel._rest("PATCH /channels/{channel_id}/messages/{message_id}")
+        return self
+
+    async def pin(self, **kwargs):
+        await self.channel._rest("PUT /channels/{channel_id}/pins/{message_id}")
+
+    async def unpin(self, **kwargs):
+        await self.channel._rest("DELETE /channels/{channel_id}/pins/{message_id}")
+
+    async def delete(self, *, delay=None):
+        await self.channel._rest("DELETE /channels/{channel_id}/messages/{message_id}")
+
+
+class FakeChannel(discord.TextChannel):
+    """A TextChannel (so isinstance checks pass) whose I/O goes to FakeRest."""
+
+    def __init__(self, guild: "FakeGuild", name: str, rest: FakeRest):  # noqa: no super().__init__
+        self.id = _snowflake()
+        self.name = name
+        self.guild = guild
+        self.topic = None
+        self.category_id = None
+        self._rest = rest
+        self._overwrites_map: Dict[int, discord.PermissionOverwrite] = {}
+        self.sent: List[FakeMessage] = []
+
+    @property
+    def mention(self) -> str:
+        return f"<#{self.id}>"
+
+    async def send(self, content=None, **kwargs):
+        await self._rest("POST /channels/{channel_id}/messages")
+        files = list(kwargs.get("files") or ([kwargs["file"]] if kwargs.get("file") else []))
+        msg = FakeMessage(self, content=content,
+                          attachments=[FakeAttachment(getattr(f, "filename", None) or "file") for f in files])
+        self.sent.append(msg)
+        return msg
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self, int(message_id))
+
+    def overwrites_for(self, obj) -> discord.PermissionOverwrite:
+        return self._overwrites_map.get(getattr(obj, "id", 0), discord.PermissionOverwrite())
+
+    async def set_permissions(self, target, *, overwrite=None, reason=None, **perms):
+        await self._rest("PUT /channels/{channel_id}/permissions/{overwrite_id}")
+        self._overwrites_map[getattr(target, "id", 0)] = overwrite or discord.PermissionOverwrite(**perms)
+
+    async def edit(self, **kwargs):
+        await self._rest("PATCH /channels/{channel_id}")
+        for k in ("name", "topic"):
+            if k in kwargs:
+                setattr(self, k, kwargs[k])
+        return self
+
+
+class FakeMember:
+    def __init__(self, guild: "FakeGuild", name: str, rest: FakeRest, *, admin: bool = False):
+        self.id = _snowflake()
+        self.name = name
+        self.display_name = name
+        self.global_name = name
+        self.mention = f"<@{self.id}>"
+        self.bot = False
+        self.guild = guild
+        self.roles: List[FakeRole] = [guild.default_role]
+        self.guild_permissions = discord.Permissions.all() if admin else discord.Permissions.none()
+        self.display_avatar = FakeAsset(rest)
+        self._rest = rest
+
+    async def send(self, content=None, **kwargs):
+        await self._rest("POST /users/@me/channels")
+        await self._rest("POST /channels/{dm_channel_id}/messages")
+
+    async def edit(self, *, roles=None, reason=None, **kwargs):
+        await self._rest("PATCH /guilds/{guild_id}/members/{user_id}")
+        if roles is not None:
+            self.roles = [self.guild.default_role, *[r for r in roles if not r.is_default()]]
+        return self
+
+    def __str__(self):
+        return self.name
+
+
+class FakeGuild:
+    """
+    Guild with one game channel, Alive/Dead roles and the given members.
+    get_member() follows config.CACHE_PROFILE: in "lean" nothing is cached
+    and lookups go through fetch_member(), as they would in production.
+    """
+
+    def __init__(self, rest: FakeRest):
+        self.id = _snowflake()
+        self.name = "loadtest"
+        self._rest = rest
+        self.default_role = FakeRole("@everyone", default=True)
+        self.role_alive = FakeRole("Vivo")
+        self.role_dead = FakeRole("Muerto")
+        self._roles = {r.id: r for r in (self.default_role, self.role_alive, self.role_dead)}
+        self._members: Dict[int, FakeMember] = {}
+        self._channels: Dict[int, FakeChannel] = {}
+        self.me = None
+        self.categories: List[Any] = []
+
+    def add_member(self, member: FakeMember) -> FakeMember:
+        self._members[member.id] = member
+        return member
+
+    def add_channel(self, channel: FakeChannel) -> FakeChannel:
+        self._channels[channel.id] = channel
+        return channel
+
+    @property
+    def members(self) -> List[FakeMember]:
+        return list(self._members.values())
+
+    @property
+    def text_channels(self) -> List[FakeChannel]:
+        return list(self._channels.values())
+
+    @property
+    def channels(self) -> List[FakeChannel]:
+        return list(self._channels.values())
+
+    def get_member(self, uid: int) -> Optional[FakeMember]:
+        if cfg.CACHE_PROFILE == "lean":
+            return None
+        return self._members.get(int(uid))
+
+    async def fetch_member(self, uid: int) -> FakeMember:
+        await self._rest("GET /guilds/{guild_id}/members/{user_id}")
+        m = self._members.get(int(uid))
+        if m is None:
+            raise discord.NotFound(_FakeResponse(404), "Unknown Member")
+        return m
+
+    def get_channel(self, cid):
+        return self._channels.get(int(cid)) if cid else None
+
+    get_channel_or_thread = get_channel
+
+    def get_thread(self, cid):
+        return None
+
+    def get_role(self, rid):
+        return self._roles.get(int(rid)) if rid else None
+
+
+class _FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "fake"
+
+
+# ---------- Interactions ----------
+
+class FakeInteractionResponse:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._i = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _ack(self):
+        if self._done:
+            raise discord.InteractionResponded(self._i)  # type: ignore[arg-type]
+        self._done = True
+        await self._i._rest("POST /interactions/{interaction_id}/{token}/callback")
+        self._i.acked_at = time.perf_counter()
+
+    async def defer(self, *, ephemeral: bool = False, thinking: bool = False):
+        await self._ack()
+
+    async def send_message(self, content=None, **kwargs):
+        await self._ack()
+
+
+class FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._i = interaction
+
+    async def send(self, content=None, **kwargs):
+        await self._i._rest("POST /webhooks/{application_id}/{token}")
+        return FakeMessage(self._i.channel, content=content)
+
+
+class FakeInteraction:
+    def __init__(self, bot, user: FakeMember, channel: FakeChannel, rest: FakeRest):
+        self.id = _snowflake()
+        self.client = bot
+        self.user = user
+        self.guild = channel.guild
+        self.guild_id = channel.guild.id
+        self.channel = channel
+        self.channel_id = channel.id
+        self.data: Dict[str, Any] = {}
+        self.created_at = discord.utils.utcnow()
+        self._rest = rest
+        self.response = FakeInteractionResponse(self)
+        self.followup = FakeFollowup(self)
+        self.started_at = time.perf_counter()
+        self.acked_at: Optional[float] = None
+
+
+# ---------- Bot ----------
+
+def _make_bot(guild: FakeGuild):
+    from ..bot import AsdruBot, COG_MODULES
+
+    class HarnessBot(AsdruBot):
+        """AsdruBot whose guild/channel lookups resolve to the fake guild."""
+
+        def __init__(self):
+            super().__init__()
+            self._fake_guild = guild
+
+        @property
+        def loop(self):
+            return asyncio.get_running_loop()
+
+        @loop.setter
+        def loop(self, value):
+            pass
+
+        @property
+        def guilds(self):
+            return [self._fake_guild]
+
+        def get_guild(self, gid):
+            return self._fake_guild if gid == self._fake_guild.id else None
+
+        def get_channel(self, cid):
+            return self._fake_guild.get_channel(cid)
+
+        def add_view(self, view, *, message_id=None):
+            pass  # no gateway: component routing is not exercised
+
+        async def load_cogs(self):
+            for mod in COG_MODULES:
+                await self.load_extension(mod)
+
+        def command(self, path: str):
+            parts = path.split()
+            cmd = self.tree.get_command(parts[0])
+            for p in parts[1:]:
+                cmd = cmd.get_command(p)
+            if cmd is None:
+                raise KeyError(path)
+            return cmd
+
+    return HarnessBot()
+
+
+# ---------- Metrics ----------
+
+def _pct(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    k = max(0, min(len(s) - 1, int(round(p / 100.0 * len(s) + 0.5)) - 1))
+    return s[k]
+
+
+class Metrics:
+    def __init__(self):
+        self.handler: Dict[str, List[float]] = defaultdict(list)
+        self.ack: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.late: Counter = Counter()
+        self.snapshots = 0
+        self.writes = 0
+        self.dropped_writes = 0
+
+    def record(self, name: str, i: FakeInteraction, ended: float, error: Optional[BaseException]) -> None:
+        self.handler[name].append(ended - i.started_at)
+        ack = (i.acked_at or ended) - i.started_at
+        self.ack[name].append(ack)
+        if ack > ACK_DEADLINE or i.acked_at is None:
+            self.late[name] += 1
+        if error is not None:
+            self.errors[f"{name}: {type(error).__name__}"] += 1
+
+
+def _count_state_writes(metrics: Metrics) -> None:
+    from ..core import storage
+    backend = storage.get_backend()
+    encode, commit = backend.encode, backend.commit
+
+    def _encode(payload, dirty=None):
+        metrics.snapshots += 1
+        return encode(payload, dirty)
+
+    def _commit(generation, snapshot):
+        ok = commit(generation, snapshot)
+        if ok:
+            metrics.writes += 1
+        else:
+            metrics.dropped_writes += 1
+        return ok
+
+    backend.encode, backend.commit = _encode, _commit
+
+
+# ---------- Scenario ----------
+
+class LoadTest:
+    def __init__(self, opts: argparse.Namespace):
+        self.opts = opts
+        self.rest = FakeRest(opts.latency_ms, opts.jitter)
+        self.metrics = Metrics()
+        self.guild = FakeGuild(self.rest)
+        self.channel = self.guild.add_channel(FakeChannel(self.guild, "general-juego", self.rest))
+        self.admin = self.guild.add_member(FakeMember(self.guild, "gm", self.rest, admin=True))
+        self.players: List[FakeMember] = [
+            self.guild.add_member(FakeMember(self.guild, f"player{i:03d}", self.rest))
+            for i in range(opts.players)
+        ]
+        self.rng = random.Random(opts.seed)
+        self.bot = None
+
+    def _seed_state(self) -> None:
+        from ..core.state import game
+        from ..core import storage
+        from ..core.infra import set_infra
+        storage._ensure_defaults()
+        night_every = max(1, int(round(1 / max(0.01, self.opts.night_actors))))
+        game.players = {
+            str(m.id): {
+                "uid": str(m.id), "name": m.name, "alive": True, "role": None,
+                "flags": {"night_act": i % night_every == 0}, "effects": [], "aliases": [],
+            }
+            for i, m in enumerate(self.players)
+        }
+        game.votes, game.end_day_votes, game.status_map = {}, [], {}
+        game.day_actions, game.night_actions, game.resolved_nights = {}, {}, []
+        game.phase, game.current_day_number = "night", 0
+        game.day_deadline_epoch = game.night_deadline_epoch = None
+        game.game_channel_id = self.channel.id
+        game.game_id = int(time.time())
+        game.game_over = False
+        game.vote_board = None
+        set_infra(self.guild.id, {
+            "channels": {"game": self.channel.id},
+            "roles": {"alive": self.guild.role_alive.id, "dead": self.guild.role_dead.id},
+        })
+
+    async def invoke(self, path: str, user: FakeMember, **kwargs) -> None:
+        cmd = self.bot.command(path)
+        i = FakeInteraction(self.bot, user, self.channel, self.rest)
+        err = None
+        try:
+            await cmd.callback(cmd.binding, i, **kwargs)
+        except Exception as e:  # a failed handler is a data point, not a crash
+            err = e
+        self.metrics.record(path, i, time.perf_counter(), err)
+
+    def _alive(self) -> List[FakeMember]:
+        from ..core.state import game
+        return [m for m in self.players if game.players.is_alive(str(m.id))]
+
+    # ---- phases ----
+    async def day(self) -> None:
+        o = self.opts
+        await self.invoke("start_day", self.admin, duration="24h")
+        for _ in range(o.storms):
+            alive = self._alive()
+            if not alive:
+                return
+            pile = self.rng.choice(alive)
+            jobs = []
+            for m in alive:
+                target = pile if self.rng.random() < o.pile else self.rng.choice(alive)
+                jobs.append(self.invoke("vote cast", m, member=target))
+                if self.rng.random() < o.flip:
+                    jobs.append(self.invoke("vote clear", m))
+            for _ in range(o.viewers):
+                viewer = self.rng.choice(alive)
+                jobs.append(self.invoke("votes" if self.rng.random() < 0.7 else "status", viewer))
+            self.rng.shuffle(jobs)
+            await asyncio.gather(*jobs)
+            await asyncio.sleep(cfg.VOTE_BOARD_DEBOUNCE + 0.05)  # let the board settle
+        from ..core.state import game
+        if (game.phase or "day") == "day" and game.day_deadline_epoch:
+            await self.invoke("end_day", self.admin)
+
+    async def night(self) -> None:
+        from ..core.state import game
+        await self.invoke("start_night", self.admin, duration="12h")
+        actors = [m for m in self._alive() if (game.players[str(m.id)].get("flags") or {}).get("night_act")]
+        alive = self._alive()
+        await asyncio.gather(*(
+            self.invoke("act", m, target=self.rng.choice(alive), note="loadtest")
+            for m in actors
+        ))
+        await self.invoke("end_night", self.admin)
+
+    async def run(self) -> None:
+        self._seed_state()
+        self.bot = _make_bot(self.guild)
+        await self.bot.load_cogs()
+        _count_state_writes(self.metrics)
+        t0 = time.perf_counter()
+        for _ in range(self.opts.cycles):
+            await self.day()
+            await self.night()
+        self.elapsed = time.perf_counter() - t0
+        await self._drain()
+
+    async def _drain(self) -> None:
+        from ..core.logs import flush_logs
+        from ..core import reminders
+        try:
+            await flush_logs()
+        except Exception:
+            pass
+        reminders.cancel_all_timers()
+        me = asyncio.current_task()
+        for t in asyncio.all_tasks():
+            if t is not me:
+                t.cancel()
+
+    # ---- report ----
+    def report(self) -> str:
+        m = self.metrics
+        lines = [
+            f"Load test: {self.opts.players} players, {self.opts.cycles} cycle(s), "
+            f"{self.opts.storms} vote storm(s)/day, {self.opts.viewers} viewers/storm, "
+            f"REST latency {self.opts.latency_ms:g} ms, cache profile '{cfg.CACHE_PROFILE}'",
+            f"Wall time: {self.elapsed:.2f}s",
+            "",
+            f"{'command':<12} {'n':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'ack p99':>8} {'>3s':>5}",
+        ]
+        for name in sorted(m.handler):
+            h = m.handler[name]
+            lines.append(
+                f"{name:<12} {len(h):>5} {_pct(h, 50) * 1000:>7.0f}ms {_pct(h, 95) * 1000:>7.0f}ms "
+                f"{_pct(h, 99) * 1000:>7.0f}ms {_pct(m.ack[name], 99) * 1000:>7.0f}ms {m.late[name]:>5}"
+            )
+        lines += ["", f"REST calls: {sum(self.rest.calls.values())}"]
+        for route, n in self.rest.calls.most_common():
+            lines.append(f"  {n:>6}  {route}")
+        lines += [
+            "",
+            f"State: {m.snapshots} snapshots, {m.writes} writes, {m.dropped_writes} superseded",
+        ]
+        if m.errors:
+            lines += ["", "Handler errors:"] + [f"  {n:>6}  {k}" for k, n in m.errors.most_common()]
+        return "\n".join(lines)
+
+
+def _configure_sandbox(tmp: Path, opts: argparse.Namespace) -> None:
+    cfg.STATE_PATH = tmp / "state.json"
+    cfg.STATE_DB_PATH = tmp / "state.db"
+    cfg.STATE_DIR = tmp / "state"
+    cfg.STORAGE_BACKEND = opts.backend
+    cfg.AUDIT_LOG_PATH = tmp / "logs" / "audit.jsonl"
+    cfg.STATUS_AUDIT_PATH = tmp / "status_audit.db"
+    cfg.ARCHIVE_DIR = tmp / "archive"
+    cfg.ASSET_CACHE_PATH = tmp / "asset_cache.json"
+    cfg.CACHE_PROFILE = opts.cache_profile
+    cfg.VOTE_BOARD_DEBOUNCE = opts.debounce
+
+
+def _parse(argv: Iterable[str] | None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Replay a scripted game against a local Discord stand-in.")
+    ap.add_argument("--players", type=int, default=60)
+    ap.add_argument("--cycles", type=int, default=1, help="Day+Night cycles to play")
+    ap.add_argument("--storms", type=int, default=3, help="vote storms per Day")
+    ap.add_argument("--viewers", type=int, default=30, help="/votes + /status calls per storm")
+    ap.add_argument("--flip", type=float, default=0.2, help="chance a voter also runs /vote clear")
+    ap.add_argument("--pile", type=float, default=0.0, help="chance a vote goes to the storm's favourite")
+    ap.add_argument("--night-actors", type=float, default=0.34, help="share of players with night_act")
+    ap.add_argument("--latency-ms", type=float, default=40.0, help="simulated REST latency")
+    ap.add_argument("--jitter", type=float, default=0.5)
+    ap.add_argument("--debounce", type=float, default=cfg.VOTE_BOARD_DEBOUNCE, help="vote board debounce (s)")
+    ap.add_argument("--backend", default="json", choices=("json", "sqlite", "sections"))
+    ap.add_argument("--cache-profile", default=cfg.CACHE_PROFILE, choices=("lean", "full"))
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--keep", action="store_true", help="keep the temp directory")
+    return ap.parse_args(list(argv) if argv is not None else None)
+
+
+def _main(argv: Iterable[str] | None = None) -> None:
+    opts = _parse(argv)
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(name)s: %(message)s")
+    tmp = Path(tempfile.mkdtemp(prefix="asdrubot-loadtest-"))
+    _configure_sandbox(tmp, opts)
+    random.seed(opts.seed)
+    lt = LoadTest(opts)
+    asyncio.run(lt.run())
+    print(lt.report())
+    if opts.keep:
+        print(f"\nArtifacts: {tmp}")
+    else:
+        import shutil
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    _main()
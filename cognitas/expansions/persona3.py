@@ -1,7 +1,6 @@
 from __future__ import annotations
 import discord
 import random
-import os
 from typing import List
 from . import Expansion, register
 from ..status import Status, register as register_status
@@ -112,23 +111,16 @@ class PersonaExpansion(Expansion):
     def _find_image_for_count(self, count: int) -> str | None:
         """
         Locate the countdown image.
-        Target directory: cognitas/expansions/assets/p3/
+        Target directory: cognitas/expansions/assets/p3/ (indexed once by core/assets)
         """
-        # Build path relative to THIS file (persona3.py)
-        base_dir = os.path.join(os.path.dirname(__file__), "assets", "p3")
-        
+        from ..core import assets
+
         # Try multiple formats and filenames
-        for ext in [".jpg", ".png", ".jpeg", ".gif"]:
-            candidates = [
-                f"p3_hour_{count}{ext}", 
-                f"hour_{count}{ext}", 
-                f"{count}{ext}"
-            ]
-            for fname in candidates:
-                full = os.path.join(base_dir, fname)
-                if os.path.exists(full):
-                    return full
-        return None
+        return assets.find("p3", (
+            fname
+            for ext in (".jpg", ".png", ".jpeg", ".gif")
+            for fname in (f"p3_hour_{count}{ext}", f"hour_{count}{ext}", f"{count}{ext}")
+        ))
 
     def get_status_lines(self, game_state) -> list[str]:
         c = self._count_arcanas(game_state, alive_only=True)
@@ -195,16 +187,10 @@ class PersonaExpansion(Expansion):
             return # Phase 0
 
         # Select candidates
-        candidates = []
-        for uid, p in game_state.players.items():
-            if not p.get("alive", True): continue
-            
-            if filter_flag:
-                flags = p.get("flags", {})
-                if flags.get(filter_flag, False):
-                    candidates.append(uid)
-            else:
-                candidates.append(uid)
+        if filter_flag:
+            candidates = sorted(game_state.players.with_flag(filter_flag, alive_only=True))
+        else:
+            candidates = game_state.players.alive_ids()
 
         if not candidates: return
 
@@ -226,25 +212,13 @@ class PersonaExpansion(Expansion):
     # --------------------------------------------------------------------------
 
     def _count_arcanas(self, game_state, alive_only: bool = True) -> int:
-        c = 0
-        for uid, p in getattr(game_state, "players", {}).items():
-            is_arcana = p.get("flags", {}).get("arcana")
-            is_alive = p.get("alive", True)
-            
-            if is_arcana:
-                if alive_only and not is_alive:
-                    continue
-                c += 1
-        return c
+        return game_state.players.count_flag("arcana", alive_only=alive_only)
 
     def _get_active_oracles(self, game_state, exclude_uid: str | None = None) -> List[str]:
         """Return UIDs of alive players with 'oracle' flag."""
-        out = []
-        for uid, p in getattr(game_state, "players", {}).items():
-            if uid == exclude_uid: continue
-            if p.get("alive", True) and p.get("flags", {}).get("oracle", False):
-                out.append(uid)
-        return out
+        oracles = game_state.players.with_flag("oracle", alive_only=True)
+        oracles.discard(exclude_uid)
+        return sorted(oracles)
 
     async def _send_fuuka_log(self, guild: discord.Guild, game_state):
         from ..core import actions as act_core       # Local import
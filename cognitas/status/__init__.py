@@ -3,16 +3,21 @@ from typing import Dict, Type, Optional, Callable
 
 # ---- registry ----
 _REGISTRY: Dict[str, "Type[Status]"] = {}
+# status_map keys come from Status.name ("Bullet Ammo"), which may differ from
+# the registered name ("BulletAmmo"); resolve those too.
+_BY_STATE_NAME: Dict[str, "Type[Status]"] = {}
 
 def register(name: str) -> Callable[[Type["Status"]], Type["Status"]]:
     key = name.lower().strip()
     def _wrap(cls: Type["Status"]) -> Type["Status"]:
         _REGISTRY[key] = cls
+        _BY_STATE_NAME[str(getattr(cls, "name", key)).lower().strip()] = cls
         return cls
     return _wrap
 
 def get_state_cls(name: str) -> Optional["Type[Status]"]:
-    return _REGISTRY.get((name or "").lower().strip())
+    key = (name or "").lower().strip()
+    return _REGISTRY.get(key) or _BY_STATE_NAME.get(key)
 
 def list_registered() -> Dict[str, "Type[Status]"]:
     return dict(_REGISTRY)
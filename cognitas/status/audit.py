@@ -0,0 +1,167 @@
+from __future__ import annotations
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from .. import config as cfg
+
+# Append-only, queryable history of status changes.
+# Rows are buffered in memory and written in batches by save_state's worker
+# thread (or, when the buffer fills, by a flush handed to a worker thread), so
+# the engine's hot path never touches the disk. Readers (history/count) do
+# SQLite I/O: call them via asyncio.to_thread from the event loop.
+#
+# status_audit(id, game_id, ts, day, phase, kind, uid, status, stacks, remaining, source)
+#   kind: APPLY | HEAL | EXPIRE
+
+FLUSH_THRESHOLD = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS status_audit (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id   INTEGER,
+    ts        REAL    NOT NULL,
+    day       INTEGER,
+    phase     TEXT,
+    kind      TEXT    NOT NULL,
+    uid       TEXT,
+    status    TEXT,
+    stacks    INTEGER,
+    remaining INTEGER,
+    source    TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_status_audit_uid    ON status_audit (game_id, uid, id);
+CREATE INDEX IF NOT EXISTS ix_status_audit_status ON status_audit (game_id, status, id);
+"""
+
+_COLUMNS = ("game_id", "ts", "day", "phase", "kind", "uid", "status", "stacks", "remaining", "source")
+
+_pending: List[tuple] = []
+_lock = threading.Lock()
+_schema_ready = False
+_flush_scheduled = False
+
+
+def _connect() -> sqlite3.Connection:
+    global _schema_ready
+    # One DB per shard range: game_ids are start timestamps, so two processes
+    # starting games in the same second would otherwise share rows.
+    from ..core.sharding import scoped_path
+    path = Path(scoped_path(cfg.STATUS_AUDIT_PATH))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=5.0)
+    if not _schema_ready:
+        conn.executescript(_SCHEMA)
+        _schema_ready = True
+    return conn
+
+
+def record(game, kind: str, uid: str, status: str, entry: Optional[dict] = None) -> None:
+    """Buffer one audit row. Cheap: no I/O unless the buffer is full."""
+    entry = entry or {}
+    row = (
+        getattr(game, "game_id", None),
+        time.time(),
+        getattr(game, "current_day_number", None),
+        getattr(game, "phase", None),
+        kind,
+        str(uid),
+        status,
+        entry.get("stacks"),
+        entry.get("remaining"),
+        entry.get("source"),
+    )
+    global _flush_scheduled
+    with _lock:
+        _pending.append(row)
+        full = len(_pending) >= FLUSH_THRESHOLD and not _flush_scheduled
+        if full:
+            _flush_scheduled = True
+    if full:
+        try:
+            asyncio.get_running_loop().run_in_executor(None, _flush_quietly)
+        except RuntimeError:
+            _flush_quietly()  # no loop (scripts/tools)
+
+
+def _flush_quietly() -> None:
+    global _flush_scheduled
+    try:
+        flush()
+    except Exception:
+        pass  # retried on the next save
+    finally:
+        _flush_scheduled = False
+
+
+def flush() -> int:
+    """Write buffered rows in a single transaction. Safe to call from a worker thread."""
+    global _pending
+    with _lock:
+        rows, _pending = _pending, []
+    if not rows:
+        return 0
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.executemany(
+                f"INSERT INTO status_audit ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                rows,
+            )
+    except Exception:
+        # Put rows back in front so nothing is lost; the next flush retries
+        with _lock:
+            _pending = rows + _pending
+        raise
+    return len(rows)
+
+
+def _status_column(name: str) -> str:
+    """Rows store the status_map key (Status.name, lowercased); accept registry keys too."""
+    from . import get_state_cls
+    cls = get_state_cls(name)
+    return str(getattr(cls, "name", None) or name).lower().strip()
+
+
+def _where(game_id: Optional[int], uid: Optional[str], status: Optional[str]) -> tuple[str, list]:
+    clauses, args = ["game_id IS ?"], [game_id]
+    if uid:
+        clauses.append("uid = ?")
+        args.append(str(uid))
+    if status:
+        clauses.append("status = ?")
+        args.append(_status_column(status))
+    return " AND ".join(clauses), args
+
+
+def history(game, *, uid: Optional[str] = None, status: Optional[str] = None,
+            limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+    """Newest-first rows for the current game, optionally filtered by player and/or status."""
+    flush()
+    where, args = _where(getattr(game, "game_id", None), uid, status)
+    with closing(_connect()) as conn:
+        conn.row_factory = sqlite3.Row
+        cur = conn.execute(
+            f"SELECT * FROM status_audit WHERE {where} ORDER BY id DESC LIMIT ? OFFSET ?",
+            (*args, int(limit), int(offset)),
+        )
+        return [dict(r) for r in cur.fetchall()]
+
+
+def rows_for_game(game_id: Optional[int]) -> List[Dict[str, Any]]:
+    """Every row of one game, oldest first (used by core/archive.py)."""
+    flush()
+    with closing(_connect()) as conn:
+        conn.row_factory = sqlite3.Row
+        cur = conn.execute("SELECT * FROM status_audit WHERE game_id IS ? ORDER BY id", (game_id,))
+        return [dict(r) for r in cur.fetchall()]
+
+
+def count(game, *, uid: Optional[str] = None, status: Optional[str] = None) -> int:
+    flush()
+    where, args = _where(getattr(game, "game_id", None), uid, status)
+    with closing(_connect()) as conn:
+        return int(conn.execute(f"SELECT COUNT(*) FROM status_audit WHERE {where}", args).fetchone()[0])
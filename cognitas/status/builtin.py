@@ -1,13 +1,11 @@
 from __future__ import annotations
 from . import Status, register
-from .engine import pick_random_alive
-
-# Helper to avoid circular imports if _kill_player logic is needed locally
-async def _kill_player(game, uid: str, reason: str):
-    p = game.players.get(uid)
-    if p:
-        p["alive"] = False
-        p["death_reason"] = reason
+from .engine import pick_random_alive, queue_death
+
+# Deaths are queued and resolved in one batch by core.players.process_deaths
+def _kill_player(game, uid: str, reason: str):
+    if uid in game.players:
+        queue_death(game, uid, reason)
 
 # ---------- Paralyzed (Parálisis) ----------
 @register("Paralyzed")
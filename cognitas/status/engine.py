@@ -1,18 +1,83 @@
 from __future__ import annotations
 import random
 from typing import Optional, Dict, List, Tuple
-from . import get_state_cls
+from . import get_state_cls, Status
 from . import get_block_message as _get_block_message
+from . import audit
+from ..core import events
 
 # game.status_map structure:
 # { uid: { state_name: {"remaining": int, "stacks": int, "source": str|"system"|"GM",
 #                       "meta": {...}, "visibility": "public|private|hidden"} } }
+# History lives in status/audit.py (not in the state snapshot).
 
 def _ensure_maps(game):
     if not hasattr(game, "status_map") or not isinstance(game.status_map, dict):
         game.status_map = {}
-    if not hasattr(game, "status_log") or not isinstance(game.status_log, list):
-        game.status_log = []
+
+# ---- Due index ----
+# tick() only visits entries that change on that phase: the ones that
+# decrement on it or override on_tick. Counters with remaining >= PERMANENT
+# and no on_tick (persona3 ammo/roses...) are never visited.
+# The index is rebuilt whenever game.status_map is replaced (load, reset).
+
+PERMANENT = 999
+PHASES = ("day", "night")
+
+def _tick_phases(state: Optional[Status], entry: dict) -> Tuple[str, ...]:
+    """Phases on which tick() must look at this entry."""
+    if state is None:
+        return PHASES  # unknown status: plain decrement every tick, as before
+    if type(state).on_tick is not Status.on_tick:
+        return PHASES
+    if int(entry.get("remaining", 0)) >= PERMANENT:
+        return ()
+    policy = getattr(state, "decrement_on", "always")
+    return (policy,) if policy in PHASES else PHASES
+
+class _DueIndex:
+    __slots__ = ("source", "buckets")
+
+    def __init__(self, status_map: dict):
+        self.source = status_map
+        # phase -> ordered set of (uid, key)
+        self.buckets: Dict[str, Dict[Tuple[str, str], None]] = {ph: {} for ph in PHASES}
+        for uid, effects in status_map.items():
+            for key, entry in effects.items():
+                self.place(uid, key, entry)
+
+    def place(self, uid: str, key: str, entry: dict) -> None:
+        st_cls = get_state_cls(key)
+        wanted = _tick_phases(st_cls() if st_cls else None, entry)
+        for ph in PHASES:
+            if ph in wanted:
+                self.buckets[ph][(uid, key)] = None
+            else:
+                self.buckets[ph].pop((uid, key), None)
+
+    def remove(self, uid: str, key: str) -> None:
+        for b in self.buckets.values():
+            b.pop((uid, key), None)
+
+def _due(game) -> _DueIndex:
+    _ensure_maps(game)
+    idx = getattr(game, "_status_due", None)
+    if idx is None or idx.source is not game.status_map:
+        idx = _DueIndex(game.status_map)
+        game._status_due = idx
+    return idx
+
+def queue_death(game, uid: str, reason: str) -> None:
+    """Statuses never kill directly: they queue, and the caller runs the death pipeline once."""
+    pending = getattr(game, "pending_deaths", None)
+    if not isinstance(pending, list):
+        pending = game.pending_deaths = []
+    pending.append((str(uid), reason))
+
+def drain_deaths(game) -> List[Tuple[str, str]]:
+    pending = list(getattr(game, "pending_deaths", None) or [])
+    game.pending_deaths = []
+    return pending
 
 def list_active(game, uid: str) -> Dict[str, dict]:
     _ensure_maps(game)
@@ -62,7 +127,12 @@ def apply(game, uid: str, name: str, *, source: Optional[str] = "GM",
         }
 
     banner = state.on_apply(game, uid, per_user[key]) or None
-    _audit(game, f"APPLY {state.name} to {uid} (dur={per_user[key]['remaining']}, stacks={per_user[key]['stacks']})")
+    _audit(game, "APPLY", uid, key, per_user[key])
+    entry = per_user.get(key) or {}
+    if key in per_user:
+        _due(game).place(uid, key, entry)
+    events.publish(events.StatusApplied(uid, key, int(entry.get("stacks", 1)),
+                                        int(entry.get("remaining", 0)), entry.get("source")))
     return True, banner
 
 def heal(game, uid: str, name: Optional[str] = None, *, all_: bool = False) -> List[str]:
@@ -91,7 +161,9 @@ def heal(game, uid: str, name: Optional[str] = None, *, all_: bool = False) -> L
             if b:
                 banners.append(b)
         del game.status_map[uid][key]
-        _audit(game, f"HEAL {key} from {uid}")
+        _due(game).remove(uid, key)
+        _audit(game, "HEAL", uid, key, entry)
+        events.publish(events.StatusExpired(uid, key, healed=True))
     if not game.status_map[uid]:
         del game.status_map[uid]
     return banners
@@ -100,39 +172,46 @@ def tick(game, phase: str) -> List[Tuple[str, str]]:
     """
     Decrement remaining and resolve per-phase. Returns list of (uid, banner_text) to announce.
     Phase values: "day" or "night".
+    Only entries in the due index for this phase are visited (see _DueIndex).
     """
-    _ensure_maps(game)
+    idx = _due(game)
     banners: List[Tuple[str, str]] = []
     # collect expirations & on_tick banners
     expirations: List[Tuple[str, str]] = []
-    for uid, effects in list(game.status_map.items()):
-        for key, entry in list(effects.items()):
-            st_cls = get_state_cls(key)
-            state = st_cls() if st_cls else None
-            # Resolution timing: fire on_tick first
-            if state:
-                tb = state.on_tick(game, uid, entry, phase)
-                if tb:
-                    banners.append((uid, tb))
-            # decrement
-            should_decay = True
-            if state:
-                policy = getattr(state, "decrement_on", "always")
-                if policy in ("day", "night") and policy != phase:
-                    should_decay = False
-            
-            if should_decay:
-                entry["remaining"] = max(0, int(entry.get("remaining", 0)) - 1)
-
-            if entry["remaining"] == 0:
-                # expire
-                eb = state.on_expire(game, uid, entry) if state else None
-                if eb:
-                    expirations.append((uid, eb))
-                del effects[key]
-                _audit(game, f"EXPIRE {key} on {uid}")
-        if not effects:
-            del game.status_map[uid]
+    for uid, key in list(idx.buckets.get(phase, {})):
+        effects = game.status_map.get(uid) or {}
+        entry = effects.get(key)
+        if entry is None:
+            idx.remove(uid, key)  # stale (removed outside the engine)
+            continue
+        st_cls = get_state_cls(key)
+        state = st_cls() if st_cls else None
+        # Resolution timing: fire on_tick first
+        if state:
+            tb = state.on_tick(game, uid, entry, phase)
+            if tb:
+                banners.append((uid, tb))
+        # decrement
+        should_decay = True
+        if state:
+            policy = getattr(state, "decrement_on", "always")
+            if policy in PHASES and policy != phase:
+                should_decay = False
+
+        if should_decay:
+            entry["remaining"] = max(0, int(entry.get("remaining", 0)) - 1)
+
+        if entry["remaining"] == 0:
+            # expire
+            eb = state.on_expire(game, uid, entry) if state else None
+            if eb:
+                expirations.append((uid, eb))
+            del effects[key]
+            idx.remove(uid, key)
+            _audit(game, "EXPIRE", uid, key, entry)
+            events.publish(events.StatusExpired(uid, key))
+            if not effects:
+                game.status_map.pop(uid, None)
     banners.extend(expirations)
     return banners
 
@@ -236,16 +315,18 @@ def compute_vote_weight(game, uid: str, base: float = 1.0) -> float:
         w = 4.0
     return float(w)
 
-def _audit(game, text: str):
-    log = getattr(game, "status_log", None)
-    if isinstance(log, list):
-        log.append(text)
-        if len(log) > 200:
-            del log[:len(log)-200]
+def _audit(game, kind: str, uid: str, key: str, entry: Optional[dict] = None):
+    try:
+        audit.record(game, kind, uid, key, entry)
+    except Exception:
+        pass
 
 # utility for Confusion
 def pick_random_alive(game, *, exclude: Optional[str] = None) -> Optional[str]:
-    players = [uid for uid, info in getattr(game, "players", {}).items()
+    table = getattr(game, "players", {})
+    if hasattr(table, "random_alive"):
+        return table.random_alive(exclude=exclude)  # PlayerTable: O(1)
+    players = [uid for uid, info in table.items()
                if info.get("alive", True)]
     if exclude and exclude in players:
         players.remove(exclude)